@@ -1,14 +1,71 @@
-from sqlalchemy import create_engine
+import os
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-# SQLite DB 파일 경로
-SQLALCHEMY_DATABASE_URL = "sqlite:///./bigmama.db"
+load_dotenv()
+
+# DB 접속 주소 (.env 또는 환경 변수 DATABASE_URL, 기본값은 SQLite 파일)
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./bigmama.db")
+
+# SQLite 연결마다 적용할 PRAGMA
+# - WAL: 읽기와 쓰기가 서로 막지 않음 (출석 체크가 몰릴 때 조회가 멈추지 않음)
+# - synchronous=NORMAL: WAL에서는 안전하면서 커밋마다 fsync 하지 않음
+# - busy_timeout: 다른 연결이 쓰는 중이면 바로 "database is locked" 내지 않고 기다림
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "cache_size": os.getenv("SQLITE_CACHE_SIZE", "-20000"),  # 음수는 KiB 단위 (약 20MB)
+    "mmap_size": os.getenv("SQLITE_MMAP_SIZE", str(128 * 1024 * 1024)),
+    "temp_store": os.getenv("SQLITE_TEMP_STORE", "MEMORY"),
+    "busy_timeout": os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"),
+}
+
+# 연결 풀 크기
+# uvicorn 워커 프로세스마다 풀이 따로 생기고, 동기 엔드포인트는 워커당 최대 40개 스레드에서 실행되므로
+# 기본값(10 + 30)으로 스레드 수만큼 연결을 쓸 수 있게 함
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "30"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+
+def create_db_engine(url: str, pragmas=SQLITE_PRAGMAS):
+    """DB 엔진 생성 (SQLite면 PRAGMA와 연결 풀 설정 적용)"""
+    if not url.startswith("sqlite"):
+        return create_engine(
+            url,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_pre_ping=True
+        )
+
+    in_memory = url in ("sqlite://", "sqlite:///:memory:")
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},  # SQLite 필수 옵션
+        # 메모리 DB는 연결 하나를 공유해야 하므로 풀 설정을 적용하지 않음
+        **({} if in_memory else {
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_timeout": DB_POOL_TIMEOUT,
+        })
+    )
+
+    if pragmas:
+        @event.listens_for(engine, "connect")
+        def set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                if value != "":
+                    cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+    return engine
+
 
 # DB 엔진 생성
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}  # SQLite 필수 옵션
-)
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
 
 # 세션 생성기
 SessionLocal = sessionmaker(
@@ -1,15 +1,90 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+import time
+
+from fastapi import Depends, FastAPI
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
+from contextlib import asynccontextmanager
+
+from backend.database import engine
+from backend.migrations import ensure_schema
+from backend.routers import attendance, attendance_stats, student_schedules, students
+from backend.routers import daily_logs, daily_tasks, auth, consultations, exports, report_jobs, system, metrics, sms
+from backend.utils.attendance_live import attendance_live
+from backend.utils.auth import require_auth
+from backend.utils.log import setup_logging
+from backend.utils.metrics import MetricsMiddleware, instrument_engine
+from backend.utils.providers import providers
+from backend.utils.report_image import REPORT_RENDER_BACKEND
+from backend.utils.report_jobs import report_jobs as report_job_queue
+from backend.utils.report_renderer import renderer
+from backend.utils.session_store import session_store
+from backend.utils.sms_outbox import sms_outbox
+
+setup_logging()
+logger = logging.getLogger(__name__)
+
+
+async def warm_up():
+    """
+    서버가 요청을 받기 시작한 뒤 백그라운드에서 무거운 라이브러리를 미리 로딩
+    (Jinja 템플릿, Pillow, 문자 업체 클라이언트, Chromium) - 실패해도 처음 쓸 때 다시 시도
+    """
+    started = time.perf_counter()
+    await providers.warm_up()
+
+    # 리포트 이미지용 Chromium을 미리 띄워둠
+    if REPORT_RENDER_BACKEND == "chromium":
+        try:
+            await renderer.start()
+        except Exception as e:
+            logger.warning("리포트 렌더러 시작 실패: %s", e)
+
+    providers.warm_up_ms = round((time.perf_counter() - started) * 1000, 1)
+    logger.info("warm-up 완료 (%.0fms)", providers.warm_up_ms)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # DB 스키마 버전 확인 (최신이 아닐 때만 마이그레이션 실행)
+    ensure_schema(engine)
+
+    warm_up_task = asyncio.create_task(warm_up())
 
-from backend.database import Base, engine
-from backend import models
-from backend.routers import attendance, student_schedules, students
-from backend.routers import daily_logs, daily_tasks, auth, consultations
+    # 리포트 렌더링 작업 워커 (재시작 전에 남아있던 작업도 이어서 처리)
+    await report_job_queue.start()
 
-app = FastAPI()
+    # 실시간 출석 현황 (예정 시간이 지난 학생 알림 포함)
+    await attendance_live.start()
+
+    # 문자 발송 대기열 (업체 설정이 잘못돼도 서버는 뜨고, 문자는 queued로 남음)
+    try:
+        await sms_outbox.start()
+    except Exception as e:
+        logger.error("문자 발송 대기열 시작 실패: %s", e)
+
+    # 만료된 로그인 세션 정리
+    await session_store.start()
+
+    yield
+
+    await session_store.stop()
+    warm_up_task.cancel()
+    await asyncio.gather(warm_up_task, return_exceptions=True)
+    await sms_outbox.stop()
+    await attendance_live.stop()
+    await report_job_queue.stop()
+    await renderer.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+
+# 요청 시간 / SQL 수 측정 (Server-Timing 헤더, /api/_metrics)
+instrument_engine(engine)
+app.add_middleware(MetricsMiddleware)
 
 # CORS 설정
 app.add_middleware(
@@ -20,17 +95,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
-
 # API 라우터 등록 (모든 API는 /api prefix로 등록)
+# 로그인(/api/auth)을 뺀 나머지 API는 로그인 토큰 필요
 app.include_router(auth.router, prefix="/api")
-app.include_router(attendance.router, prefix="/api")
-app.include_router(students.router, prefix="/api")
-app.include_router(daily_logs.router, prefix="/api")
-app.include_router(daily_tasks.router, prefix="/api")
-app.include_router(student_schedules.router, prefix="/api")
-app.include_router(consultations.router, prefix="/api")
+
+authenticated = [Depends(require_auth)]
+app.include_router(attendance.router, prefix="/api", dependencies=authenticated)
+app.include_router(attendance_stats.router, prefix="/api", dependencies=authenticated)
+app.include_router(students.router, prefix="/api", dependencies=authenticated)
+app.include_router(daily_logs.router, prefix="/api", dependencies=authenticated)
+app.include_router(daily_tasks.router, prefix="/api", dependencies=authenticated)
+app.include_router(student_schedules.router, prefix="/api", dependencies=authenticated)
+app.include_router(consultations.router, prefix="/api", dependencies=authenticated)
+app.include_router(exports.router, prefix="/api", dependencies=authenticated)
+app.include_router(report_jobs.router, prefix="/api", dependencies=authenticated)
+app.include_router(sms.router, prefix="/api", dependencies=authenticated)
+app.include_router(system.router, prefix="/api", dependencies=authenticated)
+app.include_router(metrics.router, prefix="/api", dependencies=authenticated)
 
 # 정적 파일 서빙 (이미지 등)
 app.mount("/static", StaticFiles(directory="backend/static"), name="static")
@@ -0,0 +1,168 @@
+"""
+버전 기반 스키마 마이그레이션
+
+- 적용된 버전은 schema_migrations 테이블에 기록
+- MIGRATIONS 순서대로 아직 적용되지 않은 것만 실행 (각각 하나의 BEGIN IMMEDIATE 트랜잭션,
+  잠금을 잡은 뒤 버전을 다시 확인하므로 여러 워커가 동시에 시작해도 한 번씩만 적용)
+- 빈 DB는 현재 모델로 테이블을 만들고 최신 버전으로 기록
+- 서버 시작 시에는 ensure_schema()로 버전만 확인 (최신이면 DDL을 실행하지 않음)
+
+마이그레이션 모듈은 upgrade(conn) 함수를 가지며, 이전 ad-hoc 스크립트로 이미 일부 변경된 DB에서도
+안전하도록 "이미 있으면 건너뛰기" 방식으로 작성합니다.
+테이블/인덱스는 backend.models가 아니라 그 버전의 정의를 마이그레이션 안에 고정해서 씁니다
+(모델이 바뀌어도 예전 마이그레이션의 결과가 달라지지 않도록, 바뀐 부분은 새 마이그레이션으로).
+
+실행 (프로젝트 루트에서):
+    python -m backend.migrations           # 최신 버전까지 업그레이드
+    python -m backend.migrations status    # 현재 버전 확인
+"""
+import logging
+import os
+from datetime import datetime
+
+from sqlalchemy import inspect, text
+
+from backend.database import Base
+from backend.migrations import (
+    m001_consultation_student_columns,
+    m002_consultation_nullable_student_id,
+    m003_report_jobs,
+    m004_indexes,
+    m005_sms_outbox,
+    m006_auth_sessions,
+    m007_consultation_indexes,
+    m008_consultation_duration,
+    m009_attendance_monthly,
+    m010_report_job_retry,
+)
+
+# (버전, 모듈) - 새 마이그레이션은 항상 맨 뒤에 추가
+MIGRATIONS = [
+    (1, m001_consultation_student_columns),
+    (2, m002_consultation_nullable_student_id),
+    (3, m003_report_jobs),
+    (4, m004_indexes),
+    (5, m005_sms_outbox),
+    (6, m006_auth_sessions),
+    (7, m007_consultation_indexes),
+    (8, m008_consultation_duration),
+    (9, m009_attendance_monthly),
+    (10, m010_report_job_retry),
+]
+HEAD = MIGRATIONS[-1][0]
+
+# 서버 시작 시 DB 버전이 낮으면 자동으로 업그레이드할지 여부
+AUTO_MIGRATE = os.getenv("AUTO_MIGRATE", "1") == "1"
+
+VERSION_TABLE = "schema_migrations"
+
+logger = logging.getLogger(__name__)
+
+
+def current_version(conn) -> int:
+    if not inspect(conn).has_table(VERSION_TABLE):
+        return 0
+    return conn.execute(text(f"SELECT COALESCE(MAX(version), 0) FROM {VERSION_TABLE}")).scalar()
+
+
+def _ensure_version_table(conn):
+    conn.exec_driver_sql(
+        f"CREATE TABLE IF NOT EXISTS {VERSION_TABLE} ("
+        "version INTEGER PRIMARY KEY, name VARCHAR NOT NULL, applied_at DATETIME NOT NULL)"
+    )
+
+
+def _is_applied(conn, version: int) -> bool:
+    return conn.execute(
+        text(f"SELECT 1 FROM {VERSION_TABLE} WHERE version = :v"), {"v": version}
+    ).first() is not None
+
+
+def _record(conn, version: int, name: str):
+    conn.execute(
+        text(f"INSERT INTO {VERSION_TABLE} (version, name, applied_at) VALUES (:v, :n, :t)"),
+        {"v": version, "n": name, "t": datetime.now()}
+    )
+
+
+def _run_in_transaction(engine, fn):
+    """
+    DDL까지 포함해서 하나의 트랜잭션으로 실행
+    (pysqlite는 DDL 앞에서 BEGIN을 자동으로 걸지 않으므로 직접 BEGIN IMMEDIATE)
+    """
+    with engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            result = fn(conn)
+            conn.exec_driver_sql("COMMIT")
+            return result
+        except Exception:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+
+
+def _module_name(module) -> str:
+    return module.__name__.rsplit(".", 1)[-1]
+
+
+def upgrade(engine, target: int = HEAD):
+    """target 버전까지 순서대로 적용, 적용한 버전 목록 반환"""
+    from backend import models  # noqa: F401  (모델을 Base.metadata에 등록)
+
+    applied = []
+
+    def bootstrap(conn):
+        _ensure_version_table(conn)
+        version = current_version(conn)
+
+        # 빈 DB: 현재 모델로 한 번에 생성하고 최신 버전으로 기록
+        user_tables = set(inspect(conn).get_table_names()) - {VERSION_TABLE}
+        if version == 0 and not user_tables:
+            Base.metadata.create_all(bind=conn)
+            for v, module in MIGRATIONS:
+                _record(conn, v, _module_name(module))
+                applied.append(v)
+        return version
+
+    version = _run_in_transaction(engine, bootstrap)
+    if applied:
+        return applied
+
+    for v, module in MIGRATIONS:
+        if v <= version or v > target:
+            continue
+
+        def step(conn, v=v, module=module):
+            # 잠금을 잡은 뒤 다시 확인 (동시에 시작한 다른 프로세스가 먼저 적용했을 수 있음)
+            if _is_applied(conn, v):
+                return False
+            logger.info("마이그레이션 %s (%s) 적용 중...", v, _module_name(module))
+            module.upgrade(conn)
+            _record(conn, v, _module_name(module))
+            return True
+
+        if _run_in_transaction(engine, step):
+            applied.append(v)
+
+    return applied
+
+
+def ensure_schema(engine):
+    """서버 시작 시 호출: 버전만 확인하고, 낮을 때만 업그레이드"""
+    with engine.connect() as conn:
+        version = current_version(conn)
+
+    if version == HEAD:
+        return
+
+    if version > HEAD:
+        raise RuntimeError(f"DB 스키마 버전({version})이 코드({HEAD})보다 높습니다. 최신 코드로 업데이트하세요.")
+
+    if not AUTO_MIGRATE:
+        raise RuntimeError(
+            f"DB 스키마 버전({version})이 최신({HEAD})이 아닙니다. "
+            "python -m backend.migrations 를 실행하세요."
+        )
+
+    upgrade(engine)
@@ -0,0 +1,28 @@
+import sys
+
+from backend.database import engine
+from backend.migrations import HEAD, current_version, upgrade
+from backend.utils.log import setup_logging
+
+
+def main(argv):
+    setup_logging()
+    command = argv[0] if argv else "upgrade"
+
+    if command == "status":
+        with engine.connect() as conn:
+            version = current_version(conn)
+        print(f"현재 스키마 버전: {version} / 최신: {HEAD}")
+        return 0
+
+    if command == "upgrade":
+        applied = upgrade(engine)
+        print(f"마이그레이션 완료! (적용: {applied or '없음'}, 현재 버전: {HEAD})")
+        return 0
+
+    print("사용법: python -m backend.migrations [upgrade|status]")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
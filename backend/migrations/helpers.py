@@ -0,0 +1,67 @@
+"""마이그레이션에서 공통으로 쓰는 SQLite 스키마 변경 함수"""
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateTable
+
+
+def column_names(conn, table_name: str):
+    return {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table_name})")}
+
+
+def has_table(conn, table_name: str) -> bool:
+    return inspect(conn).has_table(table_name)
+
+
+def create_table_if_missing(conn, table):
+    """마이그레이션에 고정해 둔 Table을 (인덱스 포함) 없을 때만 생성"""
+    table.create(bind=conn, checkfirst=True)
+
+
+def create_missing_indexes(conn, indexes):
+    """
+    indexes: [(인덱스 이름, 테이블 이름, [컬럼...])]
+    테이블이 있고 같은 이름의 인덱스가 없는 것만 생성, 생성한 개수 반환
+    """
+    created = 0
+    for name, table_name, columns in indexes:
+        if not has_table(conn, table_name):
+            continue
+        existing = {ix["name"] for ix in inspect(conn).get_indexes(table_name)}
+        if name not in existing:
+            conn.exec_driver_sql(f"CREATE INDEX {name} ON {table_name} ({', '.join(columns)})")
+            created += 1
+
+    if created:
+        conn.execute(text("ANALYZE"))
+    return created
+
+
+def rebuild_table(conn, table, column_exprs=None):
+    """
+    SQLite는 ALTER COLUMN이 안 되므로 새 테이블을 만들어 복사한 뒤 교체 (copy-and-swap)
+    호출하는 쪽의 트랜잭션 안에서 실행되므로 중간에 실패하면 원래 테이블이 그대로 남음
+
+    table: 목표 스키마 (마이그레이션에 고정해 둔 Table, models의 Table을 쓰면 나중 버전의 컬럼까지 생김)
+    column_exprs: {컬럼명: 복사할 때 쓸 SQL 식} (예: NOT NULL로 바뀌는 컬럼에 COALESCE)
+    """
+    column_exprs = column_exprs or {}
+    tmp_name = f"_{table.name}_new"
+    old_columns = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table.name})")}
+
+    # 목표 스키마의 CREATE TABLE 문에서 테이블 이름만 임시 이름으로 바꿔 생성
+    ddl = str(CreateTable(table).compile(dialect=conn.dialect)).strip()
+    prefix = f"CREATE TABLE {table.name} "
+    assert ddl.startswith(prefix), ddl
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {tmp_name}")
+    conn.exec_driver_sql(f"CREATE TABLE {tmp_name} " + ddl[len(prefix):])
+
+    columns = [c.name for c in table.columns if c.name in old_columns or c.name in column_exprs]
+    select_list = ", ".join(column_exprs.get(name, name) for name in columns)
+    conn.exec_driver_sql(
+        f"INSERT INTO {tmp_name} ({', '.join(columns)}) SELECT {select_list} FROM {table.name}"
+    )
+
+    conn.exec_driver_sql(f"DROP TABLE {table.name}")
+    conn.exec_driver_sql(f"ALTER TABLE {tmp_name} RENAME TO {table.name}")
+
+    for index in table.indexes:
+        index.create(bind=conn, checkfirst=True)
@@ -0,0 +1,34 @@
+"""
+상담 테이블에 student_name, student_grade 컬럼 추가
+(이전 backend/migrate_consultation.py 스크립트와 동일, 이미 실행한 DB는 건너뜀)
+"""
+from backend.migrations.helpers import column_names, has_table
+
+
+def upgrade(conn):
+    if not has_table(conn, "consultations"):
+        return
+
+    columns = column_names(conn, "consultations")
+
+    if "student_name" not in columns:
+        conn.exec_driver_sql("ALTER TABLE consultations ADD COLUMN student_name VARCHAR")
+        # 기존 데이터가 있으면 student_id로부터 학생 정보 복사
+        conn.exec_driver_sql("""
+            UPDATE consultations
+            SET student_name = (
+                SELECT name FROM students WHERE students.id = consultations.student_id
+            )
+            WHERE student_id IS NOT NULL
+        """)
+
+    if "student_grade" not in columns:
+        conn.exec_driver_sql("ALTER TABLE consultations ADD COLUMN student_grade VARCHAR")
+        # 기존 데이터가 있으면 student_id로부터 학년 정보 복사
+        conn.exec_driver_sql("""
+            UPDATE consultations
+            SET student_grade = (
+                SELECT grade FROM students WHERE students.id = consultations.student_id
+            )
+            WHERE student_id IS NOT NULL
+        """)
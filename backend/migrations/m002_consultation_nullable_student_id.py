@@ -0,0 +1,50 @@
+"""
+상담 테이블 student_id를 nullable로 변경 (등록되지 않은 학생도 상담 예약 가능)
+SQLite는 ALTER COLUMN을 지원하지 않으므로 테이블을 새로 만들어 복사 후 교체
+(이전 migrate_consultation.py에서 데이터 손실 위험 때문에 건너뛰었던 부분)
+"""
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, MetaData, String, Table, Text, Time, func
+
+from backend.migrations.helpers import has_table, rebuild_table
+
+# 이 버전의 consultations 스키마 (이후 마이그레이션에서 바뀌는 컬럼/인덱스는 넣지 않음)
+metadata = MetaData()
+Table("students", metadata, Column("id", Integer, primary_key=True))
+consultations = Table(
+    "consultations", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("student_id", Integer, ForeignKey("students.id"), nullable=True),
+    Column("student_name", String, nullable=False),
+    Column("student_grade", String, nullable=False),
+    Column("date", Date, nullable=False),
+    Column("time", Time, nullable=False),
+    Column("parent_name", String, nullable=True),
+    Column("content", Text, nullable=True),
+    Column("notes", Text, nullable=True),
+    Column("status", String),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+    Index("ix_consultations_id", "id"),
+)
+
+
+def _is_not_null(conn, table_name: str, column: str) -> bool:
+    for row in conn.exec_driver_sql(f"PRAGMA table_info({table_name})"):
+        if row[1] == column:
+            return bool(row[3])
+    return False
+
+
+def upgrade(conn):
+    if not has_table(conn, "consultations"):
+        return
+
+    if not _is_not_null(conn, "consultations", "student_id"):
+        return  # 이미 nullable
+
+    rebuild_table(conn, consultations, column_exprs={
+        # 새 테이블에서 NOT NULL인 컬럼은 빈 값이 있어도 복사되도록
+        "student_name": "COALESCE(student_name, '')",
+        "student_grade": "COALESCE(student_grade, '')",
+        "status": "COALESCE(status, 'scheduled')",
+    })
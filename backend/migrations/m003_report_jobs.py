@@ -0,0 +1,24 @@
+"""리포트 이미지 작업 큐 테이블 (report_jobs) 추가"""
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, MetaData, String, Table, Text, func
+
+from backend.migrations.helpers import create_table_if_missing
+
+# 이 버전의 report_jobs 스키마
+metadata = MetaData()
+Table("daily_logs", metadata, Column("id", Integer, primary_key=True))
+report_jobs = Table(
+    "report_jobs", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("daily_log_id", Integer, ForeignKey("daily_logs.id"), nullable=False, index=True),
+    Column("status", String, nullable=False),
+    Column("image_url", String, nullable=True),
+    Column("error", Text, nullable=True),
+    Column("attempts", Integer, nullable=False),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("started_at", DateTime(timezone=True), nullable=True),
+    Column("finished_at", DateTime(timezone=True), nullable=True),
+)
+
+
+def upgrade(conn):
+    create_table_if_missing(conn, report_jobs)
@@ -0,0 +1,20 @@
+"""
+자주 쓰는 조회 조건에 맞춘 인덱스 추가
+(attendance.date, student_schedules.weekday, daily_logs(student_id, date), daily_logs.date,
+daily_tasks.daily_log_id, consultations(date, time), report_jobs.daily_log_id)
+"""
+from backend.migrations.helpers import create_missing_indexes
+
+INDEXES = [
+    ("ix_attendance_date", "attendance", ["date"]),
+    ("ix_student_schedules_weekday", "student_schedules", ["weekday"]),
+    ("ix_daily_logs_student_date", "daily_logs", ["student_id", "date"]),
+    ("ix_daily_logs_date", "daily_logs", ["date"]),
+    ("ix_daily_tasks_daily_log_id", "daily_tasks", ["daily_log_id"]),
+    ("ix_consultations_date_time", "consultations", ["date", "time"]),
+    ("ix_report_jobs_daily_log_id", "report_jobs", ["daily_log_id"]),
+]
+
+
+def upgrade(conn):
+    create_missing_indexes(conn, INDEXES)
@@ -0,0 +1,31 @@
+"""문자 발송 대기열 테이블 (sms_outbox) 추가"""
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, MetaData, String, Table, Text, func
+
+from backend.migrations.helpers import create_table_if_missing
+
+# 이 버전의 sms_outbox 스키마
+metadata = MetaData()
+Table("students", metadata, Column("id", Integer, primary_key=True))
+sms_outbox = Table(
+    "sms_outbox", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("idempotency_key", String, nullable=False, unique=True),
+    Column("kind", String, nullable=False),
+    Column("student_id", Integer, ForeignKey("students.id"), nullable=True),
+    Column("send_date", Date, nullable=False, index=True),
+    Column("phone", String, nullable=False),
+    Column("body", Text, nullable=False),
+    Column("status", String, nullable=False),
+    Column("attempts", Integer, nullable=False),
+    Column("next_attempt_at", DateTime, nullable=False),
+    Column("provider", String, nullable=True),
+    Column("provider_message_id", String, nullable=True),
+    Column("error", Text, nullable=True),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("sent_at", DateTime(timezone=True), nullable=True),
+    Index("ix_sms_outbox_status_next", "status", "next_attempt_at"),
+)
+
+
+def upgrade(conn):
+    create_table_if_missing(conn, sms_outbox)
@@ -0,0 +1,20 @@
+"""로그인 세션 테이블 (auth_sessions) 추가"""
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func
+
+from backend.migrations.helpers import create_table_if_missing
+
+# 이 버전의 auth_sessions 스키마
+metadata = MetaData()
+auth_sessions = Table(
+    "auth_sessions", metadata,
+    Column("token_hash", String, primary_key=True),
+    Column("teacher_id", Integer, nullable=False),
+    Column("teacher_name", String, nullable=False),
+    Column("username", String, nullable=False),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("expires_at", DateTime, nullable=False, index=True),
+)
+
+
+def upgrade(conn):
+    create_table_if_missing(conn, auth_sessions)
@@ -0,0 +1,11 @@
+"""상담 목록 필터용 인덱스 추가 (consultations(status, date, time), consultations(student_id, date, time))"""
+from backend.migrations.helpers import create_missing_indexes
+
+INDEXES = [
+    ("ix_consultations_status_date_time", "consultations", ["status", "date", "time"]),
+    ("ix_consultations_student_date_time", "consultations", ["student_id", "date", "time"]),
+]
+
+
+def upgrade(conn):
+    create_missing_indexes(conn, INDEXES)
@@ -0,0 +1,12 @@
+"""상담 테이블에 duration_minutes(상담 길이, 분) 컬럼 추가 (기존 상담은 30분)"""
+from backend.migrations.helpers import column_names, has_table
+
+
+def upgrade(conn):
+    if not has_table(conn, "consultations"):
+        return
+
+    if "duration_minutes" not in column_names(conn, "consultations"):
+        conn.exec_driver_sql(
+            "ALTER TABLE consultations ADD COLUMN duration_minutes INTEGER NOT NULL DEFAULT 30"
+        )
@@ -0,0 +1,47 @@
+"""월간 출석 집계 테이블 (attendance_monthly) 추가, 기존 출석 기록으로 채움"""
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, MetaData, Table, func
+
+from backend.migrations.helpers import create_table_if_missing
+
+# 이 버전의 attendance_monthly 스키마
+metadata = MetaData()
+Table("students", metadata, Column("id", Integer, primary_key=True))
+attendance_monthly = Table(
+    "attendance_monthly", metadata,
+    Column("student_id", Integer, ForeignKey("students.id"), primary_key=True),
+    Column("month", Date, primary_key=True),
+    Column("present", Integer, nullable=False),
+    Column("late", Integer, nullable=False),
+    Column("absent", Integer, nullable=False),
+    Column("late_minutes", Integer, nullable=False),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now()),
+    Index("ix_attendance_monthly_month", "month"),
+)
+
+# 이 버전의 집계 기준으로 채움 (backend/utils/attendance_rollup.py의 _rollup_source와 같은 식)
+# 지각: present이고 check_in이 그 요일 예정 시간보다 늦은 경우 (분 단위, strftime('%w')는 일요일=0)
+_FILL = """
+    INSERT INTO attendance_monthly (student_id, month, present, late, absent, late_minutes)
+    SELECT student_id, month,
+           SUM(CASE WHEN status = 'present' THEN 1 ELSE 0 END),
+           SUM(CASE WHEN status = 'present' AND late_by > 0 THEN 1 ELSE 0 END),
+           SUM(CASE WHEN status = 'absent' THEN 1 ELSE 0 END),
+           SUM(CASE WHEN status = 'present' AND late_by > 0 THEN late_by ELSE 0 END)
+    FROM (
+        SELECT attendance.student_id, attendance.status, date(attendance.date, 'start of month') AS month,
+               (CAST(substr(attendance.check_in, 1, 2) AS INTEGER) * 60 + CAST(substr(attendance.check_in, 4, 2) AS INTEGER))
+               - (CAST(substr(student_schedules.expected_time, 1, 2) AS INTEGER) * 60
+                  + CAST(substr(student_schedules.expected_time, 4, 2) AS INTEGER)) AS late_by
+        FROM attendance
+        LEFT OUTER JOIN student_schedules
+            ON student_schedules.student_id = attendance.student_id
+           AND student_schedules.weekday = (CAST(strftime('%w', attendance.date) AS INTEGER) + 6) % 7
+    )
+    GROUP BY student_id, month
+"""
+
+
+def upgrade(conn):
+    create_table_if_missing(conn, attendance_monthly)
+    conn.exec_driver_sql("DELETE FROM attendance_monthly")
+    conn.exec_driver_sql(_FILL)
@@ -0,0 +1,10 @@
+"""리포트 작업 테이블에 next_attempt_at(실패 후 재시도 예정 시각) 컬럼 추가"""
+from backend.migrations.helpers import column_names, has_table
+
+
+def upgrade(conn):
+    if not has_table(conn, "report_jobs"):
+        return
+
+    if "next_attempt_at" not in column_names(conn, "report_jobs"):
+        conn.exec_driver_sql("ALTER TABLE report_jobs ADD COLUMN next_attempt_at DATETIME")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Time, DateTime, Boolean, ForeignKey, UniqueConstraint, Text
+from sqlalchemy import Column, Integer, String, Date, Time, DateTime, Boolean, ForeignKey, UniqueConstraint, Index, Text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from backend.database import Base
@@ -25,13 +25,14 @@ class Attendance(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
-    date = Column(Date, nullable=False)
+    date = Column(Date, nullable=False, index=True)  # 날짜별 출석 현황 조회
     status = Column(String, nullable=False)  # present / absent
     check_in = Column(Time, nullable=True)
     check_out = Column(Time, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (
+        # (student_id, date) 조회는 이 유니크 제약의 인덱스를 사용
         UniqueConstraint("student_id", "date", name="uix_student_date"),
     )
 
@@ -40,7 +41,7 @@ class DailyLog(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
-    date = Column(Date, nullable=False)
+    date = Column(Date, nullable=False, index=True)  # 날짜별 리포트 일괄 생성
     teacher_note = Column(Text, nullable=True)
     
     attendance_status = Column(Text, nullable=True)
@@ -66,6 +67,12 @@ class DailyLog(Base):
         cascade="all, delete-orphan"
     )
 
+    student = relationship("Student")
+
+    __table_args__ = (
+        Index("ix_daily_logs_student_date", "student_id", "date"),
+    )
+
     @property
     def is_completed(self):
         # 모든 task가 완료되었을 때만 True
@@ -76,7 +83,7 @@ class DailyTask(Base):
     __tablename__ = "daily_tasks"
 
     id = Column(Integer, primary_key=True, index=True)
-    daily_log_id = Column(Integer, ForeignKey("daily_logs.id"), nullable=False)
+    daily_log_id = Column(Integer, ForeignKey("daily_logs.id"), nullable=False, index=True)
 
     content = Column(String, nullable=False)
 
@@ -99,7 +106,7 @@ class StudentSchedule(Base):
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
 
-    weekday = Column(Integer, nullable=False)
+    weekday = Column(Integer, nullable=False, index=True)
     # 0=월, 1=화, 2=수, 3=목, 4=금, 5=토, 6=일
 
     expected_time = Column(Time, nullable=False)
@@ -140,6 +147,7 @@ class Consultation(Base):
     student_grade = Column(String, nullable=False)  # 학생 학년 (직접 입력)
     date = Column(Date, nullable=False)
     time = Column(Time, nullable=False)
+    duration_minutes = Column(Integer, nullable=False, default=30, server_default="30")  # 상담 길이 (분)
     parent_name = Column(String, nullable=True)  # 학부모 이름
     content = Column(Text, nullable=True)  # 상담 내용
     notes = Column(Text, nullable=True)  # 추가 메모
@@ -148,3 +156,82 @@ class Consultation(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     student = relationship("Student", backref="consultations")
+
+    __table_args__ = (
+        Index("ix_consultations_date_time", "date", "time"),
+        # 상태별/학생별 목록을 날짜순으로 (GET /consultations/page)
+        Index("ix_consultations_status_date_time", "status", "date", "time"),
+        Index("ix_consultations_student_date_time", "student_id", "date", "time"),
+    )
+
+
+class ReportJob(Base):
+    __tablename__ = "report_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    daily_log_id = Column(Integer, ForeignKey("daily_logs.id"), nullable=False, index=True)
+    status = Column(String, nullable=False, default="queued")  # queued, running, done, failed
+    image_url = Column(String, nullable=True)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=True)  # 실패 후 재시도 예정 시각 (서버 로컬 시간)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class SmsMessage(Base):
+    __tablename__ = "sms_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # 같은 학생에게 같은 날 같은 종류의 문자를 두 번 보내지 않기 위한 키 (예: absent:12:2025-03-04)
+    idempotency_key = Column(String, nullable=False, unique=True)
+    kind = Column(String, nullable=False)  # absent 등
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=True)
+    send_date = Column(Date, nullable=False, index=True)  # 어느 날짜에 대한 문자인지
+    phone = Column(String, nullable=False)  # 받는 번호
+    body = Column(Text, nullable=False)
+
+    status = Column(String, nullable=False, default="queued")  # queued, sending, sent, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False)  # 재시도 예정 시각 (서버 로컬 시간)
+    provider = Column(String, nullable=True)
+    provider_message_id = Column(String, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # 워커가 보낼 문자를 찾는 조회 (status = queued AND next_attempt_at <= now)
+        Index("ix_sms_outbox_status_next", "status", "next_attempt_at"),
+    )
+
+
+class AuthSession(Base):
+    __tablename__ = "auth_sessions"
+
+    # 토큰 원문이 아니라 SHA-256 해시를 저장 (DB 파일이 유출돼도 토큰으로 로그인할 수 없음)
+    token_hash = Column(String, primary_key=True)
+    teacher_id = Column(Integer, nullable=False)
+    teacher_name = Column(String, nullable=False)
+    username = Column(String, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime, nullable=False, index=True)  # 서버 로컬 시간
+
+
+class AttendanceMonthly(Base):
+    """학생별 월간 출석 집계 (attendance를 저장할 때 같은 트랜잭션에서 갱신, backend/utils/attendance_rollup.py)"""
+    __tablename__ = "attendance_monthly"
+
+    student_id = Column(Integer, ForeignKey("students.id"), primary_key=True)
+    month = Column(Date, primary_key=True)  # 그 달 1일
+    present = Column(Integer, nullable=False, default=0)  # 출석 (지각 포함)
+    late = Column(Integer, nullable=False, default=0)  # 예정 시간보다 늦게 등원
+    absent = Column(Integer, nullable=False, default=0)
+    late_minutes = Column(Integer, nullable=False, default=0)  # 지각한 날 예정 시간보다 늦은 분의 합
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # 월별 / 학년별 통계 (month 범위 조회)
+        Index("ix_attendance_monthly_month", "month"),
+    )
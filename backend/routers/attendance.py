@@ -1,13 +1,29 @@
+import logging
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from datetime import date, datetime, time
+from datetime import date, datetime
 
 from backend.database import get_db
-from backend.models import Attendance, Student, StudentSchedule
-from backend.schemas import AttendanceCreate, AttendanceResponse
+from backend.models import Attendance
+from backend.schemas import (
+    AttendanceBulkRequest,
+    AttendanceBulkResponse,
+    AttendanceCreate,
+    AttendanceMarkScheduledRequest,
+    AttendanceMarkScheduledResponse,
+    AttendanceResponse,
+)
+from backend.utils.attendance_board import build_today_board, find_absent_students
+from backend.utils.attendance_bulk import bulk_upsert_attendance, mark_scheduled_students
+from backend.utils.attendance_live import attendance_live
+from backend.utils.attendance_rollup import refresh_rollups
 
 router = APIRouter(prefix="/attendance", tags=["Attendance"])
 
+logger = logging.getLogger(__name__)
+
 
 # -------------------------
 # 학생별 출석 기록
@@ -29,38 +45,8 @@ def get_attendance_by_student(student_id: int, db: Session = Depends(get_db)):
 def get_today_absent_students(db: Session = Depends(get_db)):
     today = date.today()
     now = datetime.now().time()
-    weekday = today.weekday()
-
-    result = []
-
-    students = db.query(Student).all()
-
-    for student in students:
-        # 오늘 요일 스케줄
-        schedule = db.query(StudentSchedule).filter(
-            StudentSchedule.student_id == student.id,
-            StudentSchedule.weekday == weekday
-        ).first()
-
-        if not schedule:
-            continue  # 오늘 안 오는 학생
 
-        attendance = db.query(Attendance).filter(
-            Attendance.student_id == student.id,
-            Attendance.date == today
-        ).first()
-
-        if attendance and attendance.check_in:
-            continue  # 이미 출석
-
-        if now >= schedule.expected_time:
-            result.append({
-                "student_id": student.id,
-                "name": student.name,
-                "parent_phone": student.parent_phone
-            })
-
-    return result
+    return find_absent_students(db, today, now)
 
 
 # -------------------------
@@ -70,72 +56,23 @@ def get_today_absent_students(db: Session = Depends(get_db)):
 def get_today_attendance(db: Session = Depends(get_db)):
     today = date.today()
     now = datetime.now().time()
-    weekday = today.weekday()
-    
-    print(f"🔍 [조회 시작] 오늘 날짜: {today}, 요일: {weekday}")
-
-    students = db.query(Student).all()
-    result = []
-
-    present = late_or_absent = unchecked = 0
-
-    for student in students:
-        attendance = db.query(Attendance).filter(
-            Attendance.student_id == student.id,
-            Attendance.date == today
-        ).first()
-
-        schedule = db.query(StudentSchedule).filter(
-            StudentSchedule.student_id == student.id,
-            StudentSchedule.weekday == weekday
-        ).first()
-
-        # 디버깅: 조회된 출석 기록 확인
-        if attendance:
-            print(f"🟡 [조회] 학생 {student.name} (ID: {student.id}) - date: {attendance.date}, check_in: {attendance.check_in} (type: {type(attendance.check_in)}, is None: {attendance.check_in is None})")
-        else:
-            print(f"🟡 [조회] 학생 {student.name} (ID: {student.id}) - 출석 기록 없음")
-
-        # 출석 기록이 있고 check_in이 있으면 출석으로 간주 (예정 시간과 관계없이)
-        # check_in이 None이 아니면 출석으로 처리
-        if attendance and attendance.check_in is not None:
-            print(f"🟢 [상태 결정] {student.name} -> present (check_in 있음)")
-            status = "present"
-            present += 1
-
-        # 출석 기록이 있지만 check_in이 없는 경우 (status가 "absent"인 경우)
-        elif attendance and attendance.status == "absent":
-            status = "late_or_absent"
-            late_or_absent += 1
-
-        # 출석 기록이 없고, 예정 시간이 지났으면 지각/결석으로 간주
-        elif schedule and now >= schedule.expected_time:
-            status = "late_or_absent"
-            late_or_absent += 1
-
-        # 그 외의 경우는 미확인
-        else:
-            status = "unchecked"
-            unchecked += 1
-
-        result.append({
-            "student_id": student.id,
-            "name": student.name,
-            "expected_time": schedule.expected_time.strftime("%H:%M") if schedule and schedule.expected_time else None,
-            "check_in": attendance.check_in.strftime("%H:%M") if attendance and attendance.check_in else None,
-            "status": status
-        })
 
-    return {
-        "date": today,
-        "now": now,
-        "summary": {
-            "present": present,
-            "late_or_absent": late_or_absent,
-            "unchecked": unchecked
-        },
-        "students": result
-    }
+    logger.debug("출석 현황 조회: %s (요일 %s)", today, today.weekday())
+
+    return build_today_board(db, today, now)
+
+
+# -------------------------
+# 오늘 출석 현황 실시간 스트림 (SSE)
+# 연결하면 snapshot, 이후 출석 저장 / 예정 시간 경과 때마다 student 이벤트
+# -------------------------
+@router.get("/stream")
+async def stream_today_attendance():
+    return StreamingResponse(
+        attendance_live.events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 # -------------------------
@@ -146,11 +83,11 @@ def create_or_update_attendance(
     attendance: AttendanceCreate,
     db: Session = Depends(get_db)
 ):
-    # 디버깅: 받은 데이터 확인
-    print(f"🔵 [저장 시도] student_id: {attendance.student_id}, date: {attendance.date}")
-    print(f"🔵 [저장 시도] check_in: {attendance.check_in} (type: {type(attendance.check_in)})")
-    print(f"🔵 [저장 시도] status: {attendance.status}")
-    
+    logger.debug(
+        "출석 저장 시도: student_id=%s date=%s status=%s check_in=%r",
+        attendance.student_id, attendance.date, attendance.status, attendance.check_in
+    )
+
     record = db.query(Attendance).filter(
         Attendance.student_id == attendance.student_id,
         Attendance.date == attendance.date
@@ -158,22 +95,72 @@ def create_or_update_attendance(
 
     if record:
         # 기존 레코드 업데이트
-        print(f"🔵 [기존 레코드 업데이트] 업데이트 전 check_in: {record.check_in}")
+        logger.debug("기존 출석 기록 업데이트: id=%s 이전 check_in=%r", record.id, record.check_in)
         record.status = attendance.status
         record.check_in = attendance.check_in
         record.check_out = attendance.check_out
-        print(f"🔵 [기존 레코드 업데이트] 업데이트 후 check_in: {record.check_in}")
     else:
         # 새 레코드 생성
-        print(f"🔵 [새 레코드 생성] check_in: {attendance.check_in}")
         record = Attendance(**attendance.dict())
         db.add(record)
-        print(f"🔵 [새 레코드 생성] 생성 후 check_in: {record.check_in}")
 
+    # 월간 집계도 같은 트랜잭션에서 갱신 (집계 쿼리가 방금 바꾼 행을 읽도록 먼저 flush)
+    db.flush()
+    refresh_rollups(db, [(attendance.student_id, attendance.date)])
     db.commit()
     db.refresh(record)
-    
-    # 디버깅: 저장된 값 확인
-    print(f"🟢 [저장 완료] student_id: {record.student_id}, check_in: {record.check_in} (type: {type(record.check_in)}, is None: {record.check_in is None})")
-    
+
+    logger.debug(
+        "출석 저장 완료: id=%s student_id=%s check_in=%r",
+        record.id, record.student_id, record.check_in
+    )
+    attendance_live.publish_students(db, record.date, [record.student_id])
+
     return record
+
+
+# -------------------------
+# 출석 일괄 저장 (등원/하원 한꺼번에 체크)
+# -------------------------
+@router.post("/bulk", response_model=AttendanceBulkResponse)
+def bulk_save_attendance(
+    payload: AttendanceBulkRequest,
+    db: Session = Depends(get_db)
+):
+    items = bulk_upsert_attendance(db, payload.records)
+    saved = sum(1 for item in items if item["ok"])
+    attendance_live.publish_students(
+        db, date.today(), {item["student_id"] for item in items if item["ok"] and item["date"] == date.today()}
+    )
+
+    return {
+        "total": len(items),
+        "saved": saved,
+        "failed": len(items) - saved,
+        "items": items
+    }
+
+
+# -------------------------
+# 해당 요일 수업 학생 전체 출석/결석 처리
+# -------------------------
+@router.post("/mark-scheduled", response_model=AttendanceMarkScheduledResponse)
+def mark_scheduled_attendance(
+    payload: AttendanceMarkScheduledRequest,
+    db: Session = Depends(get_db)
+):
+    items = mark_scheduled_students(
+        db,
+        payload.date,
+        payload.status,
+        check_in=payload.check_in,
+        overwrite=payload.overwrite
+    )
+    attendance_live.publish_students(db, payload.date, [item["student_id"] for item in items])
+
+    return {
+        "date": payload.date,
+        "status": payload.status,
+        "saved": len(items),
+        "items": items
+    }
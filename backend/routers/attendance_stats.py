@@ -0,0 +1,152 @@
+"""
+출석 통계
+
+모두 학생별 월간 집계(attendance_monthly)만 읽습니다 (attendance 원본은 읽지 않음).
+집계는 출석을 저장할 때 갱신되며 backend/utils/attendance_rollup.py 로 다시 만들 수 있습니다.
+"""
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.database import get_db
+from backend.models import AttendanceMonthly, Student
+from backend.schemas import AttendanceGradeStats, AttendanceMonthlyReport, AttendanceStudentReport
+from backend.utils.attendance_rollup import month_start
+
+router = APIRouter(prefix="/attendance/stats", tags=["Attendance Stats"])
+
+MONTH_PATTERN = r"^\d{4}-\d{2}$"
+
+
+def _parse_month(value: str, name: str = "month") -> date:
+    try:
+        return date.fromisoformat(f"{value}-01")
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"잘못된 {name}")
+
+
+def _month_range(start_month: Optional[str], end_month: Optional[str]):
+    """비우면 이번 달까지 최근 12개월"""
+    end = _parse_month(end_month, "end_month") if end_month else month_start(date.today())
+    if start_month:
+        start = _parse_month(start_month, "start_month")
+    else:
+        start = date(end.year - 1, end.month + 1, 1) if end.month < 12 else date(end.year, 1, 1)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start_month가 end_month보다 늦습니다")
+    return start, end
+
+
+def _sums():
+    return (
+        func.coalesce(func.sum(AttendanceMonthly.present), 0),
+        func.coalesce(func.sum(AttendanceMonthly.late), 0),
+        func.coalesce(func.sum(AttendanceMonthly.absent), 0),
+        func.coalesce(func.sum(AttendanceMonthly.late_minutes), 0),
+    )
+
+
+def _stats(present: int, late: int, absent: int, late_minutes: int):
+    recorded = present + absent
+    return {
+        "present": present,
+        "late": late,
+        "absent": absent,
+        "attendance_rate": round(present / recorded, 4) if recorded else None,
+        "average_late_minutes": round(late_minutes / late, 1) if late else None,
+    }
+
+
+def _total(rows):
+    return _stats(*(sum(row[i] for row in rows) for i in range(4)))
+
+
+# -------------------------
+# 한 달 학생별 통계
+# -------------------------
+@router.get("/monthly", response_model=AttendanceMonthlyReport)
+def get_monthly_stats(
+    month: str = Query(..., pattern=MONTH_PATTERN, description="YYYY-MM"),
+    grade: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    query = db.query(
+        AttendanceMonthly.student_id, Student.name, Student.grade,
+        AttendanceMonthly.present, AttendanceMonthly.late, AttendanceMonthly.absent, AttendanceMonthly.late_minutes
+    ).join(Student, Student.id == AttendanceMonthly.student_id).filter(
+        AttendanceMonthly.month == _parse_month(month)
+    )
+    if grade:
+        query = query.filter(Student.grade == grade)
+    rows = query.order_by(Student.grade, Student.name, Student.id).all()
+
+    return {
+        "month": month,
+        "total": _total([row[3:] for row in rows]),
+        "students": [
+            {"student_id": row.student_id, "name": row.name, "grade": row.grade, **_stats(*row[3:])}
+            for row in rows
+        ]
+    }
+
+
+# -------------------------
+# 학생 한 명의 월별 추이
+# -------------------------
+@router.get("/student/{student_id}", response_model=AttendanceStudentReport)
+def get_student_stats(
+    student_id: int,
+    start_month: Optional[str] = Query(None, pattern=MONTH_PATTERN),
+    end_month: Optional[str] = Query(None, pattern=MONTH_PATTERN),
+    db: Session = Depends(get_db)
+):
+    if not db.query(Student.id).filter(Student.id == student_id).first():
+        raise HTTPException(status_code=404, detail="학생 없음")
+
+    start, end = _month_range(start_month, end_month)
+    rows = db.query(
+        AttendanceMonthly.month,
+        AttendanceMonthly.present, AttendanceMonthly.late, AttendanceMonthly.absent, AttendanceMonthly.late_minutes
+    ).filter(
+        AttendanceMonthly.student_id == student_id,
+        AttendanceMonthly.month >= start,
+        AttendanceMonthly.month <= end
+    ).order_by(AttendanceMonthly.month).all()
+
+    return {
+        "student_id": student_id,
+        "total": _total([row[1:] for row in rows]),
+        "months": [{"month": row.month.strftime("%Y-%m"), **_stats(*row[1:])} for row in rows]
+    }
+
+
+# -------------------------
+# 학년별 월별 통계
+# -------------------------
+@router.get("/grades", response_model=List[AttendanceGradeStats])
+def get_grade_stats(
+    start_month: Optional[str] = Query(None, pattern=MONTH_PATTERN),
+    end_month: Optional[str] = Query(None, pattern=MONTH_PATTERN),
+    grade: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    start, end = _month_range(start_month, end_month)
+    query = db.query(
+        Student.grade, AttendanceMonthly.month, func.count(), *_sums()
+    ).join(Student, Student.id == AttendanceMonthly.student_id).filter(
+        AttendanceMonthly.month >= start,
+        AttendanceMonthly.month <= end
+    )
+    if grade:
+        query = query.filter(Student.grade == grade)
+    rows = query.group_by(Student.grade, AttendanceMonthly.month).order_by(
+        AttendanceMonthly.month, Student.grade
+    ).all()
+
+    return [
+        {"grade": row[0], "month": row[1].strftime("%Y-%m"), "students": row[2], **_stats(*row[3:])}
+        for row in rows
+    ]
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
-from datetime import datetime, timedelta
-import secrets
+
+from backend.utils.session_store import SESSION_EXPIRED, session_store
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -10,9 +10,6 @@ FIXED_USERNAME = "bigmama"
 FIXED_PASSWORD = "1234"
 FIXED_TEACHER_NAME = "선생님"
 
-# 간단한 세션 저장 (실제 운영환경에서는 Redis 등 사용 권장)
-active_sessions = {}
-
 class LoginRequest(BaseModel):
     username: str
     password: str
@@ -31,14 +28,8 @@ def login(login_data: LoginRequest):
             detail="아이디 또는 비밀번호가 잘못되었습니다"
         )
     
-    # 토큰 생성
-    token = secrets.token_urlsafe(32)
-    active_sessions[token] = {
-        "teacher_id": 1,
-        "teacher_name": FIXED_TEACHER_NAME,
-        "username": FIXED_USERNAME,
-        "expires_at": datetime.now() + timedelta(days=30)  # 30일 유효
-    }
+    # 토큰 생성 (auth_sessions 테이블에 저장, SESSION_TTL_DAYS일 유효)
+    token = session_store.create(1, FIXED_TEACHER_NAME, FIXED_USERNAME)
     
     return {
         "token": token,
@@ -54,15 +45,14 @@ def get_current_user(token: str = None):
             detail="인증이 필요합니다"
         )
     
-    if token not in active_sessions:
+    session = session_store.get(token)
+    if session is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="인증이 필요합니다"
         )
     
-    session = active_sessions[token]
-    if datetime.now() > session["expires_at"]:
-        del active_sessions[token]
+    if session == SESSION_EXPIRED:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="세션이 만료되었습니다"
@@ -76,7 +66,7 @@ def get_current_user(token: str = None):
 
 @router.post("/logout")
 def logout(token: str = None):
-    if token and token in active_sessions:
-        del active_sessions[token]
+    if token:
+        session_store.revoke(token)
     return {"message": "로그아웃되었습니다"}
 
@@ -1,20 +1,74 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import and_, case, func, or_
 from sqlalchemy.orm import Session
-from datetime import date, datetime
-from typing import List, Optional
+from datetime import date, datetime, time, timedelta
+from typing import List, Literal, Optional
+import calendar
+import json
+import operator
 
 from backend.database import get_db
 from backend.models import Consultation, Student
-from backend.schemas import ConsultationCreate, ConsultationUpdate, ConsultationResponse
+from backend.schemas import (
+    ConsultationCalendar, ConsultationCreate, ConsultationFreeSlots, ConsultationPage, ConsultationResponse,
+    ConsultationUpdate
+)
+from backend.utils.consultation_schedule import (
+    CONSULTATION_DEFAULT_MINUTES, CONSULTATION_MAX_MINUTES, CONSULTATION_MIN_MINUTES,
+    from_minutes, schedule_index, to_minutes
+)
 
 router = APIRouter(
     prefix="/consultations",
     tags=["Consultations"]
 )
 
+def _duration(minutes: Optional[int]) -> int:
+    if minutes is None:
+        return CONSULTATION_DEFAULT_MINUTES
+    if not CONSULTATION_MIN_MINUTES <= minutes <= CONSULTATION_MAX_MINUTES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"상담 길이는 {CONSULTATION_MIN_MINUTES}~{CONSULTATION_MAX_MINUTES}분이어야 합니다"
+        )
+    return minutes
+
+
+def _check_overlap(db: Session, c: Consultation, allow_overlap: bool, exclude_id=None):
+    """
+    예정 상담끼리 시간이 겹치면 409 (allow_overlap=true면 저장하고 겹치는 상담 id만 돌려줌)
+    booking_lock 안에서 호출
+    """
+    if to_minutes(c.time) + c.duration_minutes > 24 * 60:
+        raise HTTPException(status_code=400, detail="상담이 자정을 넘을 수 없습니다")
+    if c.status != "scheduled":
+        return []
+
+    conflicts = schedule_index.conflicts(db, c.date, c.time, c.duration_minutes, exclude_id)
+    if not conflicts or allow_overlap:
+        return [consultation_id for _, _, consultation_id in conflicts]
+
+    names = dict(db.query(Consultation.id, Consultation.student_name).filter(
+        Consultation.id.in_([consultation_id for _, _, consultation_id in conflicts])
+    ).all())
+    raise HTTPException(status_code=409, detail={
+        "message": "같은 시간에 예정된 상담이 있습니다",
+        "conflicts": [
+            {
+                "id": consultation_id,
+                "student_name": names.get(consultation_id),
+                "start": from_minutes(start).isoformat(timespec="minutes"),
+                "end": from_minutes(min(end, 24 * 60 - 1)).isoformat(timespec="minutes"),
+            }
+            for start, end, consultation_id in conflicts
+        ]
+    })
+
+
 @router.post("/", response_model=ConsultationResponse)
 def create_consultation(
     consultation: ConsultationCreate,
+    allow_overlap: bool = False,
     db: Session = Depends(get_db)
 ):
     try:
@@ -26,9 +80,14 @@ def create_consultation(
 
         # Consultation 객체 생성
         consultation_data = consultation.dict()
+        consultation_data["duration_minutes"] = _duration(consultation.duration_minutes)
         new_consultation = Consultation(**consultation_data)
-        db.add(new_consultation)
-        db.commit()
+        # 충돌 확인과 저장 사이에 같은 시간이 잡히지 않도록
+        with schedule_index.booking_lock:
+            conflict_ids = _check_overlap(db, new_consultation, allow_overlap)
+            db.add(new_consultation)
+            db.commit()
+            schedule_index.invalidate(consultation.date)
         db.refresh(new_consultation)
 
         # 반환
@@ -39,79 +98,189 @@ def create_consultation(
             student_grade=new_consultation.student_grade,
             date=new_consultation.date,
             time=new_consultation.time,
+            duration_minutes=new_consultation.duration_minutes,
             parent_name=new_consultation.parent_name,
             content=new_consultation.content,
             notes=new_consultation.notes,
             status=new_consultation.status,
             created_at=new_consultation.created_at,
-            updated_at=new_consultation.updated_at
+            updated_at=new_consultation.updated_at,
+            conflict_ids=conflict_ids
         )
         return result
+    except HTTPException:
+        db.rollback()
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"상담 저장 중 오류 발생: {str(e)}")
 
+def _apply_filters(query, start_date, end_date, status, student_id, grade):
+    if start_date:
+        query = query.filter(Consultation.date >= start_date)
+    if end_date:
+        query = query.filter(Consultation.date <= end_date)
+    if status:
+        query = query.filter(Consultation.status == status)
+    if student_id is not None:
+        query = query.filter(Consultation.student_id == student_id)
+    if grade:
+        query = query.filter(Consultation.student_grade == grade)
+    return query
+
 @router.get("/", response_model=List[ConsultationResponse])
 def get_consultations(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    status: Optional[str] = None,
+    student_id: Optional[int] = None,
+    grade: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    query = db.query(Consultation)
-    
-    if start_date:
-        query = query.filter(Consultation.date >= start_date)
-    if end_date:
-        query = query.filter(Consultation.date <= end_date)
-    
-    consultations = query.order_by(Consultation.date, Consultation.time).all()
-    
-    result = []
-    for c in consultations:
-        result.append(ConsultationResponse(
-            id=c.id,
-            student_id=c.student_id,
-            student_name=c.student_name,
-            student_grade=c.student_grade,
-            date=c.date,
-            time=c.time,
-            parent_name=c.parent_name,
-            content=c.content,
-            notes=c.notes,
-            status=c.status,
-            created_at=c.created_at,
-            updated_at=c.updated_at
+    # 기간 없이 부르면 전체 이력을 돌려주므로 화면에서는 /page, /calendar 를 사용
+    query = _apply_filters(db.query(Consultation), start_date, end_date, status, student_id, grade)
+    return query.order_by(Consultation.date, Consultation.time, Consultation.id).all()
+
+
+def _encode_cursor(c: Consultation) -> str:
+    return f"{c.date.isoformat()}_{c.time.isoformat()}_{c.id}"
+
+
+def _decode_cursor(cursor: str):
+    try:
+        cursor_date, cursor_time, cursor_id = cursor.split("_")
+        return date.fromisoformat(cursor_date), time.fromisoformat(cursor_time), int(cursor_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 cursor")
+
+
+#  상담 목록 (date, time, id 순서, cursor 페이지네이션)
+@router.get("/page", response_model=ConsultationPage)
+def get_consultation_page(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    status: Optional[str] = None,
+    student_id: Optional[int] = None,
+    grade: Optional[str] = None,
+    order: Literal["asc", "desc"] = "asc",
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    query = _apply_filters(db.query(Consultation), start_date, end_date, status, student_id, grade)
+    if cursor:
+        # 이전 페이지 마지막 상담 (date, time, id) 다음부터
+        cursor_date, cursor_time, cursor_id = _decode_cursor(cursor)
+        after = operator.gt if order == "asc" else operator.lt
+        query = query.filter(or_(
+            after(Consultation.date, cursor_date),
+            and_(Consultation.date == cursor_date, or_(
+                after(Consultation.time, cursor_time),
+                and_(Consultation.time == cursor_time, after(Consultation.id, cursor_id))
+            ))
         ))
-    
-    return result
+
+    key = (Consultation.date, Consultation.time, Consultation.id)
+    order_by = key if order == "asc" else [column.desc() for column in key]
+    consultations = query.order_by(*order_by).limit(limit + 1).all()
+
+    has_more = len(consultations) > limit
+    consultations = consultations[:limit]
+    return {
+        "items": consultations,
+        "next_cursor": _encode_cursor(consultations[-1]) if has_more else None
+    }
+
+
+#  달력용 월별 요약 (날짜별 건수 + 시간/이름만 담은 슬롯, SQL에서 한 번에 집계)
+@router.get("/calendar", response_model=ConsultationCalendar)
+def get_consultation_calendar(
+    month: str = Query(..., pattern=r"^\d{4}-\d{2}$", description="YYYY-MM"),
+    status: Optional[str] = None,
+    student_id: Optional[int] = None,
+    grade: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    try:
+        first_day = date.fromisoformat(f"{month}-01")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 month")
+    last_day = first_day.replace(day=calendar.monthrange(first_day.year, first_day.month)[1])
+
+    # 날짜별로 묶어서 건수와 슬롯(필요한 컬럼만 담은 JSON 배열)을 한 번에 집계
+    # (date 인덱스 순서대로 읽으므로 GROUP BY에 정렬이 따로 필요 없음)
+    def status_count(value):
+        return func.sum(case((Consultation.status == value, 1), else_=0))
+
+    rows = _apply_filters(
+        db.query(
+            Consultation.date,
+            func.count(),
+            status_count("scheduled"),
+            status_count("completed"),
+            status_count("cancelled"),
+            func.json_group_array(func.json_object(
+                "id", Consultation.id,
+                "time", Consultation.time,
+                "duration_minutes", Consultation.duration_minutes,
+                "student_name", Consultation.student_name,
+                "status", Consultation.status
+            ))
+        ),
+        first_day, last_day, status, student_id, grade
+    ).group_by(Consultation.date).order_by(Consultation.date).all()
+
+    days = [
+        {
+            "date": day,
+            "count": count,
+            "scheduled": scheduled,
+            "completed": completed,
+            "cancelled": cancelled,
+            # json_group_array는 순서를 보장하지 않으므로 하루치만 시간순 정렬
+            "slots": sorted(json.loads(slots), key=lambda slot: (slot["time"], slot["id"]))
+        }
+        for day, count, scheduled, completed, cancelled, slots in rows
+    ]
+    return {"month": month, "total": sum(day["count"] for day in days), "days": days}
+
+
+#  빈 상담 시간 찾기 (start_date ~ end_date 사이 가장 빠른 limit개, 오늘 이전/지금 이전은 제외)
+@router.get("/free-slots", response_model=ConsultationFreeSlots)
+def find_free_slots(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    duration_minutes: Optional[int] = None,
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    now = datetime.now()
+    start_date = max(start_date or now.date(), now.date())
+    end_date = end_date or start_date + timedelta(days=30)
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date가 start_date보다 빠릅니다")
+    if (end_date - start_date).days > 366:
+        raise HTTPException(status_code=400, detail="조회 기간은 1년 이내여야 합니다")
+
+    length = _duration(duration_minutes)
+    slots = schedule_index.free_slots(db, start_date, end_date, length, limit, not_before=now)
+    return {
+        "duration_minutes": length,
+        "slots": [
+            {"date": day, "start": from_minutes(minute), "end": from_minutes(minute + length)}
+            for day, minute in slots
+        ]
+    }
+
 
 @router.get("/date/{target_date}", response_model=List[ConsultationResponse])
 def get_consultations_by_date(
     target_date: date,
     db: Session = Depends(get_db)
 ):
-    consultations = db.query(Consultation).filter(
+    return db.query(Consultation).filter(
         Consultation.date == target_date
-    ).order_by(Consultation.time).all()
-    
-    result = []
-    for c in consultations:
-        result.append(ConsultationResponse(
-            id=c.id,
-            student_id=c.student_id,
-            student_name=c.student_name,
-            student_grade=c.student_grade,
-            date=c.date,
-            time=c.time,
-            parent_name=c.parent_name,
-            content=c.content,
-            notes=c.notes,
-            status=c.status,
-            created_at=c.created_at,
-            updated_at=c.updated_at
-        ))
-    
-    return result
+    ).order_by(Consultation.time, Consultation.id).all()
 
 @router.get("/{consultation_id}", response_model=ConsultationResponse)
 def get_consultation(
@@ -132,6 +301,7 @@ def get_consultation(
         student_grade=consultation.student_grade,
         date=consultation.date,
         time=consultation.time,
+        duration_minutes=consultation.duration_minutes,
         parent_name=consultation.parent_name,
         content=consultation.content,
         notes=consultation.notes,
@@ -144,6 +314,7 @@ def get_consultation(
 def update_consultation(
     consultation_id: int,
     consultation: ConsultationUpdate,
+    allow_overlap: bool = False,
     db: Session = Depends(get_db)
 ):
     db_consultation = db.query(Consultation).filter(Consultation.id == consultation_id).first()
@@ -151,6 +322,8 @@ def update_consultation(
     if not db_consultation:
         raise HTTPException(status_code=404, detail="상담 없음")
     
+    previous_date = db_consultation.date
+    
     if consultation.student_id is not None:
         db_consultation.student_id = consultation.student_id
     if consultation.student_name is not None:
@@ -161,6 +334,8 @@ def update_consultation(
         db_consultation.date = consultation.date
     if consultation.time is not None:
         db_consultation.time = consultation.time
+    if consultation.duration_minutes is not None:
+        db_consultation.duration_minutes = _duration(consultation.duration_minutes)
     if consultation.parent_name is not None:
         db_consultation.parent_name = consultation.parent_name
     if consultation.content is not None:
@@ -170,7 +345,22 @@ def update_consultation(
     if consultation.status is not None:
         db_consultation.status = consultation.status
     
-    db.commit()
+    # 일정(날짜/시간/길이/상태)이 바뀐 경우에만 충돌 확인
+    rescheduled = any(
+        value is not None for value in
+        (consultation.date, consultation.time, consultation.duration_minutes, consultation.status)
+    )
+    with schedule_index.booking_lock:
+        conflict_ids = []
+        if rescheduled:
+            try:
+                conflict_ids = _check_overlap(db, db_consultation, allow_overlap, exclude_id=consultation_id)
+            except HTTPException:
+                db.rollback()
+                raise
+        new_date = db_consultation.date
+        db.commit()
+        schedule_index.invalidate(previous_date, new_date)
     db.refresh(db_consultation)
     
     return ConsultationResponse(
@@ -180,12 +370,14 @@ def update_consultation(
         student_grade=db_consultation.student_grade,
         date=db_consultation.date,
         time=db_consultation.time,
+        duration_minutes=db_consultation.duration_minutes,
         parent_name=db_consultation.parent_name,
         content=db_consultation.content,
         notes=db_consultation.notes,
         status=db_consultation.status,
         created_at=db_consultation.created_at,
-        updated_at=db_consultation.updated_at
+        updated_at=db_consultation.updated_at,
+        conflict_ids=conflict_ids
     )
 
 @router.delete("/{consultation_id}")
@@ -198,8 +390,10 @@ def delete_consultation(
     if not db_consultation:
         raise HTTPException(status_code=404, detail="상담 없음")
     
+    consultation_date = db_consultation.date
     db.delete(db_consultation)
     db.commit()
+    schedule_index.invalidate(consultation_date)
     
     return {"message": "상담이 삭제되었습니다"}
 
@@ -1,13 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
 from datetime import date
-from fastapi.responses import FileResponse
-import os
+from fastapi.responses import FileResponse, StreamingResponse
+from typing import Optional
+import asyncio
+import zipfile
+from urllib.parse import quote
 
 from backend.database import get_db
 from backend.models import DailyLog, DailyTask, Student
-from backend.schemas import DailyLogCreate, DailyLogResponse
-from backend.utils.report_image import generate_report_image
+from backend.schemas import DailyLogCreate, DailyLogPage, DailyLogResponse, ReportBatchRequest, ReportBatchResponse
+from backend.utils.export import ChunkBuffer
+from backend.utils.report_image import find_report_image, generate_report_image, generate_report_images
+from backend.utils.report_renderer import RendererBusy, renderer
 
 router = APIRouter(
     prefix="/daily-logs",
@@ -94,21 +100,101 @@ def create_daily_log(log: DailyLogCreate, db: Session = Depends(get_db)):
 def get_logs_by_student(student_id: int, db: Session = Depends(get_db)):
     return (
         db.query(DailyLog)
+        .options(selectinload(DailyLog.tasks))
         .filter(DailyLog.student_id == student_id)
         .order_by(DailyLog.date.desc())
         .all()
     )
 
+
+#  학생의 특정 날짜 일지 조회 (없으면 null)
+@router.get("/student/{student_id}/date/{target_date}", response_model=Optional[DailyLogResponse])
+def get_log_by_student_and_date(student_id: int, target_date: date, db: Session = Depends(get_db)):
+    return (
+        db.query(DailyLog)
+        .options(selectinload(DailyLog.tasks))
+        .filter(
+            DailyLog.student_id == student_id,
+            DailyLog.date == target_date
+        )
+        .first()
+    )
+
+
+def _encode_log_cursor(log: DailyLog) -> str:
+    return f"{log.date.isoformat()}_{log.id}"
+
+
+def _decode_log_cursor(cursor: str):
+    try:
+        cursor_date, cursor_id = cursor.split("_")
+        return date.fromisoformat(cursor_date), int(cursor_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 cursor")
+
+
+#  학생의 기간별 일지 조회 (최신순, cursor 페이지네이션)
+@router.get("/student/{student_id}/range", response_model=DailyLogPage)
+def get_logs_by_student_range(
+    student_id: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    query = (
+        db.query(DailyLog)
+        .options(selectinload(DailyLog.tasks))
+        .filter(DailyLog.student_id == student_id)
+    )
+    if start_date:
+        query = query.filter(DailyLog.date >= start_date)
+    if end_date:
+        query = query.filter(DailyLog.date <= end_date)
+    if cursor:
+        # 이전 페이지 마지막 일지 (date, id) 다음부터
+        cursor_date, cursor_id = _decode_log_cursor(cursor)
+        query = query.filter(or_(
+            DailyLog.date < cursor_date,
+            and_(DailyLog.date == cursor_date, DailyLog.id < cursor_id)
+        ))
+
+    logs = query.order_by(DailyLog.date.desc(), DailyLog.id.desc()).limit(limit + 1).all()
+
+    has_more = len(logs) > limit
+    logs = logs[:limit]
+    return {
+        "items": logs,
+        "next_cursor": _encode_log_cursor(logs[-1]) if has_more else None
+    }
+
+def _load_log_for_image(db: Session, log_id: int):
+    # 템플릿 렌더링 중에 지연 로딩이 일어나지 않도록 학생 + 할 일까지 미리 로드
+    return (
+        db.query(DailyLog)
+        .options(joinedload(DailyLog.student), selectinload(DailyLog.tasks))
+        .filter(DailyLog.id == log_id)
+        .first()
+    )
+
+
 # ✅ 이미지 생성 (POST)
 @router.post("/{log_id}/image")
-def create_log_image(log_id: int, db: Session = Depends(get_db)):
-    log = db.query(DailyLog).filter(DailyLog.id == log_id).first()
+async def create_log_image(log_id: int, db: Session = Depends(get_db)):
+    # DB 조회는 이벤트 루프를 막지 않도록 스레드에서
+    log = await asyncio.to_thread(_load_log_for_image, db, log_id)
     if not log:
         raise HTTPException(status_code=404, detail="일지 없음")
 
-    student = db.query(Student).filter(Student.id == log.student_id).first()
+    student = log.student
 
-    image_url = generate_report_image(student, log)
+    try:
+        image_url = await generate_report_image(student, log)
+    except RendererBusy:
+        raise HTTPException(status_code=503, detail="리포트 생성 요청이 많습니다. 잠시 후 다시 시도해주세요")
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="리포트 이미지 생성 시간이 초과되었습니다")
 
     return {
         "image_url": image_url,  # "/static/reports/log_1.png"
@@ -116,12 +202,119 @@ def create_log_image(log_id: int, db: Session = Depends(get_db)):
     }
 
 
+def _load_logs_for_batch(db: Session, target_date: date, grade: Optional[str]):
+    # 학생 + 할 일까지 한 번의 쿼리로 로드
+    query = (
+        db.query(DailyLog)
+        .join(DailyLog.student)
+        .options(contains_eager(DailyLog.student), joinedload(DailyLog.tasks))
+        .filter(DailyLog.date == target_date)
+    )
+    if grade:
+        query = query.filter(Student.grade == grade)
+
+    return query.order_by(Student.name, DailyLog.id).all()
+
+
+async def _render_batch(db: Session, target_date: date, grade: Optional[str]):
+    logs = await asyncio.to_thread(_load_logs_for_batch, db, target_date, grade)
+    results = await generate_report_images(logs)
+
+    items = []
+    for log, result in zip(logs, results):
+        item = {
+            "log_id": log.id,
+            "student_id": log.student_id,
+            "student_name": log.student.name,
+            "image_url": None,
+            "error": None
+        }
+        if isinstance(result, RendererBusy):
+            item["error"] = "리포트 생성 요청이 많습니다"
+        elif isinstance(result, asyncio.TimeoutError):
+            item["error"] = "시간 초과"
+        elif isinstance(result, Exception):
+            item["error"] = str(result) or type(result).__name__
+        else:
+            item["image_url"] = result
+        items.append(item)
+
+    return items
+
+
+# ✅ 날짜(+학년)별 리포트 이미지 일괄 생성
+@router.post("/images/batch", response_model=ReportBatchResponse)
+async def create_log_images_batch(batch: ReportBatchRequest, db: Session = Depends(get_db)):
+    items = await _render_batch(db, batch.date, batch.grade)
+    failed = sum(1 for item in items if item["error"])
+
+    return {
+        "date": batch.date,
+        "grade": batch.grade,
+        "total": len(items),
+        "rendered": len(items) - failed,
+        "failed": failed,
+        "items": items
+    }
+
+
+def _collect_batch_files(db: Session, target_date: date, grade: Optional[str]):
+    files = []
+    for log in _load_logs_for_batch(db, target_date, grade):
+        try:
+            path = find_report_image(log.id)
+        except FileNotFoundError:
+            # 찾는 사이 캐시 정리로 지워진 경우
+            path = None
+        if path:
+            files.append((path, f"{log.student.name}_{log.id}.png"))
+    return files
+
+
+def _iter_zip(files):
+    stream = ChunkBuffer()
+    # PNG는 이미 압축되어 있으므로 STORED로 묶기만 함
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_STORED) as zf:
+        for path, arcname in files:
+            try:
+                zf.write(path, arcname)
+            except FileNotFoundError:
+                # 응답을 보내는 도중 캐시 정리로 지워진 파일은 건너뜀 (이미 200을 보냈으므로 중단하지 않음)
+                continue
+            yield stream.drain()
+    yield stream.drain()
+
+
+# ✅ 날짜(+학년)별로 이미 생성된 리포트 이미지를 ZIP으로 다운로드
+# (GET은 렌더링하지 않음 — 없는 이미지는 POST /images/batch 로 먼저 생성)
+@router.get("/images/batch.zip")
+async def download_log_images_batch(
+    target_date: date = Query(..., alias="date"),
+    grade: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    files = await asyncio.to_thread(_collect_batch_files, db, target_date, grade)
+
+    filename = f"reports_{target_date}{'_' + grade if grade else ''}.zip"
+    return StreamingResponse(
+        _iter_zip(files),
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
+    )
+
+
+# 리포트 렌더러 상태 (렌더링 지연시간, 대기열 길이)
+@router.get("/renderer/metrics")
+def get_renderer_metrics():
+    return renderer.snapshot()
+
+
 # ✅ 이미지 파일 제공 (GET) ← ⭐ 핵심
 @router.get("/{log_id}/image-file")
 def get_log_image_file(log_id: int):
-    image_path = f"backend/static/reports/log_{log_id}.png"
+    image_path = find_report_image(log_id)
 
-    if not os.path.exists(image_path):
+    if not image_path:
         raise HTTPException(status_code=404, detail="이미지 없음")
 
     return FileResponse(
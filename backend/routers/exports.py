@@ -0,0 +1,145 @@
+"""
+기간별 내보내기 (CSV / XLSX 다운로드)
+
+출석, 일지(+과제), 상담을 날짜 범위로 내보냅니다.
+행은 DB 커서에서 읽는 대로 파일로 써서 바로 흘려보냅니다 (backend/utils/export.py).
+"""
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from sqlalchemy import select
+
+from backend.models import Attendance, Consultation, DailyLog, DailyTask, Student
+from backend.utils.export import export_response, iter_query
+
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+FORMAT_PATTERN = r"^(csv|xlsx)$"
+
+ATTENDANCE_STATUS_LABELS = {"present": "출석", "absent": "결석"}
+CONSULTATION_STATUS_LABELS = {"scheduled": "예정", "completed": "완료", "cancelled": "취소"}
+
+
+def _check_range(start_date: date, end_date: date):
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date가 end_date보다 늦습니다")
+
+
+def _filename(name: str, start_date: date, end_date: date, grade: Optional[str]):
+    return f"{name}_{start_date}_{end_date}{'_' + grade if grade else ''}"
+
+
+# -------------------------
+# 출석
+# -------------------------
+@router.get("/attendance")
+def export_attendance(
+    start_date: date,
+    end_date: date,
+    grade: Optional[str] = None,
+    student_id: Optional[int] = None,
+    fmt: str = Query("csv", alias="format", pattern=FORMAT_PATTERN)
+):
+    _check_range(start_date, end_date)
+    stmt = select(
+        Attendance.date, Attendance.student_id, Student.name, Student.grade,
+        Attendance.status, Attendance.check_in, Attendance.check_out
+    ).join(Student, Student.id == Attendance.student_id).where(
+        Attendance.date >= start_date,
+        Attendance.date <= end_date
+    )
+    if grade:
+        stmt = stmt.where(Student.grade == grade)
+    if student_id is not None:
+        stmt = stmt.where(Attendance.student_id == student_id)
+    # (date, id) 순서는 ix_attendance_date 인덱스 순서 그대로라 정렬하지 않고 읽음
+    stmt = stmt.order_by(Attendance.date, Attendance.id)
+
+    rows = (
+        (row.date, row.student_id, row.name, row.grade,
+         ATTENDANCE_STATUS_LABELS.get(row.status, row.status), row.check_in, row.check_out)
+        for row in iter_query(stmt)
+    )
+    return export_response(
+        _filename("출석", start_date, end_date, grade),
+        ["날짜", "학생 ID", "이름", "학년", "상태", "등원", "하원"],
+        rows, fmt, sheet_name="출석"
+    )
+
+
+# -------------------------
+# 일지 (과제마다 한 행, 과제가 없는 일지도 한 행)
+# -------------------------
+@router.get("/daily-logs")
+def export_daily_logs(
+    start_date: date,
+    end_date: date,
+    grade: Optional[str] = None,
+    student_id: Optional[int] = None,
+    fmt: str = Query("csv", alias="format", pattern=FORMAT_PATTERN)
+):
+    _check_range(start_date, end_date)
+    stmt = select(
+        DailyLog.date, DailyLog.id, DailyLog.student_id, Student.name, Student.grade,
+        DailyLog.attendance_status, DailyLog.absence_reason, DailyLog.follow_up_action,
+        DailyLog.makeup_class_note, DailyLog.exam_result, DailyLog.teacher_note,
+        DailyTask.content, DailyTask.grading_done, DailyTask.review_done
+    ).join(Student, Student.id == DailyLog.student_id).outerjoin(
+        DailyTask, DailyTask.daily_log_id == DailyLog.id
+    ).where(
+        DailyLog.date >= start_date,
+        DailyLog.date <= end_date
+    )
+    if grade:
+        stmt = stmt.where(Student.grade == grade)
+    if student_id is not None:
+        stmt = stmt.where(DailyLog.student_id == student_id)
+    stmt = stmt.order_by(DailyLog.date, DailyLog.id, DailyTask.id)
+
+    return export_response(
+        _filename("일지", start_date, end_date, grade),
+        ["날짜", "일지 ID", "학생 ID", "이름", "학년", "출결", "지각/결석 사유", "후속 조치",
+         "보강 메모", "시험 결과", "선생님 메모", "과제", "채점", "오답"],
+        iter_query(stmt), fmt, sheet_name="일지"
+    )
+
+
+# -------------------------
+# 상담
+# -------------------------
+@router.get("/consultations")
+def export_consultations(
+    start_date: date,
+    end_date: date,
+    status: Optional[str] = None,
+    grade: Optional[str] = None,
+    student_id: Optional[int] = None,
+    fmt: str = Query("csv", alias="format", pattern=FORMAT_PATTERN)
+):
+    _check_range(start_date, end_date)
+    stmt = select(
+        Consultation.date, Consultation.time, Consultation.duration_minutes, Consultation.id,
+        Consultation.student_id, Consultation.student_name, Consultation.student_grade,
+        Consultation.parent_name, Consultation.status, Consultation.content, Consultation.notes
+    ).where(
+        Consultation.date >= start_date,
+        Consultation.date <= end_date
+    )
+    if status:
+        stmt = stmt.where(Consultation.status == status)
+    if grade:
+        stmt = stmt.where(Consultation.student_grade == grade)
+    if student_id is not None:
+        stmt = stmt.where(Consultation.student_id == student_id)
+    stmt = stmt.order_by(Consultation.date, Consultation.time, Consultation.id)
+
+    rows = (
+        (*row[:8], CONSULTATION_STATUS_LABELS.get(row.status, row.status), row.content, row.notes)
+        for row in iter_query(stmt)
+    )
+    return export_response(
+        _filename("상담", start_date, end_date, grade),
+        ["날짜", "시간", "길이(분)", "상담 ID", "학생 ID", "이름", "학년", "학부모", "상태", "상담 내용", "메모"],
+        rows, fmt, sheet_name="상담"
+    )
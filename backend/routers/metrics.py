@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from backend.utils.metrics import render_prometheus
+
+router = APIRouter(tags=["System"])
+
+
+# -------------------------
+# Prometheus 수집용 지표 (요청 시간 / SQL 수)
+# -------------------------
+@router.get("/_metrics", response_class=PlainTextResponse)
+def get_metrics():
+    return PlainTextResponse(
+        render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,85 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+import asyncio
+import json
+
+from backend.database import SessionLocal, get_db
+from backend.models import DailyLog, ReportJob
+from backend.schemas import ReportJobCreate, ReportJobResponse
+from backend.utils.report_jobs import FINISHED_STATUSES, report_jobs
+
+router = APIRouter(
+    prefix="/report-jobs",
+    tags=["Report Jobs"]
+)
+
+# SSE 연결 유지를 위한 keep-alive 간격 (초)
+SSE_KEEPALIVE_SECONDS = 15
+
+
+# 리포트 이미지 작업 등록 (바로 job id 반환, 렌더링은 백그라운드 워커가 처리)
+@router.post("/", response_model=ReportJobResponse)
+def create_report_job(job: ReportJobCreate, db: Session = Depends(get_db)):
+    log = db.query(DailyLog).filter(DailyLog.id == job.daily_log_id).first()
+    if not log:
+        raise HTTPException(status_code=404, detail="일지 없음")
+
+    return report_jobs.submit(db, job.daily_log_id)
+
+
+# 작업 상태 조회 (완료되면 image_url 포함)
+@router.get("/{job_id}", response_model=ReportJobResponse)
+def get_report_job(job_id: int, db: Session = Depends(get_db)):
+    job = db.query(ReportJob).filter(ReportJob.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="작업 없음")
+    return job
+
+
+def _load_job(job_id: int):
+    db = SessionLocal()
+    try:
+        job = db.query(ReportJob).filter(ReportJob.id == job_id).first()
+        return ReportJobResponse.model_validate(job) if job else None
+    finally:
+        db.close()
+
+
+# 작업 상태 스트림 (SSE) - 상태가 바뀔 때마다 전송, 끝나면 연결 종료
+@router.get("/{job_id}/events")
+async def stream_report_job(job_id: int):
+    # 읽기 전에 변경 알림부터 등록 (읽는 사이에 바뀌어도 바로 깨어나도록)
+    changed = report_jobs.watch(job_id)
+    job = await asyncio.to_thread(_load_job, job_id)
+    if not job:
+        report_jobs.unwatch(job_id, changed)
+        raise HTTPException(status_code=404, detail="작업 없음")
+
+    async def events():
+        nonlocal changed
+        current = job
+        last_status = None
+        try:
+            while True:
+                if current.status != last_status:
+                    yield f"event: status\ndata: {json.dumps(current.model_dump(mode='json'))}\n\n"
+                    last_status = current.status
+                else:
+                    yield ": keep-alive\n\n"
+
+                if current.status in FINISHED_STATUSES:
+                    return
+
+                await report_jobs.wait_for_change(changed, SSE_KEEPALIVE_SECONDS)
+                changed = report_jobs.watch(job_id, changed)
+                current = await asyncio.to_thread(_load_job, job_id)
+        finally:
+            # 끝났거나 연결이 끊기면 알림 등록 해제 (등록된 채로 남으면 작업마다 Event가 쌓임)
+            report_jobs.unwatch(job_id, changed)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
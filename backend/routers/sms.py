@@ -0,0 +1,81 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from datetime import date
+from typing import Optional
+
+from backend.database import get_db
+from backend.models import SmsMessage
+from backend.schemas import SmsAbsentRequest, SmsEnqueueResponse, SmsMessageResponse
+from backend.utils.roster_cache import roster_cache
+from backend.utils.sms_outbox import sms_outbox
+
+router = APIRouter(
+    prefix="/sms",
+    tags=["SMS"]
+)
+
+ABSENT_MESSAGE = "[빅마마] {name} 학생이 아직 등원하지 않았습니다. 확인 부탁드립니다."
+
+
+# 미등원 학생 학부모에게 문자 (대기열에 넣고 바로 응답, 발송은 백그라운드)
+# 같은 날 같은 학생에게는 한 번만 보냄 (다시 요청하면 duplicate, 발송 실패로 끝난 문자는 다시 보냄)
+@router.post("/absent", response_model=SmsEnqueueResponse)
+def send_absent_sms(request: SmsAbsentRequest, db: Session = Depends(get_db)):
+    # 업체 설정이 없으면 대기열에 넣지 않음 (보낸 것처럼 보이지 않도록)
+    error = sms_outbox.config_error()
+    if error:
+        raise HTTPException(status_code=503, detail=f"문자 발송을 사용할 수 없습니다: {error}")
+
+    send_date = request.send_date or date.today()
+    template = request.content or ABSENT_MESSAGE
+    students = {s["id"]: s for s in roster_cache.students(db)}
+
+    items, messages = {}, []
+    for student_id in dict.fromkeys(request.student_ids):
+        student = students.get(student_id)
+        if not student:
+            items[student_id] = {"student_id": student_id, "ok": False, "error": "학생 없음"}
+        elif not student["parent_phone"]:
+            items[student_id] = {"student_id": student_id, "ok": False, "error": "학부모 연락처 없음"}
+        else:
+            messages.append({
+                "student_id": student_id,
+                "phone": student["parent_phone"],
+                "body": template.replace("{name}", student["name"]),
+            })
+
+    for result in sms_outbox.enqueue(db, "absent", send_date, messages):
+        items[result["student_id"]] = {"ok": True, **result}
+
+    results = [items[student_id] for student_id in dict.fromkeys(request.student_ids)]
+    duplicate = sum(1 for item in results if item.get("duplicate"))
+    queued = sum(1 for item in results if item["ok"]) - duplicate
+    return {
+        "total": len(results),
+        "queued": queued,
+        "duplicate": duplicate,
+        "failed": len(results) - queued - duplicate,
+        "items": results,
+    }
+
+
+# 보낸 문자 목록 (날짜별, 상태별)
+@router.get("/messages", response_model=list[SmsMessageResponse])
+def get_sms_messages(
+    send_date: Optional[date] = None,
+    status: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    query = db.query(SmsMessage).filter(SmsMessage.send_date == (send_date or date.today()))
+    if status:
+        query = query.filter(SmsMessage.status == status)
+    return query.order_by(SmsMessage.id).all()
+
+
+# 문자 한 건 상태 조회
+@router.get("/messages/{message_id}", response_model=SmsMessageResponse)
+def get_sms_message(message_id: int, db: Session = Depends(get_db)):
+    message = db.query(SmsMessage).filter(SmsMessage.id == message_id).first()
+    if not message:
+        raise HTTPException(status_code=404, detail="문자 없음")
+    return message
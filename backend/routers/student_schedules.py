@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from backend.database import get_db
 from backend.models import Student, StudentSchedule
 from backend.schemas import StudentScheduleCreate, StudentScheduleResponse
+from backend.utils.roster_cache import roster_cache
 
 router = APIRouter(
     prefix="/students/{student_id}/schedules",
@@ -13,9 +14,7 @@ router = APIRouter(
 # 요일별 스케줄 조회
 @router.get("/", response_model=list[StudentScheduleResponse])
 def get_schedules(student_id: int, db: Session = Depends(get_db)):
-    return db.query(StudentSchedule).filter(
-        StudentSchedule.student_id == student_id
-    ).all()
+    return roster_cache.schedules(db, student_id)
 
 
 # 요일별 스케줄 생성/수정
@@ -38,6 +37,7 @@ def create_or_update_schedule(
         existing.expected_time = schedule.expected_time
         db.commit()
         db.refresh(existing)
+        roster_cache.invalidate()
         return existing
 
     new_schedule = StudentSchedule(
@@ -48,4 +48,5 @@ def create_or_update_schedule(
     db.add(new_schedule)
     db.commit()
     db.refresh(new_schedule)
+    roster_cache.invalidate()
     return new_schedule
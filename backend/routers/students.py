@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Response
 from sqlalchemy.orm import Session
+from typing import Optional
 
 from backend.database import get_db
 from backend.models import Student
-from backend.schemas import StudentCreate, StudentResponse, StudentUpdate
+from backend.schemas import StudentCreate, StudentImportRequest, StudentImportResponse, StudentResponse, StudentUpdate
+from backend.utils.roster_cache import etag_matches, roster_cache
+from backend.utils.student_import import import_students, parse_csv, parse_json
 
 router = APIRouter(
     prefix="/students",
@@ -31,6 +34,7 @@ def update_student(
 
     db.commit()
     db.refresh(db_student)
+    roster_cache.invalidate()
     return db_student
 
 
@@ -41,10 +45,44 @@ def create_student(student: StudentCreate, db: Session = Depends(get_db)):
     db.add(new_student)
     db.commit()
     db.refresh(new_student)
+    roster_cache.invalidate()
     return new_student
 
 
+# 학생 일괄 등록/수정 (요일별 스케줄 포함, 행마다 결과)
+@router.post("/import", response_model=StudentImportResponse)
+def import_students_json(payload: StudentImportRequest, db: Session = Depends(get_db)):
+    return import_students(
+        db, parse_json(payload.students),
+        replace_schedules=payload.replace_schedules, dry_run=payload.dry_run
+    )
+
+
+# 같은 내용을 CSV로 (본문에 CSV 그대로, Content-Type: text/csv)
+@router.post("/import/csv", response_model=StudentImportResponse)
+def import_students_csv(
+    body: str = Body(..., media_type="text/csv"),
+    replace_schedules: bool = False,
+    dry_run: bool = False,
+    db: Session = Depends(get_db)
+):
+    try:
+        rows = parse_csv(body)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return import_students(db, rows, replace_schedules=replace_schedules, dry_run=dry_run)
+
+
 # 학생 목록 조회
+# 명단은 캐시에서 바로 내려주고, 브라우저가 가진 것과 같으면(If-None-Match) 304
 @router.get("/", response_model=list[StudentResponse])
-def get_students(db: Session = Depends(get_db)):
-    return db.query(Student).all()
+def get_students(
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    body, etag = roster_cache.students_json(db)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, HTTPException
+
+from backend.schemas import LoggingLevelUpdate
+from backend.utils.log import ROOT_LOGGER, logger_levels, set_level
+from backend.utils.providers import providers
+
+router = APIRouter(prefix="/_system", tags=["System"])
+
+
+# -------------------------
+# 로그 레벨 조회 / 변경 (서버 재시작 없이 디버그 로그 켜기)
+# -------------------------
+@router.get("/logging")
+def get_logging_levels():
+    return logger_levels()
+
+
+@router.put("/logging")
+def update_logging_level(payload: LoggingLevelUpdate):
+    if payload.logger != ROOT_LOGGER and not payload.logger.startswith(ROOT_LOGGER + "."):
+        raise HTTPException(status_code=400, detail="backend 로거만 변경할 수 있습니다")
+
+    set_level(payload.logger, payload.level)
+    return logger_levels()
+
+
+# -------------------------
+# 지연 로딩 상태 (Playwright / Jinja / Pillow / 문자 업체 클라이언트)
+# -------------------------
+@router.get("/providers")
+def get_providers():
+    return providers.snapshot()
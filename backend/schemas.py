@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+import datetime as dt
 from datetime import date, time, datetime
-from typing import List, Optional
+from typing import Any, List, Literal, Optional
 
 # --------------------
 # 학생 관련
@@ -39,6 +40,42 @@ class StudentScheduleResponse(BaseModel):
         from_attributes = True
 
 
+# 학생 일괄 등록 (학기 초 명단 + 요일별 스케줄)
+class StudentImportSchedule(BaseModel):
+    weekday: int = Field(ge=0, le=6)
+    expected_time: time
+
+class StudentImportRow(BaseModel):
+    id: Optional[int] = None  # 있으면 그 학생을 수정, 없으면 이름+연락처(또는 이름+학년)로 찾아서 수정/등록
+    name: str = Field(min_length=1)
+    grade: str = Field(min_length=1)
+    parent_phone: Optional[str] = None
+    schedules: List[StudentImportSchedule] = []
+
+class StudentImportRequest(BaseModel):
+    # 행마다 따로 검사해서 오류를 알려주므로 여기서는 형식을 검사하지 않음 (StudentImportRow)
+    students: List[Any]
+    replace_schedules: bool = False  # True면 파일에 없는 요일 스케줄은 삭제
+    dry_run: bool = False            # True면 검사만 하고 저장하지 않음
+
+class StudentImportItem(BaseModel):
+    row: int
+    ok: bool
+    action: Optional[Literal["created", "updated"]] = None
+    student_id: Optional[int] = None
+    name: Optional[str] = None
+    schedules: int = 0
+    error: Optional[str] = None
+
+class StudentImportResponse(BaseModel):
+    total: int
+    created: int
+    updated: int
+    failed: int
+    dry_run: bool
+    items: List[StudentImportItem]
+
+
 # --------------------
 # 출석 관련
 # --------------------
@@ -61,6 +98,69 @@ class AttendanceResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class AttendanceBulkRequest(BaseModel):
+    records: List[AttendanceCreate]
+
+class AttendanceBulkItem(BaseModel):
+    student_id: int
+    date: date
+    ok: bool
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+class AttendanceBulkResponse(BaseModel):
+    total: int
+    saved: int
+    failed: int
+    items: List[AttendanceBulkItem]
+
+class AttendanceMarkScheduledRequest(BaseModel):
+    date: date
+    status: Literal["present", "absent"]
+    check_in: Optional[time] = None    # present일 때 비우면 각 학생의 예정 시간
+    overwrite: bool = False            # True면 이미 출석 기록이 있는 학생도 덮어씀
+
+class AttendanceMarkScheduledItem(BaseModel):
+    student_id: int
+    id: int
+
+class AttendanceMarkScheduledResponse(BaseModel):
+    date: date
+    status: str
+    saved: int
+    items: List[AttendanceMarkScheduledItem]
+
+# 출석 통계 (attendance_monthly 집계만 읽음)
+class AttendanceStats(BaseModel):
+    present: int  # 출석 (지각 포함)
+    late: int
+    absent: int
+    attendance_rate: Optional[float] = None  # present / (present + absent), 기록이 없으면 null
+    average_late_minutes: Optional[float] = None  # 지각한 날 평균 몇 분 늦었는지
+
+class AttendanceMonthStats(AttendanceStats):
+    month: str  # "YYYY-MM"
+
+class AttendanceStudentStats(AttendanceStats):
+    student_id: int
+    name: str
+    grade: str
+
+class AttendanceGradeStats(AttendanceStats):
+    grade: str
+    month: str
+    students: int  # 그 달 출석 기록이 있는 학생 수
+
+class AttendanceMonthlyReport(BaseModel):
+    month: str
+    total: AttendanceStats
+    students: List[AttendanceStudentStats]
+
+class AttendanceStudentReport(BaseModel):
+    student_id: int
+    total: AttendanceStats
+    months: List[AttendanceMonthStats]  # 오래된 달부터
+
 
 # --------------------
 # 학생 일지
@@ -84,6 +184,7 @@ class ConsultationCreate(BaseModel):
     student_grade: str  # 학생 학년 (직접 입력)
     date: date
     time: time
+    duration_minutes: Optional[int] = None  # 비우면 CONSULTATION_DEFAULT_MINUTES
     parent_name: Optional[str] = None
     content: Optional[str] = None
     notes: Optional[str] = None
@@ -93,8 +194,10 @@ class ConsultationUpdate(BaseModel):
     student_id: Optional[int] = None
     student_name: Optional[str] = None
     student_grade: Optional[str] = None
-    date: Optional[date] = None
-    time: Optional[time] = None
+    # 필드 이름과 타입 이름이 같으면 pydantic이 타입을 None으로 읽으므로 dt.date / dt.time 으로 지정
+    date: Optional[dt.date] = None
+    time: Optional[dt.time] = None
+    duration_minutes: Optional[int] = None
     parent_name: Optional[str] = None
     content: Optional[str] = None
     notes: Optional[str] = None
@@ -107,16 +210,51 @@ class ConsultationResponse(BaseModel):
     student_grade: str
     date: date
     time: time
+    duration_minutes: int
     parent_name: Optional[str] = None
     content: Optional[str] = None
     notes: Optional[str] = None
     status: str
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    conflict_ids: List[int] = []  # allow_overlap=true로 저장했을 때 겹치는 예정 상담
 
     class Config:
         from_attributes = True
 
+class ConsultationPage(BaseModel):
+    items: List[ConsultationResponse]
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달 (마지막 페이지면 null)
+
+class ConsultationSlot(BaseModel):
+    id: int
+    time: time
+    duration_minutes: int
+    student_name: str
+    status: str
+
+class ConsultationCalendarDay(BaseModel):
+    date: date
+    count: int
+    scheduled: int
+    completed: int
+    cancelled: int
+    slots: List[ConsultationSlot]  # 시간순
+
+class ConsultationCalendar(BaseModel):
+    month: str  # "YYYY-MM"
+    total: int
+    days: List[ConsultationCalendarDay]  # 상담이 있는 날만
+
+class ConsultationFreeSlot(BaseModel):
+    date: date
+    start: time
+    end: time
+
+class ConsultationFreeSlots(BaseModel):
+    duration_minutes: int
+    slots: List[ConsultationFreeSlot]  # 빠른 순
+
 class DailyLogCreate(BaseModel):
     student_id: int
     date: date
@@ -176,3 +314,103 @@ class DailyLogResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class DailyLogPage(BaseModel):
+    items: List[DailyLogResponse]
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달 (마지막 페이지면 null)
+
+
+# --------------------
+# 리포트 이미지 작업
+# --------------------
+
+class ReportBatchRequest(BaseModel):
+    date: date
+    grade: Optional[str] = None
+
+class ReportBatchItem(BaseModel):
+    log_id: int
+    student_id: int
+    student_name: str
+    image_url: Optional[str] = None
+    error: Optional[str] = None
+
+class ReportBatchResponse(BaseModel):
+    date: date
+    grade: Optional[str] = None
+    total: int
+    rendered: int
+    failed: int
+    items: List[ReportBatchItem]
+
+class ReportJobCreate(BaseModel):
+    daily_log_id: int
+
+class ReportJobResponse(BaseModel):
+    id: int
+    daily_log_id: int
+    status: str  # queued, running, done, failed
+    image_url: Optional[str] = None
+    error: Optional[str] = None
+    attempts: int
+    next_attempt_at: Optional[datetime] = None  # 실패 후 재시도 예정 시각
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+# --------------------
+# 문자 발송
+# --------------------
+
+class SmsAbsentRequest(BaseModel):
+    student_ids: List[int]
+    send_date: Optional[date] = None   # 어느 날짜의 미등원 문자인지 (비우면 오늘)
+    content: Optional[str] = None      # 비우면 기본 문구, {name}은 학생 이름으로 바뀜
+
+class SmsEnqueueItem(BaseModel):
+    student_id: int
+    ok: bool
+    id: Optional[int] = None
+    status: Optional[str] = None
+    duplicate: bool = False            # 같은 날 이미 보낸(보내는 중인) 문자
+    error: Optional[str] = None
+
+class SmsEnqueueResponse(BaseModel):
+    total: int
+    queued: int
+    duplicate: int
+    failed: int
+    items: List[SmsEnqueueItem]
+
+class SmsMessageResponse(BaseModel):
+    id: int
+    kind: str
+    student_id: Optional[int] = None
+    send_date: date
+    phone: str
+    body: str
+    status: str  # queued, sending, sent, failed
+    attempts: int
+    next_attempt_at: Optional[datetime] = None
+    provider: Optional[str] = None
+    provider_message_id: Optional[str] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    sent_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+# --------------------
+# 시스템 (로그 설정)
+# --------------------
+
+class LoggingLevelUpdate(BaseModel):
+    logger: str = "backend"  # 예: backend.routers.attendance
+    level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", "NOTSET"]
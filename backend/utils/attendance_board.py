@@ -0,0 +1,133 @@
+import logging
+from collections import namedtuple
+from datetime import date, time
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from backend.models import Attendance
+from backend.utils.roster_cache import roster_cache
+
+logger = logging.getLogger(__name__)
+
+RosterRow = namedtuple("RosterRow", "id name parent_phone expected_time status check_in")
+
+
+def load_roster_status(db: Session, target_date: date, student_ids=None):
+    """
+    학생 전체(또는 student_ids만) + 해당 날짜 출석 기록 + 해당 요일 예정 시간
+    학생 명단 / 요일별 예정 시간은 roster_cache에서, 출석만 날짜 인덱스로 한 번 조회
+    """
+    students = roster_cache.students(db)
+    expected_times = roster_cache.expected_times(db, target_date.weekday())
+
+    query = db.query(Attendance.student_id, Attendance.status, Attendance.check_in).filter(
+        Attendance.date == target_date
+    )
+    if student_ids is not None:
+        student_ids = set(student_ids)
+        students = [student for student in students if student["id"] in student_ids]
+        query = query.filter(Attendance.student_id.in_(student_ids))
+    attendance = {row.student_id: row for row in query}
+
+    rows = []
+    for student in students:
+        record = attendance.get(student["id"])
+        rows.append(RosterRow(
+            student["id"],
+            student["name"],
+            student["parent_phone"],
+            expected_times.get(student["id"]),
+            record.status if record else None,
+            record.check_in if record else None,
+        ))
+    return rows
+
+
+def decide_status(
+    now: time,
+    expected_time: Optional[time],
+    attendance_status: Optional[str],
+    check_in: Optional[time],
+) -> str:
+    # check_in이 있으면 출석 (예정 시간과 관계없이)
+    if check_in is not None:
+        return "present"
+
+    # 출석 기록이 있지만 check_in이 없는 경우 (status가 "absent"인 경우)
+    if attendance_status == "absent":
+        return "late_or_absent"
+
+    # 출석 기록이 없고, 예정 시간이 지났으면 지각/결석으로 간주
+    if expected_time is not None and now >= expected_time:
+        return "late_or_absent"
+
+    # 그 외의 경우는 미확인
+    return "unchecked"
+
+
+def board_entry(row: RosterRow, status: str):
+    """출석 현황 화면의 학생 한 명 (GET /attendance/today, SSE 공통)"""
+    return {
+        "student_id": row.id,
+        "name": row.name,
+        "expected_time": row.expected_time.strftime("%H:%M") if row.expected_time else None,
+        "check_in": row.check_in.strftime("%H:%M") if row.check_in else None,
+        "status": status
+    }
+
+
+def board_entries(db: Session, today: date, now: time, student_ids):
+    """일부 학생의 현재 출석 현황 (실시간 갱신용)"""
+    return [
+        board_entry(row, decide_status(now, row.expected_time, row.status, row.check_in))
+        for row in load_roster_status(db, today, student_ids)
+    ]
+
+
+def build_today_board(db: Session, today: date, now: time):
+    """오늘 출석 현황 (학생별 상태 + 요약 카운트)"""
+    summary = {"present": 0, "late_or_absent": 0, "unchecked": 0}
+    students = []
+    # 학생별 디버그 로그는 켜져 있을 때만 (꺼져 있으면 학생마다 로그 호출도 하지 않음)
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    for row in load_roster_status(db, today):
+        status = decide_status(now, row.expected_time, row.status, row.check_in)
+        summary[status] += 1
+
+        if debug:
+            logger.debug(
+                "학생 %s(%s): 예정=%s 출석=%s check_in=%s → %s",
+                row.id, row.name, row.expected_time, row.status, row.check_in, status
+            )
+
+        students.append(board_entry(row, status))
+
+    return {
+        "date": today,
+        "now": now,
+        "summary": summary,
+        "students": students
+    }
+
+
+def find_absent_students(db: Session, today: date, now: time):
+    """오늘 예정 시간이 지났는데 아직 등원하지 않은 학생 (문자 대상)"""
+    result = []
+
+    for row in load_roster_status(db, today):
+        if row.expected_time is None:
+            continue  # 오늘 안 오는 학생
+
+        if row.check_in is not None:
+            continue  # 이미 출석
+
+        if now >= row.expected_time:
+            result.append({
+                "student_id": row.id,
+                "name": row.name,
+                "parent_phone": row.parent_phone
+            })
+
+    return result
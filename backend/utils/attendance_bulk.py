@@ -0,0 +1,107 @@
+from datetime import date, time
+from typing import Optional
+
+from sqlalchemy import Date, Time, literal, null, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from backend.models import Attendance, Student, StudentSchedule
+from backend.utils.attendance_rollup import refresh_rollups
+
+# 한 INSERT 문에 넣을 최대 행 수 (SQLite 바인딩 변수 개수 제한 대비)
+UPSERT_CHUNK_SIZE = 200
+
+
+def _upsert_statement(stmt):
+    """(student_id, date) 유니크 제약(uix_student_date)에 걸리면 상태/시간만 갱신"""
+    return stmt.on_conflict_do_update(
+        index_elements=[Attendance.student_id, Attendance.date],
+        set_={
+            "status": stmt.excluded.status,
+            "check_in": stmt.excluded.check_in,
+            "check_out": stmt.excluded.check_out,
+        }
+    ).returning(Attendance.id, Attendance.student_id, Attendance.date)
+
+
+def bulk_upsert_attendance(db: Session, records):
+    """
+    출석 여러 건을 한 트랜잭션에서 저장 (INSERT ... ON CONFLICT DO UPDATE)
+    records: AttendanceCreate 목록
+    반환: 요청 순서대로 {"student_id", "date", "ok", "id", "error"}
+    """
+    student_ids = {r.student_id for r in records}
+    existing_students = {
+        row.id for row in db.query(Student.id).filter(Student.id.in_(student_ids))
+    } if student_ids else set()
+
+    # 같은 학생/날짜가 여러 번 있으면 마지막 값으로 저장
+    rows = {}
+    for r in records:
+        if r.student_id in existing_students:
+            rows[(r.student_id, r.date)] = {
+                "student_id": r.student_id,
+                "date": r.date,
+                "status": r.status,
+                "check_in": r.check_in,
+                "check_out": r.check_out,
+            }
+
+    saved = {}
+    values = list(rows.values())
+    for i in range(0, len(values), UPSERT_CHUNK_SIZE):
+        stmt = _upsert_statement(insert(Attendance).values(values[i:i + UPSERT_CHUNK_SIZE]))
+        for row in db.execute(stmt):
+            saved[(row.student_id, row.date)] = row.id
+    refresh_rollups(db, saved.keys())
+    db.commit()
+
+    results = []
+    for r in records:
+        if r.student_id not in existing_students:
+            results.append({"student_id": r.student_id, "date": r.date, "ok": False, "id": None, "error": "학생 없음"})
+        else:
+            results.append({"student_id": r.student_id, "date": r.date, "ok": True, "id": saved.get((r.student_id, r.date)), "error": None})
+    return results
+
+
+def mark_scheduled_students(
+    db: Session,
+    target_date: date,
+    status: str,
+    check_in: Optional[time] = None,
+    overwrite: bool = False
+):
+    """
+    해당 요일에 스케줄이 있는 학생 전체를 한 번에 출석/결석 처리 (INSERT ... SELECT)
+    - present: check_in을 주지 않으면 각자의 예정 시간으로 기록
+    - overwrite=False면 이미 출석 기록이 있는 학생은 건드리지 않음
+    반환: 저장된 [{"student_id", "id"}]
+    """
+    if status == "present":
+        check_in_expr = literal(check_in, Time) if check_in else StudentSchedule.expected_time
+    else:
+        check_in_expr = null()
+
+    source = select(
+        StudentSchedule.student_id,
+        literal(target_date, Date),
+        literal(status),
+        check_in_expr,
+        null(),
+    ).where(StudentSchedule.weekday == target_date.weekday())
+
+    stmt = insert(Attendance).from_select(
+        ["student_id", "date", "status", "check_in", "check_out"], source
+    )
+    if overwrite:
+        stmt = _upsert_statement(stmt)
+    else:
+        stmt = stmt.on_conflict_do_nothing(
+            index_elements=[Attendance.student_id, Attendance.date]
+        ).returning(Attendance.id, Attendance.student_id, Attendance.date)
+
+    saved = [{"student_id": row.student_id, "id": row.id} for row in db.execute(stmt)]
+    refresh_rollups(db, [(row["student_id"], target_date) for row in saved])
+    db.commit()
+    return sorted(saved, key=lambda row: row["student_id"])
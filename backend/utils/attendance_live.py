@@ -0,0 +1,178 @@
+"""
+실시간 출석 현황 (SSE)
+
+GET /api/attendance/stream 에 연결한 모든 기기(선생님 PC/태블릿)에 출석 현황 변경을 보냅니다.
+- 연결 직후: snapshot (GET /attendance/today 와 같은 형식)
+- 출석이 저장될 때: student (바뀐 학생 한 명, 출석 현황의 students 항목과 같은 형식)
+- 예정 시간이 지났는데 등원하지 않은 학생: student (status = late_or_absent)
+- 날짜가 바뀌면: snapshot
+
+이벤트는 프로세스 안에서만 전달됩니다. uvicorn 워커를 여러 개 띄우면 다른 워커에서 저장한
+출석은 그 워커에 연결된 기기에만 바로 보이므로, 실시간 현황을 쓸 때는 워커 1개로 실행하세요.
+"""
+import asyncio
+import json
+import logging
+import os
+from datetime import date, datetime, time
+
+from backend.database import SessionLocal
+from backend.utils.attendance_board import board_entries, build_today_board
+from backend.utils.roster_cache import roster_cache
+
+# 연결 유지를 위한 keep-alive 간격 (초)
+SSE_KEEPALIVE_SECONDS = 15
+# 기기 하나에 쌓일 수 있는 이벤트 수 (넘으면 연결을 끊고, 다시 연결할 때 snapshot을 받음)
+ATTENDANCE_STREAM_QUEUE_SIZE = int(os.getenv("ATTENDANCE_STREAM_QUEUE_SIZE", "256"))
+# 예정 시간 확인 최대 간격 (초) - 스케줄이 바뀌거나 날짜가 넘어가는 것도 이 간격 안에 반영
+DEADLINE_CHECK_MAX_SECONDS = 60
+
+logger = logging.getLogger(__name__)
+
+
+class _Subscriber:
+    def __init__(self):
+        self.queue = asyncio.Queue(maxsize=ATTENDANCE_STREAM_QUEUE_SIZE)
+        self.dropped = False
+
+
+class AttendanceBroadcaster:
+    def __init__(self):
+        self._loop = None
+        self._subscribers = set()
+        self._seq = 0
+        self._task = None
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    async def start(self):
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._task = asyncio.create_task(self._deadline_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for subscriber in self._subscribers:
+            subscriber.dropped = True
+        self._subscribers.clear()
+
+    # -------------------------
+    # 이벤트 보내기
+    # -------------------------
+    def _broadcast(self, event: str, data):
+        """이벤트 루프에서만 호출"""
+        self._seq += 1
+        message = f"id: {self._seq}\nevent: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # 너무 느린 기기는 끊음 (다시 연결하면 snapshot부터 받음)
+                subscriber.dropped = True
+                self._subscribers.discard(subscriber)
+
+    def publish_students(self, db, target_date: date, student_ids):
+        """
+        출석 저장 후 호출 (동기 엔드포인트 스레드에서 호출 가능)
+        오늘 날짜이고 연결된 기기가 있을 때만 바뀐 학생들의 현재 상태를 계산해서 보냄
+        """
+        if not self._subscribers or self._loop is None:
+            return
+        now = datetime.now()
+        if target_date != now.date():
+            return
+
+        entries = board_entries(db, target_date, now.time(), student_ids)
+        for entry in entries:
+            self._loop.call_soon_threadsafe(self._broadcast, "student", entry)
+
+    # -------------------------
+    # SSE 스트림
+    # -------------------------
+    async def events(self):
+        subscriber = _Subscriber()
+        # 먼저 구독하고 snapshot을 보내야 그 사이에 저장된 출석을 놓치지 않음
+        self._subscribers.add(subscriber)
+        try:
+            snapshot = await asyncio.to_thread(_load_snapshot)
+            self._seq += 1
+            yield f"id: {self._seq}\nevent: snapshot\ndata: {json.dumps(snapshot, ensure_ascii=False, default=str)}\n\n"
+
+            while not subscriber.dropped:
+                try:
+                    message = await asyncio.wait_for(subscriber.queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield message
+        finally:
+            self._subscribers.discard(subscriber)
+
+    # -------------------------
+    # 예정 시간이 지난 학생 (시간 기반 이벤트)
+    # -------------------------
+    async def _deadline_loop(self):
+        day = date.today()
+        checked = datetime.now().time()
+
+        while True:
+            try:
+                now = datetime.now()
+                if now.date() != day:
+                    day = now.date()
+                    checked = time.min
+                    if self._subscribers:
+                        self._broadcast("snapshot", await asyncio.to_thread(_load_snapshot))
+
+                expected_times = await asyncio.to_thread(_load_expected_times, day)
+                due = [
+                    student_id for student_id, expected in expected_times.items()
+                    if checked < expected <= now.time()
+                ]
+                if due and self._subscribers:
+                    for entry in await asyncio.to_thread(_load_entries, day, now.time(), due):
+                        if entry["status"] == "late_or_absent":
+                            self._broadcast("student", entry)
+                checked = now.time()
+
+                # 다음 예정 시간까지 대기 (최대 DEADLINE_CHECK_MAX_SECONDS)
+                upcoming = [expected for expected in expected_times.values() if expected > checked]
+                wait = DEADLINE_CHECK_MAX_SECONDS
+                if upcoming:
+                    next_deadline = datetime.combine(day, min(upcoming))
+                    wait = min(wait, (next_deadline - datetime.now()).total_seconds())
+                await asyncio.sleep(max(wait, 0.05))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("출석 예정 시간 확인 중 오류")
+                await asyncio.sleep(DEADLINE_CHECK_MAX_SECONDS)
+
+
+def _with_session(fn, *args):
+    db = SessionLocal()
+    try:
+        return fn(db, *args)
+    finally:
+        db.close()
+
+
+def _load_snapshot():
+    now = datetime.now()
+    return _with_session(build_today_board, now.date(), now.time())
+
+
+def _load_expected_times(day: date):
+    return _with_session(roster_cache.expected_times, day.weekday())
+
+
+def _load_entries(day: date, now, student_ids):
+    return _with_session(board_entries, day, now, student_ids)
+
+
+attendance_live = AttendanceBroadcaster()
@@ -0,0 +1,147 @@
+"""
+학생별 월간 출석 집계 (attendance_monthly)
+
+통계 API가 attendance 전체를 읽지 않도록 (학생, 월)마다 출석/지각/결석 수와 지각한 분을 미리 모아 둡니다.
+- 출석을 저장할 때(단건 / 일괄 / 요일 전체 처리) 바뀐 (학생, 월)만 attendance에서 다시 계산해서
+  같은 트랜잭션 안에서 교체 (학생 한 명의 한 달은 최대 31행, uix_student_date 인덱스로 읽음)
+- 지각: status가 present이고 check_in이 그 요일 예정 시간(StudentSchedule.expected_time)보다 늦은 경우
+  (출석 현황 화면과 같은 기준, 분 단위) / 예정 시간은 다시 계산하는 시점의 스케줄 기준
+- 집계가 어긋났거나 기준을 바꿨으면 다시 만들기 (프로젝트 루트에서):
+    python -m backend.utils.attendance_rollup               # 전체
+    python -m backend.utils.attendance_rollup --from 2025-03 # 해당 월부터
+"""
+import argparse
+import time as timer
+from collections import defaultdict
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Integer, and_, bindparam, case, cast, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from backend.models import Attendance, AttendanceMonthly, StudentSchedule
+
+# 한 문장에서 다시 계산할 최대 학생 수 (SQLite 바인딩 변수 개수 제한 대비)
+ROLLUP_CHUNK_SIZE = 500
+
+ROLLUP_COLUMNS = ["student_id", "month", "present", "late", "absent", "late_minutes"]
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def next_month(value: date) -> date:
+    return date(value.year + value.month // 12, value.month % 12 + 1, 1)
+
+
+def _minutes(column):
+    # Time 컬럼은 "HH:MM:SS.ffffff" 문자열로 저장됨
+    return cast(func.substr(column, 1, 2), Integer) * 60 + cast(func.substr(column, 4, 2), Integer)
+
+
+def _rollup_source(*conditions):
+    """attendance → (student_id, 그 달 1일)별 집계 SELECT"""
+    # strftime('%w')는 일요일=0, StudentSchedule.weekday는 월요일=0
+    weekday = (cast(func.strftime("%w", Attendance.date), Integer) + 6) % 7
+    late_by = _minutes(Attendance.check_in) - _minutes(StudentSchedule.expected_time)
+    # check_in이나 예정 시간이 없으면 late_by가 NULL → 지각 아님
+    is_late = and_(Attendance.status == "present", late_by > 0)
+    month = func.date(Attendance.date, "start of month")
+
+    return (
+        select(
+            Attendance.student_id,
+            month,
+            func.sum(case((Attendance.status == "present", 1), else_=0)),
+            func.sum(case((is_late, 1), else_=0)),
+            func.sum(case((Attendance.status == "absent", 1), else_=0)),
+            func.sum(case((is_late, late_by), else_=0)),
+        )
+        .select_from(Attendance)
+        .outerjoin(StudentSchedule, and_(
+            StudentSchedule.student_id == Attendance.student_id,
+            StudentSchedule.weekday == weekday
+        ))
+        .where(*conditions)
+        .group_by(Attendance.student_id, month)
+    )
+
+
+def _insert(source):
+    # sqlite 방언의 insert(ON CONFLICT용)는 컴파일 캐시가 되지 않아 매번 수 ms가 걸리므로
+    # 기존 집계를 지우고 표준 INSERT ... SELECT로 다시 넣음 (같은 트랜잭션)
+    # (ORM 엔티티가 아니라 테이블에 대한 문장이어야 Session.execute가 파라미터를 bulk insert 행으로 보지 않음)
+    return insert(AttendanceMonthly.__table__).from_select(ROLLUP_COLUMNS, source)
+
+
+# 저장할 때마다 쓰는 문장은 한 번만 만들어 둠 (만드는 시간이 실행 시간만큼 걸림)
+_REFRESH_DELETE = delete(AttendanceMonthly.__table__).where(
+    AttendanceMonthly.student_id.in_(bindparam("student_ids", expanding=True)),
+    AttendanceMonthly.month == bindparam("month")
+)
+_REFRESH_INSERT = _insert(_rollup_source(
+    Attendance.student_id.in_(bindparam("student_ids", expanding=True)),
+    Attendance.date >= bindparam("month"),
+    Attendance.date < bindparam("until")
+))
+
+
+def refresh_rollups(db: Session, pairs):
+    """
+    출석을 저장한 (student_id, date) 목록의 월간 집계를 다시 계산 (커밋은 호출하는 쪽에서)
+    같은 달은 한 문장으로 묶어서 계산
+    """
+    students_by_month = defaultdict(set)
+    for student_id, day in pairs:
+        students_by_month[month_start(day)].add(student_id)
+
+    for month, student_ids in students_by_month.items():
+        student_ids = sorted(student_ids)
+        for i in range(0, len(student_ids), ROLLUP_CHUNK_SIZE):
+            params = {
+                "student_ids": student_ids[i:i + ROLLUP_CHUNK_SIZE],
+                "month": month,
+                "until": next_month(month),
+            }
+            db.execute(_REFRESH_DELETE, params)
+            db.execute(_REFRESH_INSERT, params)
+
+
+def rebuild_rollups(db, start_month: Optional[date] = None) -> int:
+    """
+    attendance 전체(또는 start_month부터)로 집계를 새로 만들고 만든 행 수 반환
+    db는 Session 또는 Connection (마이그레이션), 커밋은 호출하는 쪽에서
+    """
+    deleted = delete(AttendanceMonthly)
+    counted = select(func.count()).select_from(AttendanceMonthly)
+    conditions = []
+    if start_month:
+        start_month = month_start(start_month)
+        deleted = deleted.where(AttendanceMonthly.month >= start_month)
+        counted = counted.where(AttendanceMonthly.month >= start_month)
+        conditions.append(Attendance.date >= start_month)
+
+    db.execute(deleted)
+    db.execute(_insert(_rollup_source(*conditions)))
+    return db.execute(counted).scalar()
+
+
+if __name__ == "__main__":
+    from backend.database import SessionLocal
+    from backend.utils.log import setup_logging
+
+    parser = argparse.ArgumentParser(description="월간 출석 집계 다시 만들기")
+    parser.add_argument("--from", dest="start_month", help="YYYY-MM (비우면 전체)")
+    args = parser.parse_args()
+
+    setup_logging()
+    start = date.fromisoformat(f"{args.start_month}-01") if args.start_month else None
+    db = SessionLocal()
+    try:
+        started = timer.perf_counter()
+        rows = rebuild_rollups(db, start)
+        db.commit()
+        print(f"월간 출석 집계 {rows:,}행 생성 ({timer.perf_counter() - started:.1f}초)")
+    finally:
+        db.close()
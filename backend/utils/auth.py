@@ -0,0 +1,59 @@
+"""
+API 인증 (로그인 토큰 확인)
+
+main.py에서 /api/auth 를 뺀 모든 라우터에 dependencies=[Depends(require_auth)] 로 붙입니다.
+- 기본: Authorization: Bearer <토큰> 헤더
+- 헤더를 보낼 수 없는 요청(EventSource)은 ?token=<토큰> 도 허용
+  (주소의 토큰은 방문 기록/접속 로그에 남으므로 이미지/파일은 헤더를 붙여 받을 것)
+토큰 확인은 session_store의 메모리 캐시를 먼저 보고, 캐시에 없을 때만 스레드에서 DB를 읽습니다
+(async 의존성이라 캐시에 있으면 스레드 전환 없이 바로 통과).
+"""
+import asyncio
+
+from fastapi import HTTPException, Request, status
+
+from backend.utils.session_store import SESSION_EXPIRED, session_store
+
+_UNAUTHORIZED_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+
+def request_token(request: Request):
+    # request.headers(Headers 객체 생성)보다 ASGI scope의 헤더 목록을 바로 보는 편이 훨씬 빠름
+    # (ASGI 헤더 이름은 항상 소문자)
+    for name, value in request.scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                return token.strip()
+            break
+    return request.query_params.get("token")
+
+
+async def require_auth(request: Request):
+    """로그인한 요청이 아니면 401, 세션은 request.state.session 에 저장"""
+    token = request_token(request)
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증이 필요합니다",
+            headers=_UNAUTHORIZED_HEADERS
+        )
+
+    found, session = session_store.get_cached(token)
+    if not found:
+        session = await asyncio.to_thread(session_store.get, token)
+    if session is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증이 필요합니다",
+            headers=_UNAUTHORIZED_HEADERS
+        )
+    if session == SESSION_EXPIRED:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="세션이 만료되었습니다",
+            headers=_UNAUTHORIZED_HEADERS
+        )
+
+    request.state.session = session
+    return session
@@ -0,0 +1,181 @@
+"""
+상담 일정 충돌 확인 / 빈 시간 찾기
+
+- 상담은 [시작, 시작 + duration_minutes) 구간을 차지하고, status가 scheduled인 상담끼리만 겹침을 검사
+- 날짜별로 예정 상담 구간을 시작 시간순으로 정렬해 둔 DaySchedule을 메모리(LRU)에 보관
+  → 겹침 확인은 이분 탐색, 빈 시간 찾기는 날짜별 구간 사이의 틈만 훑음 (몇 년 치 이력이 있어도 조회 범위만 읽음)
+- 상담을 저장/삭제하면 invalidate(날짜)로 그 날짜만 비움
+- 저장 전 충돌 확인은 항상 DB에서 그 날짜를 다시 읽음 (fresh=True), 빈 시간 찾기만 캐시를 씀
+  → uvicorn 워커가 여러 개면 다른 워커에서 잡은 상담이 빈 시간 목록에 최대 CONSULTATION_SCHEDULE_CACHE_TTL초 늦게 반영됨
+- 같은 워커 안에서는 booking_lock으로 "충돌 확인 → 저장"을 한 번에 하나씩 실행
+
+캐시에는 ORM 객체가 아니라 정수 목록만 넣습니다.
+"""
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy.orm import Session
+
+from backend.models import Consultation
+from backend.utils.roster_cache import TTLCache
+
+# 상담 길이 (분): 비워서 저장하면 기본값, 허용 범위 밖이면 400
+CONSULTATION_DEFAULT_MINUTES = int(os.getenv("CONSULTATION_DEFAULT_MINUTES", "30"))
+CONSULTATION_MIN_MINUTES = int(os.getenv("CONSULTATION_MIN_MINUTES", "10"))
+CONSULTATION_MAX_MINUTES = int(os.getenv("CONSULTATION_MAX_MINUTES", "180"))
+# 빈 시간 찾기에서 쓰는 상담 가능 시간대와 시작 시간 간격
+CONSULTATION_OPEN = time.fromisoformat(os.getenv("CONSULTATION_OPEN", "10:00"))
+CONSULTATION_CLOSE = time.fromisoformat(os.getenv("CONSULTATION_CLOSE", "22:00"))
+CONSULTATION_SLOT_STEP_MINUTES = int(os.getenv("CONSULTATION_SLOT_STEP_MINUTES", "10"))
+CONSULTATION_SCHEDULE_CACHE_TTL = float(os.getenv("CONSULTATION_SCHEDULE_CACHE_TTL", "30"))
+CONSULTATION_SCHEDULE_CACHE_MAX_DAYS = int(os.getenv("CONSULTATION_SCHEDULE_CACHE_MAX_DAYS", "400"))
+
+# 빈 시간 찾기에서 캐시에 없는 날짜를 한 번에 읽어오는 단위 (일)
+_LOAD_WINDOW_DAYS = 31
+_DAY_MINUTES = 24 * 60
+
+
+def to_minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def from_minutes(minutes: int) -> time:
+    return time(minutes // 60, minutes % 60)
+
+
+class DaySchedule:
+    """하루치 예정 상담 구간 (분 단위, 시작 시간순)"""
+
+    __slots__ = ("starts", "ends", "ids", "max_length")
+
+    def __init__(self, intervals):
+        intervals = sorted(intervals)  # [(시작, 끝, id)]
+        self.starts = [start for start, _, _ in intervals]
+        self.ends = [end for _, end, _ in intervals]
+        self.ids = [consultation_id for _, _, consultation_id in intervals]
+        self.max_length = max((end - start for start, end, _ in intervals), default=0)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def overlapping(self, start: int, end: int, exclude_id=None):
+        """[start, end)와 겹치는 상담 [(시작, 끝, id)]"""
+        # 겹치려면 시작 < end 이고 끝 > start → 시작이 (start - 가장 긴 상담 길이, end) 안에 있는 것만 확인
+        lo = bisect_right(self.starts, start - self.max_length)
+        hi = bisect_left(self.starts, end)
+        return [
+            (self.starts[i], self.ends[i], self.ids[i])
+            for i in range(lo, hi)
+            if self.ends[i] > start and self.ids[i] != exclude_id
+        ]
+
+    def free_starts(self, length: int, open_at: int, close_at: int, step: int):
+        """open_at ~ close_at 안에서 length분이 비어 있는 시작 시간(분)을 순서대로"""
+        cursor = open_at
+        for start, end in zip(self.starts, self.ends):
+            if end <= cursor:
+                continue
+            yield from _aligned_starts(cursor, min(start, close_at), length, step)
+            cursor = max(cursor, end)
+            if cursor >= close_at:
+                return
+        yield from _aligned_starts(cursor, close_at, length, step)
+
+
+def _aligned_starts(gap_start: int, gap_end: int, length: int, step: int):
+    # 시작 시간은 자정 기준 step분 단위 (10:00, 10:10, ...)
+    minute = -(-gap_start // step) * step
+    while minute + length <= gap_end:
+        yield minute
+        minute += step
+
+
+_EMPTY_DAY = DaySchedule([])
+
+
+class ScheduleIndex:
+    def __init__(self, ttl=CONSULTATION_SCHEDULE_CACHE_TTL, max_days=CONSULTATION_SCHEDULE_CACHE_MAX_DAYS):
+        self._cache = TTLCache(ttl, max_days)
+        self.booking_lock = threading.Lock()
+
+    def invalidate(self, *days: date):
+        """상담을 저장/삭제한 뒤 해당 날짜(이전 날짜와 새 날짜)만 비움"""
+        for day in days:
+            if day is not None:
+                self._cache.discard(day)
+
+    def day(self, db: Session, target: date, fresh: bool = False) -> DaySchedule:
+        if fresh:
+            self._cache.discard(target)
+        return self._cache.get_or_load(target, lambda: self._load(db, target, target).get(target, _EMPTY_DAY))
+
+    def conflicts(self, db: Session, target: date, start: time, length: int, exclude_id=None):
+        """저장하려는 상담과 겹치는 예정 상담 [(시작, 끝, id)] (DB에서 그 날짜를 새로 읽음)"""
+        begin = to_minutes(start)
+        return self.day(db, target, fresh=True).overlapping(begin, begin + length, exclude_id)
+
+    def free_slots(
+        self,
+        db: Session,
+        start_date: date,
+        end_date: date,
+        length: int,
+        limit: int,
+        not_before: datetime = None,
+        open_at: time = CONSULTATION_OPEN,
+        close_at: time = CONSULTATION_CLOSE,
+        step: int = CONSULTATION_SLOT_STEP_MINUTES,
+    ):
+        """start_date ~ end_date 사이 가장 빠른 빈 시간 최대 limit개 [(날짜, 시작 분)]"""
+        slots = []
+        open_minutes, close_minutes = to_minutes(open_at), to_minutes(close_at)
+        for target, schedule in self._days(db, start_date, end_date):
+            day_open = open_minutes
+            if not_before is not None and target == not_before.date():
+                day_open = max(day_open, to_minutes(not_before.time()) + 1)
+            elif not_before is not None and target < not_before.date():
+                continue
+            for minute in schedule.free_starts(length, day_open, close_minutes, step):
+                slots.append((target, minute))
+                if len(slots) >= limit:
+                    return slots
+        return slots
+
+    def snapshot(self):
+        return {"days": len(self._cache), "hits": self._cache.hits, "misses": self._cache.misses}
+
+    def _days(self, db: Session, start_date: date, end_date: date):
+        """(날짜, DaySchedule)을 날짜순으로, 캐시에 없는 날짜는 _LOAD_WINDOW_DAYS일씩 한 번에 읽음"""
+        target = start_date
+        loaded = {}
+        loaded_until = None
+        while target <= end_date:
+            found, schedule = self._cache.peek(target)
+            if not found:
+                if loaded_until is None or target > loaded_until:
+                    loaded_until = min(target + timedelta(days=_LOAD_WINDOW_DAYS - 1), end_date)
+                    loaded = self._load(db, target, loaded_until)
+                schedule = self._cache.get_or_load(target, lambda: loaded.get(target, _EMPTY_DAY))
+            yield target, schedule
+            target += timedelta(days=1)
+
+    @staticmethod
+    def _load(db: Session, start_date: date, end_date: date):
+        rows = db.query(
+            Consultation.id, Consultation.date, Consultation.time, Consultation.duration_minutes
+        ).filter(
+            Consultation.status == "scheduled",
+            Consultation.date >= start_date,
+            Consultation.date <= end_date
+        )
+        intervals = {}
+        for row in rows:
+            begin = to_minutes(row.time)
+            end = min(begin + (row.duration_minutes or CONSULTATION_DEFAULT_MINUTES), _DAY_MINUTES)
+            intervals.setdefault(row.date, []).append((begin, end, row.id))
+        return {target: DaySchedule(items) for target, items in intervals.items()}
+
+
+schedule_index = ScheduleIndex()
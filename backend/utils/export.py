@@ -0,0 +1,221 @@
+"""
+CSV / XLSX 내보내기 (스트리밍)
+
+몇 년 치를 내보내도 전체 결과를 메모리에 올리지 않도록
+- DB: 요청마다 전용 세션을 열고 yield_per로 EXPORT_FETCH_ROWS행씩 가져옴
+  (SQLite 커서는 fetchmany 할 때마다 다음 행을 읽으므로 결과 전체를 먼저 만들지 않음)
+- 파일: 행을 쓰는 대로 ChunkBuffer에 모았다가 EXPORT_CHUNK_ROWS행마다 bytes 조각으로 내보냄
+- XLSX: 외부 라이브러리 없이 시트 XML을 ZIP 항목에 바로 써 나감
+  (문자열은 inlineStr로 넣어서 sharedStrings 표를 만들지 않음 → 행 수와 상관없이 메모리 일정)
+
+내보내는 동안은 세션 하나가 같은 읽기 트랜잭션을 유지하므로 (WAL) 중간에 저장된 출석/상담은 섞이지 않습니다.
+"""
+import csv
+import os
+import re
+import zipfile
+from datetime import date, datetime, time
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+from fastapi.responses import StreamingResponse
+
+from backend.database import SessionLocal
+
+# DB에서 한 번에 가져올 행 수 / 응답 조각 하나에 담을 행 수
+EXPORT_FETCH_ROWS = int(os.getenv("EXPORT_FETCH_ROWS", "1000"))
+EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", "500"))
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# 엑셀에서 수식으로 실행될 수 있는 셀 (CSV만 해당, XLSX는 문자열 셀로 들어감)
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+# XML 1.0에 넣을 수 없는 제어 문자
+_XML_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_EXCEL_EPOCH = date(1899, 12, 30)
+
+
+class ChunkBuffer:
+    """csv.writer / ZipFile이 쓰는 내용을 모아뒀다가 조각(chunk)으로 내보내는 버퍼"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(data.encode("utf-8") if isinstance(data, str) else bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_query(stmt):
+    """전용 세션으로 stmt를 실행해서 행을 하나씩 (요청 세션은 응답을 보내기 전에 닫히므로 따로 엶)"""
+    db = SessionLocal()
+    try:
+        yield from db.execute(stmt.execution_options(yield_per=EXPORT_FETCH_ROWS))
+    finally:
+        db.close()
+
+
+# -------------------------
+# CSV
+# -------------------------
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "O" if value else "X"
+    if isinstance(value, time):
+        return value.strftime("%H:%M")
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def iter_csv(header, rows):
+    buffer = ChunkBuffer()
+    # BOM이 있어야 엑셀에서 한글이 깨지지 않음
+    buffer.write("\ufeff")
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for count, row in enumerate(rows, 1):
+        writer.writerow([_csv_value(value) for value in row])
+        if count % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.drain()
+    yield buffer.drain()
+
+
+# -------------------------
+# XLSX
+# -------------------------
+_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
+<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
+<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>
+</Types>"""
+
+_ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>"""
+
+_WORKBOOK = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>
+</workbook>"""
+
+_WORKBOOK_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+</Relationships>"""
+
+# 셀 서식: 0 기본, 1 날짜(yyyy-mm-dd), 2 시간(hh:mm), 3 날짜+시간, 4 머리글(굵게)
+_STYLES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<numFmts count="3"><numFmt numFmtId="164" formatCode="yyyy-mm-dd"/><numFmt numFmtId="165" formatCode="hh:mm"/><numFmt numFmtId="166" formatCode="yyyy-mm-dd hh:mm"/></numFmts>
+<fonts count="2"><font><sz val="11"/><name val="맑은 고딕"/></font><font><b/><sz val="11"/><name val="맑은 고딕"/></font></fonts>
+<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>
+<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>
+<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>
+<cellXfs count="5">
+<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>
+<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>
+<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>
+<xf numFmtId="166" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>
+<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>
+</cellXfs>
+</styleSheet>"""
+
+_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetViews><sheetView workbookViewId="0"><pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/></sheetView></sheetViews>'
+    "<sheetData>"
+)
+_SHEET_END = "</sheetData></worksheet>"
+
+
+def _column_letters(count: int):
+    letters = []
+    for index in range(1, count + 1):
+        name = ""
+        while index:
+            index, rest = divmod(index - 1, 26)
+            name = chr(65 + rest) + name
+        letters.append(name)
+    return letters
+
+
+def _xlsx_cell(ref: str, value, style: int = 0):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    # 날짜/시간은 엑셀 일련번호(1899-12-30부터 일 수)로 넣고 서식으로 표시
+    if isinstance(value, datetime):
+        serial = (value.replace(tzinfo=None) - datetime(1899, 12, 30)).total_seconds() / 86400
+        return f'<c r="{ref}" s="3"><v>{serial}</v></c>'
+    if isinstance(value, date):
+        return f'<c r="{ref}" s="1"><v>{(value - _EXCEL_EPOCH).days}</v></c>'
+    if isinstance(value, time):
+        seconds = value.hour * 3600 + value.minute * 60 + value.second
+        return f'<c r="{ref}" s="2"><v>{seconds / 86400}</v></c>'
+    text = escape(_XML_ILLEGAL.sub("", str(value)))
+    style_attr = f' s="{style}"' if style else ""
+    return f'<c r="{ref}" t="inlineStr"{style_attr}><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _xlsx_row(number: int, letters, values, style: int = 0):
+    cells = "".join(_xlsx_cell(f"{letter}{number}", value, style) for letter, value in zip(letters, values))
+    return f'<row r="{number}">{cells}</row>'
+
+
+def iter_xlsx(header, rows, sheet_name: str = "Sheet1"):
+    buffer = ChunkBuffer()
+    letters = _column_letters(len(header))
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _ROOT_RELS)
+        zf.writestr("xl/workbook.xml", _WORKBOOK.format(name=escape(sheet_name, {'"': "&quot;"})))
+        zf.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        zf.writestr("xl/styles.xml", _STYLES)
+        yield buffer.drain()
+
+        # 크기를 미리 알 수 없으므로 force_zip64 (4GB가 넘어도 깨지지 않게)
+        with zf.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            # 행마다 압축기를 부르지 않도록 EXPORT_CHUNK_ROWS행씩 모아서 씀
+            pending = [_SHEET_START, _xlsx_row(1, letters, header, style=4)]
+            for number, row in enumerate(rows, 2):
+                pending.append(_xlsx_row(number, letters, row))
+                if number % EXPORT_CHUNK_ROWS == 0:
+                    sheet.write("".join(pending).encode("utf-8"))
+                    pending.clear()
+                    yield buffer.drain()
+            pending.append(_SHEET_END)
+            sheet.write("".join(pending).encode("utf-8"))
+    yield buffer.drain()
+
+
+def export_response(filename: str, header, rows, fmt: str = "csv", sheet_name: str = "Sheet1"):
+    """rows(행 iterator)를 CSV 또는 XLSX로 흘려보내는 다운로드 응답"""
+    content = iter_xlsx(header, rows, sheet_name) if fmt == "xlsx" else iter_csv(header, rows)
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(f'{filename}.{fmt}')}"}
+    )
@@ -0,0 +1,96 @@
+"""
+백엔드 로그 설정
+
+- 모듈마다 logging.getLogger(__name__) 로 로거를 만들어 사용 (예: backend.routers.attendance)
+- 요청 처리 스레드는 QueueHandler로 큐에 넣기만 하고, 실제 출력은 QueueListener 스레드가 담당
+  (stdout/journald 쓰기 때문에 요청이 느려지지 않음)
+- 학생별 디버그 로그는 기본적으로 꺼져 있고, 실행 중에 로거별로 켜고 끌 수 있음
+  (PUT /api/_system/logging 또는 LOG_DEBUG_LOGGERS 환경 변수)
+
+디버그 로그는 반드시 logger.debug("... %s", 값) 처럼 인자를 넘기거나
+logger.isEnabledFor(logging.DEBUG) 로 감싸서, 꺼져 있을 때는 문자열을 만들지도 않게 합니다.
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+# 기본 로그 레벨 (DEBUG, INFO, WARNING, ERROR)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# 출력 형식: text(사람이 읽기 쉬운 한 줄) 또는 json(한 줄에 JSON 하나, 로그 수집기용)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+# 시작할 때부터 DEBUG로 둘 로거 (쉼표 구분, 예: backend.routers.attendance)
+LOG_DEBUG_LOGGERS = [name.strip() for name in os.getenv("LOG_DEBUG_LOGGERS", "").split(",") if name.strip()]
+
+ROOT_LOGGER = "backend"
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# LogRecord 기본 속성 (이 외의 속성은 extra={...}로 넘긴 구조화 필드)
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 한 건을 JSON 한 줄로 (extra로 넘긴 필드도 함께 기록)"""
+
+    def format(self, record):
+        data = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def _make_formatter():
+    if LOG_FORMAT == "json":
+        return JsonFormatter()
+    return logging.Formatter("%(asctime)s %(levelname)-7s %(name)s: %(message)s")
+
+
+def setup_logging():
+    """backend.* 로거에 큐 핸들러 연결 (여러 번 호출해도 한 번만 적용)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stderr)
+    output.setFormatter(_make_formatter())
+
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(LOG_LEVEL)
+    root.addHandler(QueueHandler(log_queue))
+    root.propagate = False  # uvicorn 기본 핸들러로 두 번 찍히지 않도록
+
+    for name in LOG_DEBUG_LOGGERS:
+        logging.getLogger(name).setLevel(logging.DEBUG)
+
+
+def set_level(name: str, level: str):
+    """실행 중 로거 레벨 변경 (level이 "NOTSET"이면 상위 로거 레벨을 따름)"""
+    logging.getLogger(name).setLevel(level.upper())
+
+
+def logger_levels():
+    """backend.* 로거 중 레벨이 직접 지정된 것들"""
+    levels = {ROOT_LOGGER: logging.getLevelName(logging.getLogger(ROOT_LOGGER).level)}
+    for name, logger in sorted(logging.Logger.manager.loggerDict.items()):
+        if name.startswith(ROOT_LOGGER + ".") and isinstance(logger, logging.Logger) and logger.level:
+            levels[name] = logging.getLevelName(logger.level)
+    return levels
@@ -0,0 +1,247 @@
+"""
+요청 처리 시간 / SQL 쿼리 수 측정
+
+- MetricsMiddleware: 요청마다 처리 시간과 그 요청에서 실행된 SQL 수/시간을 기록
+  응답에 Server-Timing 헤더를 붙이고 (브라우저 개발자 도구 Network 탭에서 확인 가능),
+  SLOW_REQUEST_MS보다 오래 걸린 요청은 경고 로그로 남김
+- instrument_engine(engine): SQLAlchemy 엔진 이벤트로 쿼리 수/시간을 현재 요청에 더함
+  (동기 엔드포인트는 스레드풀에서 실행되지만 contextvars가 복사되므로 같은 요청 통계에 합산됨)
+- render_prometheus(): /api/_metrics 에서 Prometheus 텍스트 형식으로 노출
+
+통계는 프로세스(uvicorn 워커)별로 따로 쌓입니다.
+"""
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+# 이 시간(ms)보다 오래 걸린 요청은 경고 로그
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "500"))
+# 0이면 측정 끔 (미들웨어는 그대로 요청만 넘김)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") == "1"
+
+# 히스토그램 구간 (초 / 쿼리 수)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+logger = logging.getLogger(__name__)
+
+
+class RequestStats:
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+_current = ContextVar("request_stats", default=None)
+
+
+class Histogram:
+    """누적 구간 히스토그램 (Prometheus histogram과 같은 형태)"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency = {}        # (method, route) -> Histogram
+        self.query_counts = {}   # (method, route) -> Histogram
+        self.db_seconds = {}     # (method, route) -> float
+        self.requests = {}       # (method, route, status) -> int
+
+    def record(self, method, route, status, seconds, stats: RequestStats):
+        key = (method, route)
+        with self._lock:
+            if key not in self.latency:
+                self.latency[key] = Histogram(LATENCY_BUCKETS)
+                self.query_counts[key] = Histogram(QUERY_COUNT_BUCKETS)
+                self.db_seconds[key] = 0.0
+            self.latency[key].observe(seconds)
+            self.query_counts[key].observe(stats.queries)
+            self.db_seconds[key] += stats.db_seconds
+            self.requests[key + (status,)] = self.requests.get(key + (status,), 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self.latency.clear()
+            self.query_counts.clear()
+            self.db_seconds.clear()
+            self.requests.clear()
+
+
+metrics = MetricsRegistry()
+
+
+# -------------------------
+# SQL 측정 (엔진 이벤트)
+# -------------------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # 시작 시각은 문장마다 있는 실행 컨텍스트에 둠 (연결에 쌓아두면 실패한 문장의 시각이 남아서 다음 문장과 짝이 어긋남)
+    if context is not None and _current.get() is not None:
+        context._query_started = time.perf_counter()
+
+
+def _record_query(context):
+    stats = _current.get()
+    if stats is None:
+        return
+    started = getattr(context, "_query_started", None)
+    if started is not None:
+        stats.db_seconds += time.perf_counter() - started
+        context._query_started = None
+    stats.queries += 1
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record_query(context)
+
+
+def _handle_error(exception_context):
+    # 실패한 문장(IntegrityError, database is locked 등)은 after_cursor_execute가 오지 않으므로 여기서 기록
+    context = exception_context.execution_context
+    if getattr(context, "_query_started", None) is not None:
+        _record_query(context)
+
+
+def instrument_engine(engine):
+    """엔진에 쿼리 측정 이벤트 연결 (여러 번 호출해도 한 번만)"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+# -------------------------
+# 미들웨어
+# -------------------------
+def _route_label(scope, status):
+    """라벨은 실제 경로가 아니라 라우트 템플릿 (/api/students/{student_id}) - 라벨 개수가 늘지 않도록"""
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    if scope["path"].startswith("/static/"):
+        return "/static"
+    return "<unmatched>" if status == 404 else "<other>"
+
+
+class MetricsMiddleware:
+    """순수 ASGI 미들웨어 (StreamingResponse/SSE도 그대로 흘려보냄)"""
+
+    def __init__(self, app, slow_request_ms: float = SLOW_REQUEST_MS):
+        self.app = app
+        self.slow_request_ms = slow_request_ms
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        status = 500
+        event_stream = False
+
+        async def send_with_timing(message):
+            nonlocal status, event_stream
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                event_stream = any(
+                    name.lower() == b"content-type" and value.startswith(b"text/event-stream")
+                    for name, value in message.get("headers", [])
+                )
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                timing = (
+                    f"app;dur={elapsed_ms:.1f}, "
+                    f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries"'
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", timing.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            seconds = time.perf_counter() - started
+            route = _route_label(scope, status)
+            metrics.record(scope["method"], route, status, seconds, stats)
+
+            # SSE는 연결이 오래 유지되는 것이 정상이므로 느린 요청 로그에서 제외
+            if seconds * 1000 >= self.slow_request_ms and not event_stream:
+                logger.warning(
+                    "느린 요청: %s %s %.0fms (SQL %d개, %.0fms)",
+                    scope["method"], scope["path"], seconds * 1000, stats.queries, stats.db_seconds * 1000,
+                    extra={"route": route, "status": status}
+                )
+
+
+# -------------------------
+# Prometheus 텍스트 형식
+# -------------------------
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _histogram_lines(name, histograms):
+    lines = []
+    for (method, route), hist in sorted(histograms.items()):
+        cumulative = 0
+        for bound, count in zip(list(hist.buckets) + ["+Inf"], hist.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels(method=method, route=route, le=bound)} {cumulative}")
+        lines.append(f"{name}_sum{_labels(method=method, route=route)} {hist.sum}")
+        lines.append(f"{name}_count{_labels(method=method, route=route)} {hist.count}")
+    return lines
+
+
+def render_prometheus(registry: MetricsRegistry = metrics) -> str:
+    with registry._lock:
+        lines = [
+            "# HELP http_requests_total Total HTTP requests.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status), count in sorted(registry.requests.items()):
+            lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+
+        lines += [
+            "# HELP http_request_duration_seconds HTTP request latency.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        lines += _histogram_lines("http_request_duration_seconds", registry.latency)
+
+        lines += [
+            "# HELP http_request_db_queries SQL statements executed per request.",
+            "# TYPE http_request_db_queries histogram",
+        ]
+        lines += _histogram_lines("http_request_db_queries", registry.query_counts)
+
+        lines += [
+            "# HELP http_request_db_seconds_total Time spent in SQL statements.",
+            "# TYPE http_request_db_seconds_total counter",
+        ]
+        for (method, route), seconds in sorted(registry.db_seconds.items()):
+            lines.append(f"http_request_db_seconds_total{_labels(method=method, route=route)} {seconds}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,89 @@
+"""
+무거운 외부 라이브러리 지연 로딩
+
+Playwright, Pillow 폰트, Jinja 템플릿, 문자 업체 클라이언트처럼 import/초기화가 오래 걸리는 것들은
+모듈 import 시점이 아니라 처음 쓸 때(또는 lifespan의 백그라운드 warm-up에서) 한 번만 만듭니다.
+서버는 바로 요청을 받고, 첫 리포트/문자 요청 전에 대부분 warm-up이 끝나 있습니다.
+
+    report_template = providers.register("jinja", _load_template)
+    template = report_template.get()        # 처음 한 번만 _load_template() 실행
+
+로딩 상태와 걸린 시간은 GET /api/_system/providers 에서 확인할 수 있습니다.
+"""
+import asyncio
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class LazyProvider:
+    def __init__(self, name: str, load, warm_up: bool = True):
+        self.name = name
+        self.warm_up = warm_up
+        self._load = load
+        self._value = None
+        self._loaded = False
+        self._lock = threading.Lock()
+        self.load_ms = None
+        self.error = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def get(self):
+        if self._loaded:
+            return self._value
+
+        with self._lock:
+            if not self._loaded:
+                started = time.perf_counter()
+                try:
+                    self._value = self._load()
+                except Exception as e:
+                    self.error = repr(e)
+                    raise
+                self.load_ms = round((time.perf_counter() - started) * 1000, 1)
+                self.error = None
+                self._loaded = True
+                logger.debug("%s 로딩 완료 (%.1fms)", self.name, self.load_ms)
+        return self._value
+
+
+class ProviderRegistry:
+    def __init__(self):
+        self._providers = {}
+        self.warm_up_ms = None  # lifespan warm-up 전체에 걸린 시간 (끝나기 전에는 None)
+
+    def register(self, name: str, load, warm_up: bool = True) -> LazyProvider:
+        """warm_up=False면 백그라운드 warm-up에서 건너뛰고 처음 쓸 때만 로딩"""
+        provider = LazyProvider(name, load, warm_up)
+        self._providers[name] = provider
+        return provider
+
+    def get(self, name: str):
+        return self._providers[name].get()
+
+    async def warm_up(self):
+        """등록된 provider를 하나씩 스레드에서 로딩 (실패해도 계속, 처음 쓸 때 다시 시도)"""
+        for provider in list(self._providers.values()):
+            if provider.loaded or not provider.warm_up:
+                continue
+            try:
+                await asyncio.to_thread(provider.get)
+            except Exception as e:
+                logger.warning("%s 미리 로딩 실패: %s", provider.name, e)
+
+    def snapshot(self):
+        return {
+            "warm_up_ms": self.warm_up_ms,
+            "providers": {
+                name: {"loaded": p.loaded, "warm_up": p.warm_up, "load_ms": p.load_ms, "error": p.error}
+                for name, p in self._providers.items()
+            },
+        }
+
+
+providers = ProviderRegistry()
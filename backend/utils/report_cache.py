@@ -0,0 +1,106 @@
+import glob
+import hashlib
+import os
+import time
+
+# 캐시 정리 기준 (둘 중 하나라도 넘으면 오래된 파일부터 삭제)
+REPORT_CACHE_MAX_FILES = int(os.getenv("REPORT_CACHE_MAX_FILES", "2000"))
+REPORT_CACHE_MAX_AGE_DAYS = int(os.getenv("REPORT_CACHE_MAX_AGE_DAYS", "90"))
+
+# 렌더링 방식(viewport 등)이 바뀌면 올려서 기존 캐시를 무효화
+RENDER_VERSION = "1"
+
+
+def template_version(template_path: str) -> str:
+    """템플릿 파일 내용 해시 (템플릿이 바뀌면 캐시 키도 바뀜)"""
+    with open(template_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+def cache_key(html: str, template_hash: str, backend: str) -> str:
+    """렌더링된 HTML(학생 + 일지 + 할 일 상태가 모두 들어있음) + 템플릿/렌더러 버전으로 만든 키"""
+    digest = hashlib.sha256()
+    digest.update(RENDER_VERSION.encode())
+    digest.update(backend.encode())
+    digest.update(template_hash.encode())
+    digest.update(html.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class ReportCache:
+    """
+    static/reports 안의 리포트 PNG 캐시
+    - 파일명: log_{log_id}_{key}.png (+ 같은 이름의 .html)
+    - 같은 키의 PNG가 있으면 다시 렌더링하지 않음
+    - 파일 수 / 나이 기준으로 오래된 것부터 삭제 (캐시 히트 시 mtime 갱신 → LRU)
+    """
+
+    def __init__(self, output_dir: str, max_files=REPORT_CACHE_MAX_FILES, max_age_days=REPORT_CACHE_MAX_AGE_DAYS):
+        self.output_dir = output_dir
+        self.max_files = max_files
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+        self._dir_ready = False
+
+    def ensure_dir(self):
+        """처음 파일을 쓰기 전에 폴더 생성 (import 시점에는 만들지 않음)"""
+        if not self._dir_ready:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._dir_ready = True
+
+    def paths(self, log_id: int, key: str):
+        name = f"log_{log_id}_{key}"
+        return (
+            os.path.join(self.output_dir, f"{name}.html"),
+            os.path.join(self.output_dir, f"{name}.png"),
+        )
+
+    def url(self, log_id: int, key: str) -> str:
+        return f"/static/reports/log_{log_id}_{key}.png"
+
+    def lookup(self, log_id: int, key: str) -> bool:
+        _, img_path = self.paths(log_id, key)
+        if not os.path.exists(img_path):
+            return False
+        os.utime(img_path)
+        return True
+
+    def latest_image(self, log_id: int):
+        """해당 일지의 가장 최근 PNG 경로 (이전 방식의 log_{id}.png도 인정)"""
+        candidates = glob.glob(os.path.join(self.output_dir, f"log_{log_id}_*.png"))
+        legacy = os.path.join(self.output_dir, f"log_{log_id}.png")
+        if os.path.exists(legacy):
+            candidates.append(legacy)
+        if not candidates:
+            return None
+        return max(candidates, key=os.path.getmtime)
+
+    def drop_stale_versions(self, log_id: int, key: str):
+        """같은 일지의 이전 버전 파일 삭제 (일지가 수정되면 예전 이미지는 다시 쓸 일이 없음)"""
+        keep = {os.path.basename(p) for p in self.paths(log_id, key)}
+        pattern = os.path.join(self.output_dir, f"log_{log_id}_*.*")
+        for path in glob.glob(pattern) + glob.glob(os.path.join(self.output_dir, f"log_{log_id}.*")):
+            if os.path.basename(path) not in keep:
+                self._remove(path)
+
+    def evict(self):
+        """파일 수 / 나이 기준 정리"""
+        images = []
+        for path in glob.glob(os.path.join(self.output_dir, "log_*.png")):
+            try:
+                images.append((os.path.getmtime(path), path))
+            except FileNotFoundError:
+                continue
+        images.sort()
+
+        cutoff = time.time() - self.max_age_seconds
+        overflow = len(images) - self.max_files
+        for i, (mtime, path) in enumerate(images):
+            if i < overflow or mtime < cutoff:
+                self._remove(path)
+                self._remove(path[:-len(".png")] + ".html")
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -1,37 +1,104 @@
+import asyncio
 import os
-from jinja2 import Environment, FileSystemLoader
-from playwright.sync_api import sync_playwright
+
+from backend.utils.providers import providers
+from backend.utils.report_cache import ReportCache, cache_key, template_version
+from backend.utils.report_renderer import renderer
 
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 TEMPLATE_DIR = os.path.join(BASE_DIR, "templates")
-OUTPUT_DIR = os.path.join(BASE_DIR, "static", "reports")
+# /static/reports 로 서빙되는 폴더 (벤치마크 등에서 실제 폴더를 건드리지 않도록 바꿀 수 있음)
+OUTPUT_DIR = os.getenv("REPORT_OUTPUT_DIR", os.path.join(BASE_DIR, "static", "reports"))
+TEMPLATE_NAME = "daily_report.html"
 
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+# 렌더링 방식: "chromium" (HTML → 헤드리스 브라우저 스크린샷) / "pillow" (브라우저 없이 직접 그림)
+RENDER_BACKENDS = ("chromium", "pillow")
+REPORT_RENDER_BACKEND = (os.getenv("REPORT_RENDER_BACKEND") or "chromium").strip().lower()
+if REPORT_RENDER_BACKEND not in RENDER_BACKENDS:
+    # 오타가 chromium 방식으로 조용히 넘어가지 않도록 서버 시작 시 바로 실패
+    raise RuntimeError(
+        f"알 수 없는 REPORT_RENDER_BACKEND: {REPORT_RENDER_BACKEND} (가능한 값: {', '.join(RENDER_BACKENDS)})"
+    )
 
-env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+report_cache = ReportCache(OUTPUT_DIR)
 
-def generate_report_image(student, log):
-    template = env.get_template("daily_report.html")
-    html = template.render(student=student, log=log)
 
-    html_path = os.path.join(OUTPUT_DIR, f"log_{log.id}.html")
-    img_path = os.path.join(OUTPUT_DIR, f"log_{log.id}.png")
+def _load_template():
+    from jinja2 import Environment, FileSystemLoader
+
+    env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+    return env.get_template(TEMPLATE_NAME), template_version(os.path.join(TEMPLATE_DIR, TEMPLATE_NAME))
+
+
+def _load_raster():
+    from backend.utils.report_raster import draw_report
+
+    return draw_report
 
+
+# 처음 리포트를 만들 때 (또는 lifespan warm-up에서) 로딩
+report_template = providers.register("jinja", _load_template)
+report_raster = providers.register("pillow", _load_raster, warm_up=REPORT_RENDER_BACKEND == "pillow")
+
+def _draw_png(student, log, img_path: str):
+    report_cache.ensure_dir()
+    report_raster.get()(student, log, img_path)
+
+
+def _write_html(html_path: str, html: str):
+    report_cache.ensure_dir()
     with open(html_path, "w", encoding="utf-8") as f:
         f.write(html)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        # viewport 높이를 작게 설정 (내용에 맞게 자동으로 늘어남)
-        page = browser.new_page(viewport={"width": 900, "height": 800})
 
-        file_url = "file:///" + html_path.replace("\\", "/")
-        page.goto(file_url)
+def _cleanup_cache(log_id: int, key: str):
+    report_cache.drop_stale_versions(log_id, key)
+    report_cache.evict()
+
+
+async def generate_report_image(student, log):
+    """
+    student, log.tasks가 미리 로드되어 있어야 함 (템플릿 렌더링은 이벤트 루프에서 하므로 지연 로딩 쿼리가 나면 안 됨)
+    캐시 폴더 확인/정리처럼 파일 시스템을 훑는 작업은 스레드에서
+    """
+    template, template_hash = report_template.get()
+    html = template.render(student=student, log=log)
+
+    # 학생/일지/할 일 상태가 그대로면 이미 만든 PNG를 그대로 사용
+    key = cache_key(html, template_hash, REPORT_RENDER_BACKEND)
+    if await asyncio.to_thread(report_cache.lookup, log.id, key):
+        return report_cache.url(log.id, key)
+
+    html_path, img_path = report_cache.paths(log.id, key)
+
+    if REPORT_RENDER_BACKEND == "pillow":
+        await asyncio.to_thread(_draw_png, student, log, img_path)
+    else:
+        await asyncio.to_thread(_write_html, html_path, html)
+
+        # 상시 띄워둔 브라우저의 페이지 풀에서 렌더링 (요청마다 Chromium을 새로 띄우지 않음)
+        await renderer.render(html_path, img_path)
+
+    await asyncio.to_thread(_cleanup_cache, log.id, key)
+
+    return report_cache.url(log.id, key)
+
+
+async def generate_report_images(logs):
+    """
+    여러 일지를 동시에 렌더링 (log.student, log.tasks가 미리 로드되어 있어야 함)
+    결과는 logs 순서대로 image_url 또는 발생한 예외
+    """
+    # 페이지 풀 크기만큼만 동시에 보내서 대기열 초과(RendererBusy)가 나지 않게 함
+    limit = asyncio.Semaphore(renderer.pool_size)
+
+    async def render_one(log):
+        async with limit:
+            return await generate_report_image(log.student, log)
 
-        page.wait_for_load_state("networkidle")
-        # full_page=True로 하면 내용에 맞게 이미지 높이가 자동 조정됨
-        page.screenshot(path=img_path, full_page=True)
+    return await asyncio.gather(*(render_one(log) for log in logs), return_exceptions=True)
 
-        browser.close()
 
-    return f"/static/reports/log_{log.id}.png"
+def find_report_image(log_id: int):
+    """일지의 최신 리포트 PNG 파일 경로 (없으면 None)"""
+    return report_cache.latest_image(log_id)
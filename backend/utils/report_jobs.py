@@ -0,0 +1,247 @@
+import asyncio
+import logging
+import os
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session, selectinload
+
+from backend.database import SessionLocal
+from backend.models import DailyLog, ReportJob, Student
+from backend.utils.report_image import generate_report_image
+
+# 리포트 렌더링 작업을 처리할 워커 수
+REPORT_JOB_WORKERS = int(os.getenv("REPORT_JOB_WORKERS", "2"))
+# 실패 시 재시도 포함 최대 시도 횟수
+REPORT_JOB_MAX_ATTEMPTS = int(os.getenv("REPORT_JOB_MAX_ATTEMPTS", "3"))
+# 재시도 대기: REPORT_JOB_RETRY_BASE_SECONDS * 2^(시도-1), 최대 REPORT_JOB_RETRY_MAX_SECONDS
+REPORT_JOB_RETRY_BASE_SECONDS = float(os.getenv("REPORT_JOB_RETRY_BASE_SECONDS", "5"))
+REPORT_JOB_RETRY_MAX_SECONDS = float(os.getenv("REPORT_JOB_RETRY_MAX_SECONDS", "300"))
+
+FINISHED_STATUSES = ("done", "failed")
+
+logger = logging.getLogger(__name__)
+
+
+def retry_delay(attempts: int) -> float:
+    """attempts번 실패한 뒤 다시 렌더링하기까지 대기할 시간 (초)"""
+    delay = min(REPORT_JOB_RETRY_MAX_SECONDS, REPORT_JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+    # 여러 작업이 한꺼번에 실패했을 때 같은 순간에 다시 몰리지 않도록
+    return delay * random.uniform(0.5, 1.0)
+
+
+class ReportJobQueue:
+    """
+    리포트 이미지 렌더링 작업 큐
+    - 작업은 report_jobs 테이블에 저장 (서버가 재시작돼도 queued/running 작업을 다시 처리)
+    - 앱 lifespan에서 start()/stop(), 워커 N개가 asyncio 큐를 비움
+    - 실패한 작업은 next_attempt_at까지 기다렸다가 큐에 다시 넣음 (지수 백오프, 재시작 후에도 유지)
+    """
+
+    def __init__(self, workers=REPORT_JOB_WORKERS, max_attempts=REPORT_JOB_MAX_ATTEMPTS):
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self._loop = None
+        self._queue = None
+        self._tasks = []
+        self._retries = set()
+        self._changed = {}
+
+    async def start(self):
+        if self._tasks:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        now = datetime.now()
+        for job_id, next_attempt_at in await asyncio.to_thread(self._recover):
+            self._retry_later(job_id, (next_attempt_at - now).total_seconds() if next_attempt_at else 0)
+
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for handle in self._retries:
+            handle.cancel()
+        self._retries.clear()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, db: Session, daily_log_id: int) -> ReportJob:
+        # 같은 일지에 대기/진행 중인 작업이 있으면 그 작업을 그대로 돌려줌
+        job = db.query(ReportJob).filter(
+            ReportJob.daily_log_id == daily_log_id,
+            ReportJob.status.in_(("queued", "running"))
+        ).first()
+        if job:
+            return job
+
+        job = ReportJob(daily_log_id=daily_log_id, status="queued", attempts=0)
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+
+        # 동기 엔드포인트(스레드)에서도 호출되므로 이벤트 루프 쪽에서 큐에 넣음
+        if self._queue is not None:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, job.id)
+        return job
+
+    def watch(self, job_id: int, event: asyncio.Event = None) -> asyncio.Event:
+        """
+        작업 상태가 바뀌면 set 되는 Event (SSE용, 구독자마다 따로)
+        작업을 읽기 전에 받아둬야 읽는 동안 일어난 변경도 놓치지 않음
+        event: 이전에 받은 Event (아직 set 되지 않았으면 등록된 그대로 다시 씀)
+        """
+        if event is not None and not event.is_set():
+            return event
+        event = asyncio.Event()
+        self._changed.setdefault(job_id, set()).add(event)
+        return event
+
+    def unwatch(self, job_id: int, event: asyncio.Event):
+        """watch()를 그만둘 때 (이 Event만 지우고, 남은 구독자가 없으면 작업 항목도 지움)"""
+        events = self._changed.get(job_id)
+        if events is not None:
+            events.discard(event)
+            if not events:
+                del self._changed[job_id]
+
+    async def wait_for_change(self, event: asyncio.Event, timeout: float):
+        """watch()로 받은 Event가 set 되거나 timeout이 지날 때까지 대기"""
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _notify(self, job_id: int):
+        for event in self._changed.pop(job_id, ()):
+            event.set()
+
+    def _retry_later(self, job_id: int, delay: float):
+        """delay초 뒤에 큐에 다시 넣음 (0 이하면 바로)"""
+        if delay <= 0:
+            self._queue.put_nowait(job_id)
+            return
+
+        def enqueue():
+            self._retries.discard(handle)
+            self._queue.put_nowait(job_id)
+
+        handle = self._loop.call_later(delay, enqueue)
+        self._retries.add(handle)
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception:
+                logger.exception("리포트 작업 %s 처리 중 오류", job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: int):
+        loaded = await asyncio.to_thread(self._claim, job_id)
+        self._notify(job_id)
+        if loaded is None:
+            return
+
+        student, log = loaded
+        try:
+            image_url = await generate_report_image(student, log)
+        except Exception as e:
+            delay = await asyncio.to_thread(self._fail, job_id, str(e) or type(e).__name__)
+            if delay is not None:
+                self._retry_later(job_id, delay)
+        else:
+            await asyncio.to_thread(self._finish, job_id, image_url)
+        self._notify(job_id)
+
+    # -------------------------
+    # DB 작업 (워커 스레드에서 실행)
+    # -------------------------
+    def _recover(self):
+        db = SessionLocal()
+        try:
+            # 서버가 꺼질 때 running이던 작업은 다시 대기 상태로
+            db.query(ReportJob).filter(ReportJob.status == "running").update(
+                {ReportJob.status: "queued"}, synchronize_session=False
+            )
+            db.commit()
+            rows = db.query(ReportJob.id, ReportJob.next_attempt_at).filter(
+                ReportJob.status == "queued"
+            ).order_by(ReportJob.id).all()
+            return [(row.id, row.next_attempt_at) for row in rows]
+        finally:
+            db.close()
+
+    def _claim(self, job_id: int):
+        db = SessionLocal()
+        try:
+            job = db.query(ReportJob).filter(ReportJob.id == job_id).first()
+            if not job or job.status != "queued":
+                return None
+
+            job.status = "running"
+            job.started_at = datetime.now()
+            job.attempts += 1
+            db.commit()
+
+            log = (
+                db.query(DailyLog)
+                .options(selectinload(DailyLog.tasks))
+                .filter(DailyLog.id == job.daily_log_id)
+                .first()
+            )
+            student = db.query(Student).filter(Student.id == log.student_id).first() if log else None
+            if not log or not student:
+                job.status = "failed"
+                job.error = "일지 없음"
+                job.finished_at = datetime.now()
+                db.commit()
+                return None
+
+            # 세션을 닫은 뒤에도 템플릿에서 쓸 수 있도록 분리
+            db.expunge_all()
+            return student, log
+        finally:
+            db.close()
+
+    def _finish(self, job_id: int, image_url: str):
+        db = SessionLocal()
+        try:
+            job = db.query(ReportJob).filter(ReportJob.id == job_id).first()
+            job.status = "done"
+            job.image_url = image_url
+            job.error = None
+            job.next_attempt_at = None
+            job.finished_at = datetime.now()
+            db.commit()
+        finally:
+            db.close()
+
+    def _fail(self, job_id: int, error: str):
+        """실패 기록, 재시도할 작업이면 대기할 시간(초), 포기하면 None"""
+        db = SessionLocal()
+        try:
+            job = db.query(ReportJob).filter(ReportJob.id == job_id).first()
+            job.error = error
+            if job.attempts < self.max_attempts:
+                delay = retry_delay(job.attempts)
+                job.status = "queued"
+                job.next_attempt_at = datetime.now() + timedelta(seconds=delay)
+                logger.warning("리포트 작업 %s 실패 (%s회), %.0f초 후 재시도: %s", job_id, job.attempts, delay, error)
+            else:
+                delay = None
+                job.status = "failed"
+                job.next_attempt_at = None
+                job.finished_at = datetime.now()
+                logger.error("리포트 작업 %s 실패 (%s회), 포기: %s", job_id, job.attempts, error)
+            db.commit()
+            return delay
+        finally:
+            db.close()
+
+
+report_jobs = ReportJobQueue()
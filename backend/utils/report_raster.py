@@ -0,0 +1,180 @@
+"""
+브라우저 없이 Pillow로 daily_report.html과 같은 레이아웃을 직접 그리는 렌더러
+(REPORT_RENDER_BACKEND=pillow 일 때 사용)
+
+한글 폰트는 REPORT_FONT_PATH / REPORT_FONT_BOLD_PATH 환경 변수,
+backend/fonts/ 폴더, 시스템 나눔고딕(fonts-nanum) 순서로 찾습니다.
+"""
+import os
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+FONT_DIR = os.path.join(BASE_DIR, "fonts")
+
+REGULAR_FONT_CANDIDATES = [
+    os.getenv("REPORT_FONT_PATH", ""),
+    os.path.join(FONT_DIR, "NanumGothic.ttf"),
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "C:/Windows/Fonts/malgun.ttf",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+]
+BOLD_FONT_CANDIDATES = [
+    os.getenv("REPORT_FONT_BOLD_PATH", ""),
+    os.path.join(FONT_DIR, "NanumGothicBold.ttf"),
+    "/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf",
+    "C:/Windows/Fonts/malgunbd.ttf",
+]
+
+# daily_report.html 스타일과 동일한 값
+WIDTH = 900
+PADDING = 24
+CONTENT_WIDTH = 800
+LINE_GAP = 6
+SECTION_GAP = 18
+BOX_PADDING = 14
+
+TEXT_COLOR = "#000000"
+BOX_BORDER = "#e5e7eb"
+BOX_BACKGROUND = "#fafafa"
+DONE_COLOR = "green"
+NOT_DONE_COLOR = "#999999"
+ATTENDANCE_COLORS = {
+    "출석": "green",
+    "지각": "#f59e0b",
+    "결석": "#ef4444",
+}
+
+
+@lru_cache(maxsize=None)
+def _font(size: int, bold: bool = False):
+    candidates = (BOLD_FONT_CANDIDATES if bold else []) + REGULAR_FONT_CANDIDATES
+    for path in candidates:
+        if path and os.path.exists(path):
+            return ImageFont.truetype(path, size)
+    # 한글 폰트가 없으면 기본 폰트 (한글은 깨져 보임)
+    return ImageFont.load_default(size)
+
+
+def _wrap(text: str, font, width: int):
+    """글자 단위 줄바꿈 (한글은 띄어쓰기가 없어도 줄을 나눠야 함)"""
+    lines = []
+    for paragraph in str(text).splitlines() or [""]:
+        line = ""
+        for ch in paragraph:
+            if line and font.getlength(line + ch) > width:
+                lines.append(line)
+                line = ""
+            line += ch
+        lines.append(line)
+    return lines
+
+
+class _Layout:
+    """그릴 내용(텍스트/박스)을 먼저 배치해서 전체 높이를 구한 다음 한 번에 그림"""
+
+    def __init__(self):
+        self.y = PADDING
+        self.ops = []
+
+    def text(self, spans, size=16, x=PADDING, width=CONTENT_WIDTH):
+        """spans: [(텍스트, 색, bold)] 를 한 줄로 이어서 출력 (넘치면 줄바꿈)"""
+        line_height = size + LINE_GAP
+        cursor = x
+        for text, color, bold in spans:
+            font = _font(size, bold)
+            remaining = x + width - cursor
+            for i, line in enumerate(_wrap(text, font, width)):
+                if i == 0 and cursor > x and font.getlength(line) > remaining:
+                    # 현재 줄에 안 들어가면 다음 줄부터
+                    self.y += line_height
+                    cursor = x
+                elif i > 0:
+                    self.y += line_height
+                    cursor = x
+                self.ops.append(("text", (cursor, self.y), line, font, color))
+                cursor += font.getlength(line)
+        self.y += line_height
+
+    def gap(self, height=SECTION_GAP):
+        self.y += height
+
+    def box(self, draw_contents):
+        top = self.y
+        self.y += BOX_PADDING
+        draw_contents(PADDING + BOX_PADDING, CONTENT_WIDTH - BOX_PADDING * 2)
+        self.y += BOX_PADDING - LINE_GAP
+        # 박스는 내용보다 먼저 그려야 하므로 맨 앞에 넣음
+        self.ops.insert(0, ("box", (PADDING, top, PADDING + CONTENT_WIDTH, self.y)))
+
+    def render(self, img_path: str):
+        height = self.y + PADDING
+        image = Image.new("RGB", (WIDTH, height), "white")
+        draw = ImageDraw.Draw(image)
+
+        for op in self.ops:
+            if op[0] == "box":
+                draw.rounded_rectangle(op[1], radius=8, fill=BOX_BACKGROUND, outline=BOX_BORDER)
+            else:
+                _, position, text, font, color = op
+                draw.text(position, text, font=font, fill=color)
+
+        image.save(img_path, "PNG", optimize=False)
+
+
+def _attendance_section(layout, log):
+    def contents(x, width):
+        layout.text([("출결 및 특이사항", TEXT_COLOR, True)], x=x, width=width)
+
+        status = log.attendance_status if log.attendance_status in ATTENDANCE_COLORS else None
+        if status:
+            layout.text([("출결: ", TEXT_COLOR, False), (status, ATTENDANCE_COLORS[status], True)], x=x, width=width)
+        else:
+            layout.text([("출결: 미기록", TEXT_COLOR, False)], x=x, width=width)
+
+        if log.absence_reason:
+            layout.text([(f"사유: {log.absence_reason}", TEXT_COLOR, False)], x=x, width=width)
+        if log.follow_up_action:
+            layout.text([(f"후속 조치: {log.follow_up_action}", TEXT_COLOR, False)], x=x, width=width)
+        if log.makeup_class_note:
+            layout.text([(f"보강: {log.makeup_class_note}", TEXT_COLOR, False)], x=x, width=width)
+
+    layout.box(contents)
+    layout.gap()
+
+
+def draw_report(student, log, img_path: str):
+    """daily_report.html과 같은 구성의 리포트 PNG를 img_path에 저장"""
+    layout = _Layout()
+
+    layout.text([(f"{student.name} 학생 수업 리포트", TEXT_COLOR, True)], size=26)
+    layout.gap(10)
+
+    layout.text([("수업 날짜", TEXT_COLOR, True)])
+    layout.text([(str(log.date), TEXT_COLOR, False)])
+    layout.gap()
+
+    _attendance_section(layout, log)
+
+    layout.text([("오늘의 과제", TEXT_COLOR, True)])
+    for task in log.tasks:
+        if task.is_done:
+            mark = ("(완료)", DONE_COLOR, True)
+        else:
+            mark = ("(미완료)", NOT_DONE_COLOR, False)
+        layout.text([(f"- {task.content} ", TEXT_COLOR, False), mark], x=PADDING + 10, width=CONTENT_WIDTH - 10)
+    layout.gap()
+
+    if log.exam_result:
+        def exam_contents(x, width):
+            layout.text([("시험 결과", TEXT_COLOR, True)], x=x, width=width)
+            layout.text([(log.exam_result, TEXT_COLOR, False)], x=x, width=width)
+
+        layout.box(exam_contents)
+        layout.gap()
+
+    layout.text([("선생님 코멘트", TEXT_COLOR, True)])
+    layout.text([(log.teacher_note or "없음", TEXT_COLOR, False)])
+
+    layout.render(img_path)
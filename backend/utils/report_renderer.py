@@ -0,0 +1,262 @@
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+
+from backend.utils.providers import providers
+
+# 동시에 렌더링할 페이지 수 (Chromium 탭 개수)
+RENDER_POOL_SIZE = int(os.getenv("REPORT_RENDER_POOL_SIZE", "2"))
+# 페이지가 모두 사용 중일 때 기다릴 수 있는 요청 수 (넘으면 바로 거절)
+RENDER_MAX_PENDING = int(os.getenv("REPORT_RENDER_MAX_PENDING", "20"))
+# 리포트 1장당 최대 렌더링 시간 (초, 대기 시간 포함)
+RENDER_TIMEOUT = float(os.getenv("REPORT_RENDER_TIMEOUT", "30"))
+
+# viewport 높이를 작게 설정 (full_page 스크린샷이라 내용에 맞게 자동으로 늘어남)
+VIEWPORT = {"width": 900, "height": 800}
+
+
+def _load_playwright():
+    from playwright.async_api import async_playwright
+
+    return async_playwright
+
+
+# Chromium을 쓸 때만 필요 (pillow 방식이면 playwright를 import하지 않음), warm-up은 renderer.start()가 함
+playwright = providers.register("playwright", _load_playwright, warm_up=False)
+
+logger = logging.getLogger(__name__)
+
+
+class RendererBusy(Exception):
+    """대기열이 가득 차서 렌더링 요청을 받을 수 없음"""
+
+
+class RenderMetrics:
+    def __init__(self, window: int = 200):
+        self.renders = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent_ms = deque(maxlen=window)
+
+    def observe(self, elapsed_ms: float):
+        self.renders += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.recent_ms.append(elapsed_ms)
+
+    def percentile(self, q: float):
+        if not self.recent_ms:
+            return None
+        ordered = sorted(self.recent_ms)
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 1)
+
+
+class ReportRenderer:
+    """
+    Chromium 브라우저 하나를 계속 띄워두고, 미리 만들어둔 페이지(탭)를 돌려쓰며 렌더링
+    - 앱 lifespan에서 start()/stop()
+    - 페이지 수만큼만 동시에 렌더링, 나머지는 max_pending까지 대기 후 거절 (backpressure)
+    - 풀에는 항상 pool_size개의 자리(slot)가 있음: (브라우저 세대, 페이지 또는 None)
+      오류가 난 페이지는 닫고 빈 자리(None)를 바로 돌려놓고, 그 자리를 받은 요청이 새 페이지를 만듦
+      (새 페이지 만들기가 실패해도 자리는 다시 돌아오므로 풀이 줄어들지 않음)
+    - 브라우저가 죽었으면 _start_lock 안에서 한 번만 다시 띄우고, 이전 세대의 페이지는 받는 쪽에서 새로 만듦
+    """
+
+    def __init__(self, pool_size=RENDER_POOL_SIZE, max_pending=RENDER_MAX_PENDING, timeout=RENDER_TIMEOUT):
+        self.pool_size = pool_size
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.metrics = RenderMetrics()
+
+        self._playwright = None
+        self._browser = None
+        self._generation = 0
+        self._pages = None
+        self._start_lock = asyncio.Lock()
+        self._closing = set()
+        self._waiting = 0
+        self._in_flight = 0
+
+    @property
+    def started(self):
+        return self._browser is not None
+
+    async def start(self):
+        async with self._start_lock:
+            if self.started:
+                return
+
+            await self._launch()
+            if self._pages is not None:
+                # 다시 띄우기가 실패한 뒤 다시 시작: 자리(대기 중인 요청 포함)는 그대로 두고 받는 쪽에서 새 페이지를 만듦
+                return
+
+            pages = []
+            try:
+                for _ in range(self.pool_size):
+                    pages.append(await self._browser.new_page(viewport=VIEWPORT))
+            except Exception:
+                # 일부 페이지만 만들어진 채로 브라우저가 남지 않도록
+                await self._close_browser()
+                raise
+
+            self._pages = asyncio.Queue()
+            for page in pages:
+                self._pages.put_nowait((self._generation, page))
+
+    async def stop(self):
+        async with self._start_lock:
+            await self._close_browser()
+            self._pages = None
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    async def _launch(self):
+        """playwright + 브라우저 실행 (_start_lock 안에서 호출)"""
+        async_playwright = await asyncio.to_thread(playwright.get)
+        instance = await async_playwright().start()
+        try:
+            browser = await instance.chromium.launch(headless=True)
+        except Exception:
+            await instance.stop()
+            raise
+        self._playwright = instance
+        self._browser = browser
+        self._generation += 1
+
+    async def _close_browser(self):
+        """브라우저 + playwright 종료 (_start_lock 안에서 호출, 이미 죽었어도 오류 없이)"""
+        browser, instance = self._browser, self._playwright
+        self._browser = None
+        self._playwright = None
+        for close in (browser.close if browser else None, instance.stop if instance else None):
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception as e:
+                logger.debug("리포트 렌더러 종료 중 오류: %r", e)
+
+    async def _restart(self, generation: int):
+        """generation 세대의 브라우저가 죽었을 때 다시 띄움 (동시에 여러 요청이 발견해도 한 번만)"""
+        async with self._start_lock:
+            if generation != self._generation or self._pages is None:
+                return  # 이미 다른 요청이 다시 띄웠거나 stop() 됨
+            logger.warning("리포트 렌더러 브라우저 연결이 끊겨 다시 시작합니다")
+            await self._close_browser()
+            await self._launch()
+
+    async def _checkout(self, generation: int, page):
+        """받은 자리를 쓸 수 있는 페이지로 (빈 자리거나 이전 세대 페이지면 새로 만듦) → (세대, 페이지)"""
+        if page is not None and generation == self._generation and self._browser is not None:
+            return generation, page
+
+        if self._browser is None or not self._browser.is_connected():
+            await self._restart(self._generation)
+            if self._browser is None:
+                raise RuntimeError("리포트 렌더러가 종료되었습니다")
+
+        generation = self._generation
+        new_page = await self._browser.new_page(viewport=VIEWPORT)
+        # 이전 페이지는 새 페이지를 만든 뒤에 닫음 (실패하면 render()가 닫음)
+        if page is not None:
+            self._close_later(page)
+        return generation, new_page
+
+    async def render(self, html_path: str, img_path: str):
+        if not self.started:
+            await self.start()
+
+        if self._waiting + self._in_flight >= self.pool_size + self.max_pending:
+            self.metrics.rejected += 1
+            raise RendererBusy()
+
+        started = time.perf_counter()
+        try:
+            # 1) 빈 페이지 대기
+            self._waiting += 1
+            try:
+                generation, page = await asyncio.wait_for(self._pages.get(), timeout=self.timeout)
+            finally:
+                self._waiting -= 1
+
+            # 2) 남은 시간 안에 (필요하면 새 페이지를 만들고) 렌더링
+            pages = self._pages
+            self._in_flight += 1
+            healthy = False
+            try:
+                generation, page = await asyncio.wait_for(
+                    self._checkout(generation, page), timeout=self._remaining(started)
+                )
+                await asyncio.wait_for(
+                    self._screenshot(page, html_path, img_path), timeout=self._remaining(started)
+                )
+                healthy = True
+            finally:
+                self._in_flight -= 1
+                if healthy:
+                    pages.put_nowait((generation, page))
+                else:
+                    # 타임아웃/오류가 난 페이지는 상태를 알 수 없으므로 닫고, 빈 자리를 바로 돌려놓음
+                    if page is not None:
+                        self._close_later(page)
+                    pages.put_nowait((generation, None))
+        except asyncio.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        except Exception:
+            self.metrics.failures += 1
+            raise
+
+        self.metrics.observe((time.perf_counter() - started) * 1000)
+
+    def _remaining(self, started: float) -> float:
+        return max(self.timeout - (time.perf_counter() - started), 0.001)
+
+    async def _screenshot(self, page, html_path: str, img_path: str):
+        file_url = "file:///" + html_path.replace("\\", "/")
+        await page.goto(file_url)
+        await page.wait_for_load_state("networkidle")
+        # full_page=True로 하면 내용에 맞게 이미지 높이가 자동 조정됨
+        await page.screenshot(path=img_path, full_page=True)
+
+    def _close_later(self, page):
+        """페이지 닫기를 백그라운드로 (작업을 들고 있다가 stop()에서 기다림, 오류는 무시)"""
+        task = asyncio.create_task(self._close_page(page))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_page(self, page):
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug("리포트 페이지 닫기 실패: %r", e)
+
+    def snapshot(self):
+        m = self.metrics
+        return {
+            "started": self.started,
+            "pool_size": self.pool_size,
+            "idle_pages": self._pages.qsize() if self._pages is not None else 0,
+            "in_flight": self._in_flight,
+            "queue_depth": self._waiting,
+            "max_pending": self.max_pending,
+            "renders": m.renders,
+            "failures": m.failures,
+            "timeouts": m.timeouts,
+            "rejected": m.rejected,
+            "latency_ms": {
+                "avg": round(m.total_ms / m.renders, 1) if m.renders else None,
+                "p50": m.percentile(0.5),
+                "p95": m.percentile(0.95),
+                "max": round(m.max_ms, 1) if m.renders else None,
+            },
+        }
+
+
+renderer = ReportRenderer()
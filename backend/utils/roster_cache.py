@@ -0,0 +1,157 @@
+"""
+학생 명단 / 요일별 스케줄 캐시
+
+학생과 스케줄은 일주일에 몇 번 바뀌지 않는데, 거의 모든 화면과 출석 API가 매번 전체를 읽습니다.
+- 학생 명단, 요일 → {student_id: 예정 시간}, 학생별 스케줄 목록을 메모리에 보관
+- students.py / student_schedules.py 에서 저장하면 invalidate()로 전부 비움
+- TTL(ROSTER_CACHE_TTL)이 지나면 다시 읽음: uvicorn 워커가 여러 개면 다른 워커의 수정은
+  최대 TTL만큼 늦게 반영됨
+- 항목 수가 ROSTER_CACHE_MAX_ENTRIES를 넘으면 오래 안 쓴 것부터 버림 (학생별 스케줄 때문)
+
+캐시에는 ORM 객체가 아니라 dict/tuple만 넣습니다 (세션이 닫혀도 안전하게 공유).
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy.orm import Session
+
+from backend.models import Student, StudentSchedule
+
+ROSTER_CACHE_TTL = float(os.getenv("ROSTER_CACHE_TTL", "60"))
+ROSTER_CACHE_MAX_ENTRIES = int(os.getenv("ROSTER_CACHE_MAX_ENTRIES", "512"))
+
+
+class TTLCache:
+    """TTL + 최대 항목 수가 있는 LRU 캐시"""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key, load, cache_none=True):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > now:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+
+        value = load()
+
+        with self._lock:
+            # 읽는 도중에 invalidate() 됐으면 예전 값일 수 있으므로 저장하지 않음
+            if generation == self._generation and (cache_none or value is not None):
+                self._store(key, value, now)
+        return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._store(key, value, time.monotonic())
+
+    def _store(self, key, value, now):
+        self._data[key] = (now + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def peek(self, key):
+        """(True, 값) 또는 캐시에 없으면 (False, None) - 읽기만 하고 load하지 않음"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+        return False, None
+
+    def discard(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+            self._generation += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
+
+    def __len__(self):
+        return len(self._data)
+
+
+class RosterCache:
+    def __init__(self, ttl=ROSTER_CACHE_TTL, max_entries=ROSTER_CACHE_MAX_ENTRIES):
+        self._cache = TTLCache(ttl, max_entries)
+
+    def invalidate(self):
+        """학생/스케줄이 바뀌면 호출 (커밋 후)"""
+        self._cache.clear()
+
+    def students(self, db: Session):
+        """학생 명단 [{"id", "name", "grade", "parent_phone"}] (id 순)"""
+        return self._roster(db)["students"]
+
+    def students_json(self, db: Session):
+        """GET /students/ 응답 본문(bytes)과 ETag"""
+        roster = self._roster(db)
+        return roster["body"], roster["etag"]
+
+    def expected_times(self, db: Session, weekday: int):
+        """해당 요일에 수업이 있는 학생 {student_id: 예정 시간}"""
+        def load():
+            rows = db.query(StudentSchedule.student_id, StudentSchedule.expected_time).filter(
+                StudentSchedule.weekday == weekday
+            )
+            return {row.student_id: row.expected_time for row in rows}
+
+        return self._cache.get_or_load(("weekday", weekday), load)
+
+    def schedules(self, db: Session, student_id: int):
+        """학생 한 명의 요일별 스케줄 [{"id", "weekday", "expected_time"}]"""
+        def load():
+            rows = db.query(StudentSchedule.id, StudentSchedule.weekday, StudentSchedule.expected_time).filter(
+                StudentSchedule.student_id == student_id
+            )
+            return [{"id": r.id, "weekday": r.weekday, "expected_time": r.expected_time} for r in rows]
+
+        return self._cache.get_or_load(("schedules", student_id), load)
+
+    def _roster(self, db: Session):
+        def load():
+            rows = db.query(Student.id, Student.name, Student.grade, Student.parent_phone).order_by(Student.id)
+            students = [
+                {"id": r.id, "name": r.name, "grade": r.grade, "parent_phone": r.parent_phone}
+                for r in rows
+            ]
+            # FastAPI 기본 JSON 응답과 같은 형식
+            body = json.dumps(students, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            # 내용 기반 ETag: 워커가 여러 개여도 같은 명단이면 같은 값
+            etag = '"' + hashlib.sha256(body).hexdigest()[:20] + '"'
+            return {"students": students, "body": body, "etag": etag}
+
+        return self._cache.get_or_load("roster", load)
+
+    def snapshot(self):
+        return {"entries": len(self._cache), "hits": self._cache.hits, "misses": self._cache.misses}
+
+
+def etag_matches(if_none_match, etag: str) -> bool:
+    """If-None-Match 헤더에 etag가 있는지 (W/ 약한 비교, * 포함)"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+roster_cache = RosterCache()
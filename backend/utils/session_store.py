@@ -0,0 +1,192 @@
+"""
+로그인 세션 저장소
+
+- 세션은 auth_sessions 테이블에 저장 (서버를 재시작해도 유지, uvicorn 워커가 여러 개여도 공유)
+- 자주 확인하는 토큰은 워커마다 메모리(LRU, 최대 SESSION_CACHE_MAX_ENTRIES개)에 SESSION_CACHE_TTL초 동안 보관
+  (없는 토큰은 별도의 작은 캐시(최대 SESSION_NEGATIVE_CACHE_MAX_ENTRIES개)에 보관 → 잘못된 토큰이 많아도 정상 세션이 밀려나지 않음)
+  → 다른 워커에서 로그아웃한 토큰은 그 워커에서 최대 SESSION_CACHE_TTL초 동안 더 통과할 수 있음
+- 만료된 세션은 SESSION_SWEEP_SECONDS 간격으로 한꺼번에 삭제 (lifespan에서 start()/stop())
+
+저장 방식을 바꾸려면(예: Redis) SessionBackend를 구현해서 SessionStore(backend)로 넘기면 됩니다.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import secrets
+from datetime import datetime, timedelta
+
+from backend.database import SessionLocal
+from backend.models import AuthSession
+from backend.utils.roster_cache import TTLCache
+
+SESSION_TTL_DAYS = int(os.getenv("SESSION_TTL_DAYS", "30"))
+SESSION_CACHE_TTL = float(os.getenv("SESSION_CACHE_TTL", "30"))
+SESSION_CACHE_MAX_ENTRIES = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "1024"))
+SESSION_NEGATIVE_CACHE_MAX_ENTRIES = int(os.getenv("SESSION_NEGATIVE_CACHE_MAX_ENTRIES", "256"))
+SESSION_SWEEP_SECONDS = float(os.getenv("SESSION_SWEEP_SECONDS", "3600"))
+
+# SessionStore.get()이 만료된 세션에 돌려주는 값
+SESSION_EXPIRED = "expired"
+
+logger = logging.getLogger(__name__)
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class SessionBackend:
+    """세션 영구 저장소 (token_hash 기준)"""
+
+    def save(self, token_hash: str, session: dict):
+        raise NotImplementedError
+
+    def load(self, token_hash: str):
+        """세션 dict 또는 None"""
+        raise NotImplementedError
+
+    def delete(self, token_hash: str):
+        raise NotImplementedError
+
+    def delete_expired(self, now: datetime) -> int:
+        raise NotImplementedError
+
+
+class SqliteSessionBackend(SessionBackend):
+    def save(self, token_hash: str, session: dict):
+        db = SessionLocal()
+        try:
+            db.add(AuthSession(token_hash=token_hash, **session))
+            db.commit()
+        finally:
+            db.close()
+
+    def load(self, token_hash: str):
+        db = SessionLocal()
+        try:
+            row = db.query(
+                AuthSession.teacher_id, AuthSession.teacher_name, AuthSession.username, AuthSession.expires_at
+            ).filter(AuthSession.token_hash == token_hash).first()
+            return dict(row._mapping) if row else None
+        finally:
+            db.close()
+
+    def delete(self, token_hash: str):
+        db = SessionLocal()
+        try:
+            db.query(AuthSession).filter(AuthSession.token_hash == token_hash).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    def delete_expired(self, now: datetime) -> int:
+        db = SessionLocal()
+        try:
+            count = db.query(AuthSession).filter(AuthSession.expires_at <= now).delete(synchronize_session=False)
+            db.commit()
+            return count
+        finally:
+            db.close()
+
+
+class SessionStore:
+    def __init__(
+        self,
+        backend: SessionBackend,
+        cache_ttl=SESSION_CACHE_TTL,
+        cache_max_entries=SESSION_CACHE_MAX_ENTRIES,
+        negative_cache_max_entries=SESSION_NEGATIVE_CACHE_MAX_ENTRIES,
+        sweep_seconds=SESSION_SWEEP_SECONDS,
+    ):
+        self.backend = backend
+        self.sweep_seconds = sweep_seconds
+        # 두 캐시 모두 토큰 해시를 키로 씀 (토큰 원문을 메모리에 쌓아두지 않음)
+        self._cache = TTLCache(cache_ttl, cache_max_entries)
+        # 없는 토큰은 따로 보관해서 잘못된 토큰으로 반복 요청해도 DB를 읽지 않음
+        self._missing = TTLCache(cache_ttl, negative_cache_max_entries)
+        self._task = None
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._sweep_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def create(self, teacher_id: int, teacher_name: str, username: str) -> str:
+        """새 세션을 만들고 토큰 반환"""
+        token = secrets.token_urlsafe(32)
+        self.backend.save(hash_token(token), {
+            "teacher_id": teacher_id,
+            "teacher_name": teacher_name,
+            "username": username,
+            "expires_at": datetime.now() + timedelta(days=SESSION_TTL_DAYS),
+        })
+        return token
+
+    def get(self, token: str):
+        """
+        유효한 세션 dict, 없으면 None, 만료됐으면 SESSION_EXPIRED
+        """
+        key = hash_token(token)
+        found, _ = self._missing.peek(key)
+        if found:
+            return None
+        session = self._cache.get_or_load(key, lambda: self.backend.load(key), cache_none=False)
+        if session is None:
+            self._missing.set(key, None)
+            return None
+        if datetime.now() > session["expires_at"]:
+            self.revoke(token)
+            return SESSION_EXPIRED
+        return session
+
+    def get_cached(self, token: str):
+        """
+        메모리 캐시만 확인 (DB를 읽지 않으므로 이벤트 루프에서 바로 호출 가능)
+        (True, 세션 dict 또는 None) / 캐시에 없거나 만료됐으면 (False, None) → get()으로 확인
+        """
+        key = hash_token(token)
+        found, session = self._missing.peek(key)
+        if found:
+            return True, None
+        found, session = self._cache.peek(key)
+        if found and session is not None and datetime.now() > session["expires_at"]:
+            return False, None
+        return found, session
+
+    def revoke(self, token: str):
+        key = hash_token(token)
+        self.backend.delete(key)
+        self._cache.discard(key)
+
+    def sweep(self) -> int:
+        """만료된 세션 삭제 (캐시에 남은 만료 세션은 get()에서 걸러짐)"""
+        return self.backend.delete_expired(datetime.now())
+
+    def snapshot(self):
+        return {
+            "cached": len(self._cache),
+            "cached_missing": len(self._missing),
+            "hits": self._cache.hits + self._missing.hits,
+            "misses": self._cache.misses,
+        }
+
+    async def _sweep_loop(self):
+        while True:
+            try:
+                removed = await asyncio.to_thread(self.sweep)
+                if removed:
+                    logger.info("만료된 로그인 세션 %s개 삭제", removed)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("로그인 세션 정리 중 오류")
+            await asyncio.sleep(self.sweep_seconds)
+
+
+session_store = SessionStore(SqliteSessionBackend())
@@ -1,18 +1,155 @@
-from twilio.rest import Client
+"""
+문자 발송 업체 (provider)
+
+발송 대기열(sms_outbox.py)이 provider.send()를 호출합니다. SMS_PROVIDER 로 고릅니다.
+- twilio: Twilio REST API (aiohttp 세션 하나를 재사용해서 연결을 유지)
+  SMS_PROVIDER가 없고 TWILIO_ACCOUNT_SID / TWILIO_AUTH_TOKEN이 있으면 twilio (기존 배포와 같게)
+- fake: 실제로 보내지 않고 메모리에 기록 (개발/테스트용, SMS_PROVIDER=fake로 지정했을 때만)
+둘 다 아니면 (또는 모르는 값이면) 서버는 그대로 뜨지만 문자 발송 대기열이 시작되지 않고,
+POST /api/sms/absent는 503으로 거절합니다 (문자가 안 나가는데 보낸 것처럼 보이지 않도록).
+
+새 업체를 붙이려면 SmsProvider를 상속해서 send()를 구현하고 PROVIDERS에 추가하면 됩니다.
+"""
+import asyncio
+import logging
 import os
+import random
+import uuid
+from collections import deque
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
-client = Client(
-    os.getenv("TWILIO_ACCOUNT_SID"),
-    os.getenv("TWILIO_AUTH_TOKEN")
-)
-
-def send_sms(to: str, content: str):
-    message = client.messages.create(
-        body=content,
-        from_=os.getenv("TWILIO_FROM"),
-        to=to
-    )
-    return message.sid
+SMS_PROVIDER = os.getenv("SMS_PROVIDER", "").strip().lower()
+# 업체 API 호출 제한 시간 (초)
+SMS_HTTP_TIMEOUT = float(os.getenv("SMS_HTTP_TIMEOUT", "10"))
+# 업체 API로 동시에 열어 둘 연결 수
+SMS_HTTP_POOL_SIZE = int(os.getenv("SMS_HTTP_POOL_SIZE", "4"))
+
+# fake provider 설정 (재시도 테스트용)
+FAKE_SMS_FAIL_RATE = float(os.getenv("FAKE_SMS_FAIL_RATE", "0"))
+FAKE_SMS_LATENCY_MS = float(os.getenv("FAKE_SMS_LATENCY_MS", "0"))
+
+logger = logging.getLogger(__name__)
+
+
+class SmsSendError(Exception):
+    """
+    발송 실패
+    - retryable: 잠시 후 다시 보내면 될 수 있는 오류 (네트워크, 429, 5xx)
+    - retry_after: 업체가 알려준 대기 시간 (초)
+    """
+
+    def __init__(self, message: str, retryable: bool = True, retry_after: float = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+class SmsProvider:
+    name = "base"
+
+    async def open(self):
+        """대기열 시작 시 호출 (연결 준비)"""
+
+    async def close(self):
+        """대기열 종료 시 호출"""
+
+    async def send(self, phone: str, body: str) -> str:
+        """문자 한 건 발송, 업체 메시지 id 반환 (실패하면 SmsSendError)"""
+        raise NotImplementedError
+
+
+class FakeSmsProvider(SmsProvider):
+    """실제로 보내지 않는 provider - 보낸 문자는 sent에 남음"""
+
+    name = "fake"
+
+    def __init__(self, fail_rate=FAKE_SMS_FAIL_RATE, latency_ms=FAKE_SMS_LATENCY_MS):
+        self.fail_rate = fail_rate
+        self.latency_ms = latency_ms
+        self.sent = deque(maxlen=1000)
+
+    async def send(self, phone: str, body: str) -> str:
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        if self.fail_rate and random.random() < self.fail_rate:
+            raise SmsSendError("fake 발송 실패")
+
+        message_id = f"fake-{uuid.uuid4().hex[:12]}"
+        self.sent.append({"id": message_id, "phone": phone, "body": body})
+        logger.info("[fake 문자] %s: %s", phone, body)
+        return message_id
+
+
+class TwilioSmsProvider(SmsProvider):
+    name = "twilio"
+
+    def __init__(self):
+        self.account_sid = os.getenv("TWILIO_ACCOUNT_SID")
+        self.auth_token = os.getenv("TWILIO_AUTH_TOKEN")
+        self.from_number = os.getenv("TWILIO_FROM")
+        self._session = None
+
+    async def open(self):
+        if not (self.account_sid and self.auth_token and self.from_number):
+            raise RuntimeError("TWILIO_ACCOUNT_SID / TWILIO_AUTH_TOKEN / TWILIO_FROM 설정 필요")
+
+        import aiohttp
+
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=SMS_HTTP_POOL_SIZE),
+            timeout=aiohttp.ClientTimeout(total=SMS_HTTP_TIMEOUT),
+            auth=aiohttp.BasicAuth(self.account_sid, self.auth_token),
+        )
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def send(self, phone: str, body: str) -> str:
+        import aiohttp
+
+        url = f"https://api.twilio.com/2010-04-01/Accounts/{self.account_sid}/Messages.json"
+        data = {"To": phone, "From": self.from_number, "Body": body}
+        try:
+            async with self._session.post(url, data=data) as response:
+                payload = await response.json(content_type=None)
+                if response.status == 429 or response.status >= 500:
+                    retry_after = response.headers.get("Retry-After")
+                    raise SmsSendError(
+                        f"Twilio {response.status}: {payload.get('message', '')}",
+                        retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+                    )
+                if response.status >= 400:
+                    # 번호 오류, 인증 오류 등은 다시 보내도 실패
+                    raise SmsSendError(f"Twilio {response.status}: {payload.get('message', '')}", retryable=False)
+                return payload["sid"]
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise SmsSendError(f"Twilio 연결 오류: {e!r}")
+
+
+PROVIDERS = {
+    "fake": FakeSmsProvider,
+    "twilio": TwilioSmsProvider,
+}
+
+
+def resolve_provider_name(name: str = SMS_PROVIDER) -> str:
+    """SMS_PROVIDER (없으면 Twilio 인증 정보 유무)로 업체 이름 결정, 설정이 잘못됐으면 RuntimeError"""
+    if not name:
+        if os.getenv("TWILIO_ACCOUNT_SID") and os.getenv("TWILIO_AUTH_TOKEN"):
+            return "twilio"
+        raise RuntimeError(
+            "문자 발송 업체 설정 필요: TWILIO_ACCOUNT_SID / TWILIO_AUTH_TOKEN / TWILIO_FROM을 넣거나 "
+            "개발용이면 SMS_PROVIDER=fake로 지정하세요"
+        )
+    if name not in PROVIDERS:
+        raise RuntimeError(f"알 수 없는 SMS_PROVIDER: {name} (가능한 값: {', '.join(PROVIDERS)})")
+    return name
+
+
+def get_provider(name: str = SMS_PROVIDER) -> SmsProvider:
+    return PROVIDERS[resolve_provider_name(name)]()
@@ -0,0 +1,338 @@
+"""
+문자 발송 대기열
+
+요청 처리 중에는 sms_outbox 테이블에 넣기만 하고(enqueue), 실제 발송은 lifespan에서 시작한
+디스패처가 백그라운드에서 합니다.
+- 멱등 키: 같은 학생에게 같은 날 같은 종류의 문자는 한 번만 (버튼을 여러 번 눌러도 중복 발송 없음)
+  실패(failed)로 끝난 문자만 다시 요청하면 새 번호/내용으로 다시 보냄
+- 발송 속도 제한: 초당 SMS_RATE_PER_SECOND 건 (토큰 버킷), 동시 발송 SMS_CONCURRENCY 건
+- 실패하면 지수 백오프(+지터)로 SMS_MAX_ATTEMPTS 번까지 재시도, 번호 오류 등은 바로 failed
+- 서버가 재시작돼도 queued 문자는 계속 보내고, sending 상태로 멈춘 문자는 다시 queued로
+
+sending 중에 서버가 꺼지면 업체에는 전달됐는데 기록을 못 했을 수 있어서, 재시작 후 한 번 더
+보내질 수 있습니다 (한 번도 안 보내지는 것보다 낫다고 판단).
+"""
+import asyncio
+import logging
+import os
+import random
+import time as timer
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from backend.database import SessionLocal
+from backend.models import SmsMessage
+from backend.utils.providers import providers
+from backend.utils.sms import SmsProvider, SmsSendError, get_provider
+
+SMS_RATE_PER_SECOND = float(os.getenv("SMS_RATE_PER_SECOND", "5"))
+SMS_CONCURRENCY = int(os.getenv("SMS_CONCURRENCY", "4"))
+SMS_MAX_ATTEMPTS = int(os.getenv("SMS_MAX_ATTEMPTS", "5"))
+# 재시도 대기: SMS_RETRY_BASE_SECONDS * 2^(시도-1), 최대 SMS_RETRY_MAX_SECONDS
+SMS_RETRY_BASE_SECONDS = float(os.getenv("SMS_RETRY_BASE_SECONDS", "5"))
+SMS_RETRY_MAX_SECONDS = float(os.getenv("SMS_RETRY_MAX_SECONDS", "600"))
+# 새 문자가 없어도 대기열을 확인하는 간격 (초) - 다른 워커에서 넣은 문자도 이 간격 안에 발송
+SMS_POLL_SECONDS = float(os.getenv("SMS_POLL_SECONDS", "30"))
+# 한 번에 가져올 문자 수
+SMS_BATCH_SIZE = 50
+
+logger = logging.getLogger(__name__)
+
+# SMS_PROVIDER에 맞는 업체 클라이언트 (처음 쓸 때 생성)
+sms_provider = providers.register("sms", get_provider)
+
+
+def idempotency_key(kind: str, student_id: int, send_date: date) -> str:
+    return f"{kind}:{student_id}:{send_date.isoformat()}"
+
+
+def retry_delay(attempts: int) -> float:
+    """attempts번 실패한 뒤 다시 보내기까지 대기할 시간 (초)"""
+    delay = min(SMS_RETRY_MAX_SECONDS, SMS_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+    # 여러 건이 한꺼번에 실패했을 때 같은 순간에 다시 몰리지 않도록
+    return delay * random.uniform(0.5, 1.0)
+
+
+class TokenBucket:
+    """초당 rate 건, 최대 burst 건까지 몰아서 허용"""
+
+    def __init__(self, rate: float, burst: float = None):
+        self.rate = rate
+        self.capacity = burst or max(rate, 1)
+        self._tokens = self.capacity
+        self._updated = timer.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = timer.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class SmsOutbox:
+    def __init__(
+        self,
+        provider: SmsProvider = None,
+        rate_per_second=SMS_RATE_PER_SECOND,
+        concurrency=SMS_CONCURRENCY,
+        max_attempts=SMS_MAX_ATTEMPTS,
+    ):
+        self._provider = provider
+        self.rate_per_second = rate_per_second
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self._loop = None
+        self._wake = None
+        self._task = None
+
+    @property
+    def provider(self) -> SmsProvider:
+        if self._provider is None:
+            self._provider = sms_provider.get()
+        return self._provider
+
+    def config_error(self):
+        """문자 업체 설정이 잘못됐으면 그 이유, 보낼 수 있으면 None"""
+        try:
+            self.provider
+        except RuntimeError as e:
+            return str(e)
+        return None
+
+    async def start(self):
+        """업체 설정이 잘못됐으면 RuntimeError (lifespan에서 로그만 남기고 서버는 계속 뜸)"""
+        if self._task is not None:
+            return
+
+        await self.provider.open()
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        recovered = await asyncio.to_thread(self._recover)
+        if recovered:
+            logger.info("발송 중이던 문자 %s건을 다시 대기열에 넣음", recovered)
+        self._task = asyncio.create_task(self._dispatch_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._provider is not None:
+            await self._provider.close()
+
+    # -------------------------
+    # 대기열에 넣기 (요청 처리 스레드)
+    # -------------------------
+    def enqueue(self, db: Session, kind: str, send_date: date, messages):
+        """
+        messages: [{"student_id", "phone", "body"}]
+        학생별 결과 [{"student_id", "id", "status", "duplicate"}] 반환
+        이미 같은 멱등 키의 문자가 있으면 새로 넣지 않고 그 문자를 돌려줌 (duplicate)
+        단, 그 문자가 failed면 받은 번호/내용으로 바꿔서 다시 queued (시도 횟수 초기화)
+        """
+        if not messages:
+            return []
+
+        now = datetime.now()
+        rows = {
+            idempotency_key(kind, m["student_id"], send_date): {
+                "idempotency_key": idempotency_key(kind, m["student_id"], send_date),
+                "kind": kind,
+                "student_id": m["student_id"],
+                "send_date": send_date,
+                "phone": m["phone"],
+                "body": m["body"],
+                "status": "queued",
+                "attempts": 0,
+                "next_attempt_at": now,
+            }
+            for m in messages
+        }
+        stmt = insert(SmsMessage).values(list(rows.values()))
+        # 이미 있는 키는 그대로 두되, 실패(failed)로 끝난 문자는 새 번호/내용으로 다시 대기열에 넣음
+        # (번호 오류 등으로 포기한 문자를 연락처를 고친 뒤 같은 날 다시 보낼 수 있게)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["idempotency_key"],
+            set_={
+                "phone": stmt.excluded.phone,
+                "body": stmt.excluded.body,
+                "status": "queued",
+                "attempts": 0,
+                "next_attempt_at": stmt.excluded.next_attempt_at,
+                "provider": None,
+                "provider_message_id": None,
+                "error": None,
+                "sent_at": None,
+            },
+            where=SmsMessage.status == "failed",
+        ).returning(SmsMessage.idempotency_key)
+        inserted = {row.idempotency_key for row in db.execute(stmt)}
+
+        saved = {
+            row.idempotency_key: row
+            for row in db.query(SmsMessage.id, SmsMessage.idempotency_key, SmsMessage.status).filter(
+                SmsMessage.idempotency_key.in_(rows)
+            )
+        }
+        db.commit()
+
+        if inserted:
+            self.wake()
+
+        results = []
+        for key, row in rows.items():
+            message = saved[key]
+            results.append({
+                "student_id": row["student_id"],
+                "id": message.id,
+                "status": message.status,
+                "duplicate": key not in inserted,
+            })
+        return results
+
+    def wake(self):
+        """디스패처를 바로 깨움 (동기 엔드포인트 스레드에서도 호출 가능)"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    # -------------------------
+    # 디스패처 (이벤트 루프)
+    # -------------------------
+    async def _dispatch_loop(self):
+        bucket = TokenBucket(self.rate_per_second)
+        slots = asyncio.Semaphore(self.concurrency)
+        sending = set()
+
+        async def send_one(message):
+            try:
+                await bucket.acquire()
+                await self._send(message)
+            finally:
+                slots.release()
+
+        while True:
+            try:
+                self._wake.clear()
+                claimed, next_due = await asyncio.to_thread(self._claim_due, SMS_BATCH_SIZE)
+                for message in claimed:
+                    await slots.acquire()
+                    task = asyncio.create_task(send_one(message))
+                    sending.add(task)
+                    task.add_done_callback(sending.discard)
+
+                if len(claimed) == SMS_BATCH_SIZE:
+                    continue
+
+                wait = SMS_POLL_SECONDS
+                if next_due is not None:
+                    wait = min(wait, (next_due - datetime.now()).total_seconds())
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=max(wait, 0.05))
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                for task in sending:
+                    task.cancel()
+                raise
+            except Exception:
+                logger.exception("문자 대기열 처리 중 오류")
+                await asyncio.sleep(SMS_POLL_SECONDS)
+
+    async def _send(self, message):
+        try:
+            provider_message_id = await self.provider.send(message.phone, message.body)
+        except SmsSendError as e:
+            await asyncio.to_thread(self._fail, message, str(e), e.retryable, e.retry_after)
+            # 재시도 예정 시각에 맞춰 다시 대기하도록 디스패처를 깨움
+            self._wake.set()
+        except Exception as e:
+            logger.exception("문자 %s 발송 중 오류", message.id)
+            await asyncio.to_thread(self._fail, message, repr(e), True, None)
+            self._wake.set()
+        else:
+            await asyncio.to_thread(self._finish, message.id, provider_message_id)
+
+    # -------------------------
+    # DB 작업 (워커 스레드에서 실행)
+    # -------------------------
+    def _recover(self) -> int:
+        db = SessionLocal()
+        try:
+            count = db.query(SmsMessage).filter(SmsMessage.status == "sending").update(
+                {SmsMessage.status: "queued"}, synchronize_session=False
+            )
+            db.commit()
+            return count
+        finally:
+            db.close()
+
+    def _claim_due(self, limit: int):
+        """보낼 때가 된 문자를 sending으로 바꾸고 가져옴, 남은 문자 중 가장 빠른 예정 시각도 반환"""
+        db = SessionLocal()
+        try:
+            now = datetime.now()
+            due_ids = (
+                select(SmsMessage.id)
+                .where(SmsMessage.status == "queued", SmsMessage.next_attempt_at <= now)
+                .order_by(SmsMessage.next_attempt_at, SmsMessage.id)
+                .limit(limit)
+                .scalar_subquery()
+            )
+            # status 조건을 다시 걸어서 다른 워커가 먼저 가져간 문자는 건너뜀
+            claimed = db.execute(
+                update(SmsMessage)
+                .where(SmsMessage.id.in_(due_ids), SmsMessage.status == "queued")
+                .values(status="sending", attempts=SmsMessage.attempts + 1, provider=self.provider.name)
+                .returning(SmsMessage.id, SmsMessage.phone, SmsMessage.body, SmsMessage.attempts)
+            ).all()
+            db.commit()
+
+            next_due = db.query(SmsMessage.next_attempt_at).filter(
+                SmsMessage.status == "queued"
+            ).order_by(SmsMessage.next_attempt_at).limit(1).scalar()
+            return claimed, next_due
+        finally:
+            db.close()
+
+    def _finish(self, message_id: int, provider_message_id: str):
+        db = SessionLocal()
+        try:
+            db.query(SmsMessage).filter(SmsMessage.id == message_id).update({
+                SmsMessage.status: "sent",
+                SmsMessage.provider_message_id: provider_message_id,
+                SmsMessage.error: None,
+                SmsMessage.sent_at: datetime.now(),
+            }, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    def _fail(self, message, error: str, retryable: bool, retry_after: float):
+        values = {SmsMessage.error: error}
+        if retryable and message.attempts < self.max_attempts:
+            delay = max(retry_delay(message.attempts), retry_after or 0)
+            values[SmsMessage.status] = "queued"
+            values[SmsMessage.next_attempt_at] = datetime.now() + timedelta(seconds=delay)
+            logger.warning("문자 %s 발송 실패 (%s회), %.0f초 후 재시도: %s", message.id, message.attempts, delay, error)
+        else:
+            values[SmsMessage.status] = "failed"
+            logger.error("문자 %s 발송 실패 (%s회), 포기: %s", message.id, message.attempts, error)
+
+        db = SessionLocal()
+        try:
+            db.query(SmsMessage).filter(SmsMessage.id == message.id).update(values, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+
+sms_outbox = SmsOutbox()
@@ -0,0 +1,298 @@
+"""
+학생 + 요일별 스케줄 일괄 등록 (학기 초 명단 올리기)
+
+1) 검사: 모든 행을 먼저 검사하고 기존 학생과 맞춰봄 (DB 쓰기 전)
+   - id가 있으면 그 학생을 수정 (없는 id면 오류)
+   - 없으면 이름+학부모 연락처(연락처가 없으면 이름+학년)가 같은 학생을 수정, 없으면 새로 등록
+   - 같은 조건의 기존 학생이 여러 명이거나 파일 안에 같은 학생이 두 번 나오면 그 행은 오류
+2) 저장: 오류 없는 행만 IMPORT_BATCH_SIZE명씩 한 트랜잭션으로
+   - 학생 등록/수정, 스케줄 upsert(ON CONFLICT(student_id, weekday))는 문장 하나를 여러 행에 executemany
+   - replace_schedules면 파일에 없는 요일 스케줄은 삭제
+3) 저장한 뒤 학생 명단/스케줄 캐시(roster_cache)를 비움
+
+CSV 형식 (첫 줄은 머리글, 요일 칸에는 예정 시간, 수업 없는 요일은 빈칸):
+    이름,학년,학부모 연락처,월,화,수,목,금,토,일
+    김민준,중1,010-1234-5678,15:00,,15:00,,16:30,,
+
+명령줄 (프로젝트 루트에서, 실행 중인 서버의 명단 캐시는 ROSTER_CACHE_TTL초 뒤에 반영):
+    python -m backend.utils.student_import students.csv --dry-run
+    python -m backend.utils.student_import students.json --replace-schedules
+"""
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import sys
+import time as timer
+
+from pydantic import ValidationError
+from sqlalchemy import and_, bindparam, delete, insert, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from backend.models import Student, StudentSchedule
+from backend.schemas import StudentImportRow
+from backend.utils.roster_cache import roster_cache
+
+logger = logging.getLogger(__name__)
+
+# 한 트랜잭션에 저장할 학생 수
+IMPORT_BATCH_SIZE = int(os.getenv("STUDENT_IMPORT_BATCH_SIZE", "500"))
+
+CSV_COLUMNS = {
+    "id": "id", "학생 id": "id", "학생id": "id",
+    "name": "name", "이름": "name",
+    "grade": "grade", "학년": "grade",
+    "parent_phone": "parent_phone", "학부모 연락처": "parent_phone", "연락처": "parent_phone", "전화번호": "parent_phone",
+}
+WEEKDAY_COLUMNS = {
+    **{name: i for i, name in enumerate("월화수목금토일")},
+    **{name + "요일": i for i, name in enumerate("월화수목금토일")},
+    **{name: i for i, name in enumerate(["mon", "tue", "wed", "thu", "fri", "sat", "sun"])},
+}
+
+_SCHEDULE_UPSERT = sqlite_insert(StudentSchedule.__table__)
+_SCHEDULE_UPSERT = _SCHEDULE_UPSERT.on_conflict_do_update(
+    index_elements=[StudentSchedule.student_id, StudentSchedule.weekday],
+    set_={"expected_time": _SCHEDULE_UPSERT.excluded.expected_time}
+)
+_SCHEDULE_DELETE = delete(StudentSchedule.__table__).where(and_(
+    StudentSchedule.student_id == bindparam("sid"),
+    StudentSchedule.weekday == bindparam("wd")
+))
+
+
+def parse_csv(text: str):
+    """CSV → [(줄 번호, 행 dict)], 모르는 머리글이 있으면 ValueError"""
+    reader = csv.reader(io.StringIO(text.lstrip("\ufeff")))
+    header = next(reader, None)
+    if not header:
+        raise ValueError("CSV가 비어 있습니다")
+
+    columns = []
+    for name in header:
+        key = name.strip().lower()
+        if key in CSV_COLUMNS:
+            columns.append(CSV_COLUMNS[key])
+        elif key in WEEKDAY_COLUMNS:
+            columns.append(WEEKDAY_COLUMNS[key])
+        elif key:
+            raise ValueError(f"알 수 없는 열: {name}")
+        else:
+            columns.append(None)
+    if "name" not in columns or "grade" not in columns:
+        raise ValueError("이름(name), 학년(grade) 열이 필요합니다")
+
+    rows = []
+    for line, values in enumerate(reader, 2):
+        if not any(value.strip() for value in values):
+            continue
+        row = {"schedules": []}
+        for column, value in zip(columns, values):
+            value = value.strip()
+            if column is None or not value:
+                continue
+            if isinstance(column, int):
+                row["schedules"].append({"weekday": column, "expected_time": value})
+            else:
+                row[column] = value
+        rows.append((line, row))
+    return rows
+
+
+def parse_json(data):
+    """[{...}] 또는 {"students": [{...}]} → [(행 번호, 행 dict)]"""
+    students = data.get("students") if isinstance(data, dict) else data
+    if not isinstance(students, list):
+        raise ValueError("학생 목록(students)이 필요합니다")
+    return list(enumerate(students, 1))
+
+
+def _error_message(error: ValidationError, raw: dict):
+    first = error.errors()[0]
+    loc = list(first["loc"])
+    # schedules.0.expected_time → 월요일.expected_time (CSV에서 어느 칸인지 알 수 있게)
+    if len(loc) >= 2 and loc[0] == "schedules" and isinstance(loc[1], int):
+        weekday = raw["schedules"][loc[1]].get("weekday") if isinstance(raw["schedules"][loc[1]], dict) else None
+        if isinstance(weekday, int) and 0 <= weekday <= 6:
+            loc[:2] = ["월화수목금토일"[weekday] + "요일"]
+    where = ".".join(str(part) for part in loc)
+    return f"{where}: {first['msg']}" if where else first["msg"]
+
+
+def _validate(db: Session, rows):
+    """모든 행 검사 → (결과 items, 저장할 [(item, StudentImportRow)])"""
+    phones = {}
+    by_phone, by_grade = {}, {}
+    for student in db.query(Student.id, Student.name, Student.grade, Student.parent_phone):
+        phones[student.id] = student.parent_phone
+        by_grade.setdefault((student.name, student.grade), []).append(student.id)
+        if student.parent_phone:
+            by_phone.setdefault((student.name, student.parent_phone), []).append(student.id)
+
+    def find(row):
+        # 연락처가 있으면 이름+연락처로, 없으면(또는 기존 학생에 연락처가 없으면) 이름+학년으로 찾음
+        same_grade = by_grade.get((row.name, row.grade), [])
+        if not row.parent_phone:
+            return same_grade
+        return by_phone.get((row.name, row.parent_phone)) or [i for i in same_grade if not phones[i]]
+
+    items, valid = [], []
+    seen = {}
+    for number, raw in rows:
+        item = {"row": number, "ok": False, "action": None, "student_id": None, "name": None, "schedules": 0, "error": None}
+        items.append(item)
+        if not isinstance(raw, dict):
+            item["error"] = "학생 정보는 객체여야 합니다"
+            continue
+        raw = {k: v.strip() if isinstance(v, str) else v for k, v in raw.items()}
+        if raw.get("parent_phone") == "":
+            raw["parent_phone"] = None
+        try:
+            row = StudentImportRow.model_validate(raw)
+        except ValidationError as e:
+            item["error"] = _error_message(e, raw)
+            continue
+        item["name"] = row.name
+
+        weekdays = [schedule.weekday for schedule in row.schedules]
+        if len(weekdays) != len(set(weekdays)):
+            item["error"] = "같은 요일 스케줄이 두 번 있습니다"
+            continue
+
+        if row.id is not None:
+            if row.id not in phones:
+                item["error"] = "학생 없음"
+                continue
+            student_id = row.id
+        else:
+            matches = find(row)
+            if len(matches) > 1:
+                item["error"] = f"같은 학생이 여러 명 있습니다 (id로 지정하세요: {', '.join(map(str, matches))})"
+                continue
+            student_id = matches[0] if matches else None
+
+        identity = student_id if student_id is not None else (row.name, row.grade, row.parent_phone)
+        if identity in seen:
+            item["error"] = f"{seen[identity]}행과 같은 학생입니다"
+            continue
+        seen[identity] = number
+
+        item.update(ok=True, action="updated" if student_id else "created", student_id=student_id, schedules=len(row.schedules))
+        valid.append((item, row))
+    return items, valid
+
+
+def _save_batch(db: Session, batch, replace_schedules: bool):
+    """검사를 통과한 학생들을 한 트랜잭션으로 저장 (커밋은 호출하는 쪽에서)"""
+    created = [(item, row) for item, row in batch if item["action"] == "created"]
+    updated = [(item, row) for item, row in batch if item["action"] == "updated"]
+
+    if created:
+        # RETURNING 순서를 맞추라고 하면(sort_by_parameter_order) SQLite에서는 한 행씩 INSERT 하므로,
+        # 여러 행씩 넣고 (이름, 학년, 연락처)로 새 id를 맞춤 (새 학생끼리는 검사에서 겹치지 않게 걸러둠)
+        result = db.execute(
+            insert(Student).returning(Student.id, Student.name, Student.grade, Student.parent_phone),
+            [{"name": row.name, "grade": row.grade, "parent_phone": row.parent_phone} for _, row in created]
+        )
+        new_ids = {(r.name, r.grade, r.parent_phone): r.id for r in result}
+        for item, row in created:
+            item["student_id"] = new_ids[(row.name, row.grade, row.parent_phone)]
+    if updated:
+        # 연락처를 비워둔 행은 기존 연락처를 그대로 둠
+        db.execute(update(Student), [
+            {"id": item["student_id"], "name": row.name, "grade": row.grade,
+             **({"parent_phone": row.parent_phone} if row.parent_phone else {})}
+            for item, row in updated
+        ])
+
+    schedules = [
+        {"student_id": item["student_id"], "weekday": schedule.weekday, "expected_time": schedule.expected_time}
+        for item, row in batch for schedule in row.schedules
+    ]
+    if schedules:
+        db.execute(_SCHEDULE_UPSERT, schedules)
+
+    if replace_schedules and updated:
+        keep = {(item["student_id"], schedule.weekday) for item, row in updated for schedule in row.schedules}
+        stale = [
+            {"sid": s.student_id, "wd": s.weekday}
+            for s in db.query(StudentSchedule.student_id, StudentSchedule.weekday).filter(
+                StudentSchedule.student_id.in_([item["student_id"] for item, _ in updated])
+            )
+            if (s.student_id, s.weekday) not in keep
+        ]
+        if stale:
+            db.execute(_SCHEDULE_DELETE, stale)
+
+
+def import_students(db: Session, rows, replace_schedules: bool = False, dry_run: bool = False):
+    """
+    rows: parse_csv / parse_json 결과 [(행 번호, 행 dict)]
+    반환: {"total", "created", "updated", "failed", "dry_run", "items"} (items는 행 순서대로)
+    """
+    items, valid = _validate(db, rows)
+
+    if not dry_run:
+        for i in range(0, len(valid), IMPORT_BATCH_SIZE):
+            batch = valid[i:i + IMPORT_BATCH_SIZE]
+            try:
+                _save_batch(db, batch, replace_schedules)
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                logger.exception("학생 일괄 등록 실패 (%d~%d행)", batch[0][0]["row"], batch[-1][0]["row"])
+                for item, _ in batch:
+                    if item["action"] == "created":
+                        item["student_id"] = None
+                    item.update(ok=False, action=None, schedules=0, error=f"저장 실패: {e.__class__.__name__}")
+        if valid:
+            roster_cache.invalidate()
+
+    ok = [item for item in items if item["ok"]]
+    return {
+        "total": len(items),
+        "created": sum(1 for item in ok if item["action"] == "created"),
+        "updated": sum(1 for item in ok if item["action"] == "updated"),
+        "failed": len(items) - len(ok),
+        "dry_run": dry_run,
+        "items": items,
+    }
+
+
+if __name__ == "__main__":
+    from backend.database import SessionLocal
+    from backend.utils.log import setup_logging
+
+    parser = argparse.ArgumentParser(description="학생 + 요일별 스케줄 일괄 등록")
+    parser.add_argument("path", help="CSV 또는 JSON 파일")
+    parser.add_argument("--dry-run", action="store_true", help="검사만 하고 저장하지 않음")
+    parser.add_argument("--replace-schedules", action="store_true", help="파일에 없는 요일 스케줄은 삭제")
+    args = parser.parse_args()
+
+    setup_logging()
+    with open(args.path, encoding="utf-8-sig") as f:
+        text = f.read()
+    try:
+        parsed = parse_json(json.loads(text)) if args.path.lower().endswith(".json") else parse_csv(text)
+    except ValueError as e:
+        sys.exit(f"파일 형식 오류: {e}")
+
+    db = SessionLocal()
+    try:
+        started = timer.perf_counter()
+        result = import_students(db, parsed, replace_schedules=args.replace_schedules, dry_run=args.dry_run)
+    finally:
+        db.close()
+
+    for item in result["items"]:
+        if not item["ok"]:
+            print(f"{item['row']}행: {item['error']}")
+    print(
+        f"{'검사' if args.dry_run else '저장'} 완료: 전체 {result['total']}명, 새로 등록 {result['created']}명, "
+        f"수정 {result['updated']}명, 오류 {result['failed']}행 ({timer.perf_counter() - started:.1f}초)"
+    )
+    sys.exit(1 if result["failed"] else 0)
@@ -0,0 +1,382 @@
+"""
+전체 API 벤치마크
+
+임시 DB에 가짜 데이터(benchmarks.seed)를 넣고, backend/routers 의 API를 앱 안에서 직접
+(httpx ASGITransport, 네트워크 없이) 호출하면서 API별로 다음을 측정합니다.
+- 응답 시간 p50 / p95 / p99
+- 요청당 SQL 수 (MetricsMiddleware의 Server-Timing 헤더)
+- 요청 처리 중 Python 메모리 최대 사용량 (tracemalloc)
+
+리포트 이미지는 pillow 방식으로 임시 폴더에 그립니다 (Chromium 불필요, static/reports는 건드리지 않음).
+SSE(/report-jobs/{id}/events)는 연결이 계속 유지되는 API라 제외합니다.
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.api_latency                       # small 프로필 (학생 200명, 1년)
+    python -m benchmarks.api_latency --profile large       # 학생 2,000명, 5년
+    python -m benchmarks.api_latency --save-baseline       # 결과를 기준값으로 저장
+    python -m benchmarks.api_latency --compare             # 기준값과 비교 (느려졌으면 종료 코드 1)
+
+기준값(benchmarks/baseline.json)은 실행한 컴퓨터에 따라 달라지므로,
+비교는 같은 컴퓨터에서 저장한 기준값으로 하세요. SQL 수는 컴퓨터와 관계없이 비교됩니다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time as timer
+import tracemalloc
+from datetime import date, timedelta
+
+# 앱을 import 하기 전에 임시 DB / 임시 리포트 폴더로 바꿔둠
+_tmp = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'bigmama.db')}"
+os.environ["REPORT_OUTPUT_DIR"] = os.path.join(_tmp.name, "reports")
+os.environ.setdefault("REPORT_RENDER_BACKEND", "pillow")
+os.environ.setdefault("SMS_PROVIDER", "fake")
+os.environ.setdefault("SLOW_REQUEST_MS", "1000000")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx  # noqa: E402
+
+from backend.database import engine  # noqa: E402
+from backend.main import app  # noqa: E402
+from backend.migrations import upgrade  # noqa: E402
+from backend.utils.providers import providers  # noqa: E402
+from benchmarks.seed import PROFILES, seed_database  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# 기준값 대비 p95가 이 비율 이상 느려지고, 차이가 MIN_REGRESSION_MS 이상이면 회귀로 판단
+DEFAULT_TOLERANCE = 0.5
+MIN_REGRESSION_MS = 2.0
+
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+class Context:
+    """시나리오가 요청을 만들 때 쓰는 데이터 (seed 결과 기준)"""
+
+    def __init__(self, counts, today: date, seed: int):
+        self.rng = random.Random(seed)
+        self.today = today
+        self.students = counts["students"]
+        self.logs = counts["daily_logs"]
+        self.consultations = counts["consultations"]
+        self.token = None
+        self.rendered_logs = []
+        self.job_ids = []
+
+        task_ids = list(range(1, counts["daily_tasks"] + 1))
+        consultation_ids = list(range(1, counts["consultations"] + 1))
+        self.rng.shuffle(task_ids)
+        self.rng.shuffle(consultation_ids)
+        self.deletable_tasks = task_ids
+        self.deletable_consultations = consultation_ids
+
+    def student(self):
+        return self.rng.randint(1, self.students)
+
+    def recent_log(self):
+        # 일지 id는 날짜순이므로 뒤쪽 5%가 최근 일지
+        return self.rng.randint(max(1, self.logs - self.logs // 20), self.logs)
+
+    def recent_day(self):
+        return self.today - timedelta(days=self.rng.randint(0, 30))
+
+
+def _attendance(ctx):
+    return {
+        "student_id": ctx.student(), "date": str(ctx.today), "status": "present",
+        "check_in": f"{ctx.rng.randint(14, 19)}:{ctx.rng.choice(('00', '15', '30'))}"
+    }
+
+
+def _consultation(ctx):
+    return {
+        "student_id": ctx.student(), "student_name": "벤치", "student_grade": "중1",
+        "date": str(ctx.today + timedelta(days=ctx.rng.randint(0, 14))), "time": "17:30"
+    }
+
+
+def _remember_rendered(ctx, response):
+    if response.status_code < 400:
+        ctx.rendered_logs.append(int(response.url.path.split("/")[-2]))
+
+
+def _remember_job(ctx, response):
+    if response.status_code < 400:
+        ctx.job_ids.append(response.json()["id"])
+
+
+# (이름, 요청 생성 함수 → (method, url, json), 반복 횟수 배율, 응답 후 처리)
+SCENARIOS = [
+    ("auth.login", lambda c: ("POST", "/api/auth/login", {"username": "bigmama", "password": "1234"}), 1, None),
+    ("auth.me", lambda c: ("GET", f"/api/auth/me?token={c.token}", None), 1, None),
+    ("auth.logout", lambda c: ("POST", "/api/auth/logout?token=unknown", None), 1, None),
+
+    ("students.list", lambda c: ("GET", "/api/students/", None), 1, None),
+    ("students.create", lambda c: ("POST", "/api/students/", {"name": "벤치", "grade": "중1"}), 1, None),
+    ("students.update", lambda c: ("PUT", f"/api/students/{c.student()}", {"parent_phone": "010-0000-0000"}), 1, None),
+
+    ("schedules.list", lambda c: ("GET", f"/api/students/{c.student()}/schedules/", None), 1, None),
+    ("schedules.upsert", lambda c: (
+        "POST", f"/api/students/{c.student()}/schedules/",
+        {"weekday": c.rng.randint(0, 5), "expected_time": "16:00"}
+    ), 1, None),
+
+    ("attendance.today", lambda c: ("GET", "/api/attendance/today", None), 1, None),
+    ("attendance.absent_today", lambda c: ("GET", "/api/attendance/absent/today", None), 1, None),
+    ("attendance.student", lambda c: ("GET", f"/api/attendance/student/{c.student()}", None), 1, None),
+    ("attendance.save", lambda c: ("POST", "/api/attendance/", _attendance(c)), 1, None),
+    ("attendance.bulk_50", lambda c: ("POST", "/api/attendance/bulk", {"records": [_attendance(c) for _ in range(50)]}), 1, None),
+    ("attendance.mark_scheduled", lambda c: (
+        "POST", "/api/attendance/mark-scheduled", {"date": str(c.today), "status": "absent"}
+    ), 1, None),
+    ("attendance.stats_monthly", lambda c: ("GET", f"/api/attendance/stats/monthly?month={c.recent_day():%Y-%m}", None), 1, None),
+    ("attendance.stats_student", lambda c: ("GET", f"/api/attendance/stats/student/{c.student()}", None), 1, None),
+    ("attendance.stats_grades", lambda c: ("GET", "/api/attendance/stats/grades", None), 1, None),
+
+    ("daily_logs.student", lambda c: ("GET", f"/api/daily-logs/student/{c.student()}", None), 1, None),
+    ("daily_logs.by_date", lambda c: ("GET", f"/api/daily-logs/student/{c.student()}/date/{c.recent_day()}", None), 1, None),
+    ("daily_logs.range", lambda c: (
+        "GET", f"/api/daily-logs/student/{c.student()}/range?start_date={c.today - timedelta(days=90)}&end_date={c.today}&limit=20", None
+    ), 1, None),
+    ("daily_logs.create", lambda c: (
+        "POST", "/api/daily-logs/",
+        {"student_id": c.student(), "date": str(c.today), "tasks": [{"content": "교재 풀기"}, {"content": "오답 정리"}]}
+    ), 1, None),
+    ("daily_logs.image", lambda c: ("POST", f"/api/daily-logs/{c.recent_log()}/image", None), 1, _remember_rendered),
+    ("daily_logs.image_file", lambda c: (
+        "GET", f"/api/daily-logs/{c.rng.choice(c.rendered_logs) if c.rendered_logs else 1}/image-file", None
+    ), 1, None),
+    ("daily_logs.images_batch", lambda c: (
+        "POST", "/api/daily-logs/images/batch", {"date": str(c.today - timedelta(days=1)), "grade": "중1"}
+    ), 0.1, None),
+    ("daily_logs.images_batch_zip", lambda c: (
+        "GET", f"/api/daily-logs/images/batch.zip?date={c.today - timedelta(days=1)}&grade=중1", None
+    ), 0.1, None),
+    ("daily_logs.renderer_metrics", lambda c: ("GET", "/api/daily-logs/renderer/metrics", None), 1, None),
+
+    ("daily_tasks.update", lambda c: (
+        "PUT", f"/api/daily-tasks/{c.rng.randint(1, len(c.deletable_tasks))}", {"grading_done": True}
+    ), 1, None),
+    ("daily_tasks.delete", lambda c: ("DELETE", f"/api/daily-tasks/{c.deletable_tasks.pop()}", None), 1, None),
+
+    ("consultations.range", lambda c: (
+        "GET", f"/api/consultations/?start_date={c.today.replace(day=1)}&end_date={c.today.replace(day=1) + timedelta(days=34)}", None
+    ), 1, None),
+    ("consultations.calendar", lambda c: ("GET", f"/api/consultations/calendar?month={c.recent_day():%Y-%m}", None), 1, None),
+    ("consultations.page_scheduled", lambda c: ("GET", "/api/consultations/page?status=scheduled&limit=50", None), 1, None),
+    ("consultations.page_student", lambda c: (
+        "GET", f"/api/consultations/page?student_id={c.student()}&order=desc", None
+    ), 1, None),
+    ("consultations.by_date", lambda c: ("GET", f"/api/consultations/date/{c.recent_day()}", None), 1, None),
+    ("consultations.get", lambda c: ("GET", f"/api/consultations/{c.rng.randint(1, c.consultations)}", None), 1, None),
+    ("consultations.free_slots", lambda c: ("GET", "/api/consultations/free-slots?limit=10", None), 1, None),
+    # 같은 시간에 여러 번 잡으므로 충돌 확인까지 한 뒤 겹쳐서 저장
+    ("consultations.create", lambda c: ("POST", "/api/consultations/?allow_overlap=true", _consultation(c)), 1, None),
+    ("consultations.update", lambda c: (
+        "PUT", f"/api/consultations/{c.rng.randint(1, c.consultations)}", {"notes": "벤치마크 메모"}
+    ), 1, None),
+    ("consultations.delete", lambda c: ("DELETE", f"/api/consultations/{c.deletable_consultations.pop()}", None), 1, None),
+
+    # 한 달치 내보내기 (응답을 끝까지 받음)
+    ("exports.attendance_csv", lambda c: (
+        "GET", f"/api/exports/attendance?start_date={c.today - timedelta(days=30)}&end_date={c.today}", None
+    ), 0.1, None),
+    ("exports.daily_logs_xlsx", lambda c: (
+        "GET", f"/api/exports/daily-logs?start_date={c.today - timedelta(days=30)}&end_date={c.today}&format=xlsx", None
+    ), 0.1, None),
+    ("exports.consultations_csv", lambda c: (
+        "GET", f"/api/exports/consultations?start_date={c.today - timedelta(days=30)}&end_date={c.today}", None
+    ), 0.1, None),
+
+    ("report_jobs.create", lambda c: ("POST", "/api/report-jobs/", {"daily_log_id": c.recent_log()}), 1, _remember_job),
+    ("report_jobs.get", lambda c: ("GET", f"/api/report-jobs/{c.rng.choice(c.job_ids) if c.job_ids else 1}", None), 1, None),
+
+    ("sms.absent_10", lambda c: ("POST", "/api/sms/absent", {"student_ids": [c.student() for _ in range(10)]}), 1, None),
+    ("sms.messages", lambda c: ("GET", "/api/sms/messages", None), 1, None),
+
+    ("system.logging", lambda c: ("GET", "/api/_system/logging", None), 1, None),
+    ("system.metrics", lambda c: ("GET", "/api/_metrics", None), 1, None),
+]
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(p / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+async def _call(client, ctx, make_request, after):
+    method, url, body = make_request(ctx)
+    started = timer.perf_counter()
+    response = await client.request(method, url, json=body)
+    await response.aread()
+    elapsed = (timer.perf_counter() - started) * 1000
+
+    match = _QUERIES.search(response.headers.get("server-timing", ""))
+    if after:
+        after(ctx, response)
+    return elapsed, int(match.group(1)) if match else 0, response.status_code
+
+
+async def run_scenarios(client, ctx, iterations, names=None):
+    results = {}
+    for name, make_request, scale, after in SCENARIOS:
+        if names and not any(name.startswith(n) for n in names):
+            continue
+        n = max(3, int(iterations * scale))
+
+        # 워밍업 (첫 호출의 import/캐시 비용 제외)
+        await _call(client, ctx, make_request, after)
+
+        latencies, queries, errors = [], [], 0
+        for _ in range(n):
+            elapsed, count, status = await _call(client, ctx, make_request, after)
+            latencies.append(elapsed)
+            queries.append(count)
+            errors += status >= 400
+
+        # 메모리는 따로 몇 번 더 호출해서 측정 (tracemalloc은 느려서 시간 측정과 분리)
+        tracemalloc.start()
+        for _ in range(min(3, n)):
+            await _call(client, ctx, make_request, after)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        latencies.sort()
+        results[name] = {
+            "n": n,
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "queries": max(queries),
+            "peak_kb": round(peak / 1024),
+            "errors": errors,
+        }
+    return results
+
+
+def _rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+
+def print_results(results, baseline=None):
+    header = f"{'API':<32} {'n':>4} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'SQL':>5} {'peak KB':>8} {'err':>4}"
+    if baseline:
+        header += f" {'p95 기준':>9} {'SQL 기준':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        line = (
+            f"{name:<32} {r['n']:>4} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} "
+            f"{r['queries']:>5} {r['peak_kb']:>8} {r['errors']:>4}"
+        )
+        base = (baseline or {}).get(name)
+        if base:
+            line += f" {base['p95_ms']:>9.1f} {base['queries']:>8}"
+        print(line)
+
+
+def find_regressions(results, baseline, tolerance):
+    problems = []
+    for name, r in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if r["queries"] > base["queries"]:
+            problems.append(f"{name}: SQL {base['queries']} → {r['queries']}")
+        if r["p95_ms"] > base["p95_ms"] * (1 + tolerance) and r["p95_ms"] - base["p95_ms"] >= MIN_REGRESSION_MS:
+            problems.append(f"{name}: p95 {base['p95_ms']:.1f}ms → {r['p95_ms']:.1f}ms")
+    return problems
+
+
+async def run(options, iterations, seed, names):
+    today = date.today()
+    upgrade(engine)
+
+    started = timer.perf_counter()
+    counts = await asyncio.to_thread(seed_database, engine, seed=seed, end=today, **options)
+    print(f"데이터 생성 ({timer.perf_counter() - started:.1f}초): " + ", ".join(f"{k} {v:,}" for k, v in counts.items()))
+
+    ctx = Context(counts, today, seed)
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        # 백그라운드 warm-up(템플릿 등 지연 로딩)이 끝난 뒤부터 측정
+        while providers.warm_up_ms is None:
+            await asyncio.sleep(0.01)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            login = await client.post("/api/auth/login", json={"username": "bigmama", "password": "1234"})
+            ctx.token = login.json()["token"]
+            # 프론트엔드처럼 모든 API 요청에 로그인 토큰을 붙임
+            client.headers["Authorization"] = f"Bearer {ctx.token}"
+            return await run_scenarios(client, ctx, iterations, names)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 API 벤치마크")
+    parser.add_argument("--profile", choices=PROFILES, default="small")
+    parser.add_argument("--students", type=int)
+    parser.add_argument("--years", type=int)
+    parser.add_argument("--iterations", type=int, default=50, help="API당 요청 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", nargs="*", help="이 이름으로 시작하는 API만 (예: attendance daily_logs.image)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="p95 허용 증가 비율")
+    args = parser.parse_args()
+
+    options = dict(PROFILES[args.profile])
+    if args.students is not None:
+        options["students"] = args.students
+    if args.years is not None:
+        options["years"] = args.years
+    config = {"options": options, "iterations": args.iterations, "seed": args.seed}
+
+    results = asyncio.run(run(options, args.iterations, args.seed, args.only))
+    engine.dispose()
+
+    baseline = None
+    if args.compare:
+        with open(args.baseline, encoding="utf-8") as f:
+            saved = json.load(f)
+        if saved["config"] != config:
+            print(f"⚠️ 기준값과 설정이 다릅니다: {saved['config']} / 현재 {config}")
+        baseline = saved["results"]
+
+    print()
+    print_results(results, baseline)
+    rss = _rss_mb()
+    if rss is not None:
+        print(f"\n최대 메모리(RSS): {rss:.0f} MB")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"config": config, "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"기준값 저장: {args.baseline}")
+
+    if baseline:
+        problems = find_regressions(results, baseline, args.tolerance)
+        if problems:
+            print("\n기준값보다 나빠진 API:")
+            for problem in problems:
+                print(f"  {problem}")
+            return 1
+        print("\n기준값 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
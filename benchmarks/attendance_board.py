@@ -0,0 +1,147 @@
+"""
+/attendance/today 출석 현황 계산 벤치마크
+
+학생 수를 늘려가며 기존 방식(학생마다 출석/스케줄 쿼리 2번, 2N+1)과
+backend.utils.attendance_board 방식을 비교합니다.
+- cold: 명단 캐시를 비운 상태 (학생 + 요일 스케줄 + 출석 쿼리 3번)
+- cached: 명단 캐시가 있는 상태 (출석 쿼리 1번)
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.attendance_board
+    python -m benchmarks.attendance_board --sizes 50 500 5000 20000 --repeat 5
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time as timer
+from datetime import date, datetime, time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import Base
+from backend.models import Attendance, Student, StudentSchedule
+from backend.utils.attendance_board import build_today_board, decide_status
+from backend.utils.roster_cache import roster_cache
+
+
+def seed(db, n_students: int, today: date):
+    rng = random.Random(n_students)
+    weekday = today.weekday()
+
+    db.bulk_insert_mappings(Student, [
+        {"id": i, "name": f"학생{i}", "grade": f"중{rng.randint(1, 3)}", "parent_phone": "010-0000-0000"}
+        for i in range(1, n_students + 1)
+    ])
+
+    schedules = []
+    attendance = []
+    for i in range(1, n_students + 1):
+        for wd in set(rng.sample(range(7), 3)) | {weekday}:
+            schedules.append({"student_id": i, "weekday": wd, "expected_time": time(rng.randint(14, 19), 0)})
+        if rng.random() < 0.5:
+            attendance.append({"student_id": i, "date": today, "status": "present", "check_in": time(15, 0)})
+
+    db.bulk_insert_mappings(StudentSchedule, schedules)
+    db.bulk_insert_mappings(Attendance, attendance)
+    db.commit()
+
+
+def legacy_board(db, today: date, now: time):
+    """기존 get_today_attendance 구현 (학생마다 쿼리 2번)"""
+    weekday = today.weekday()
+    summary = {"present": 0, "late_or_absent": 0, "unchecked": 0}
+    result = []
+
+    for student in db.query(Student).all():
+        attendance = db.query(Attendance).filter(
+            Attendance.student_id == student.id,
+            Attendance.date == today
+        ).first()
+        schedule = db.query(StudentSchedule).filter(
+            StudentSchedule.student_id == student.id,
+            StudentSchedule.weekday == weekday
+        ).first()
+
+        status = decide_status(
+            now,
+            schedule.expected_time if schedule else None,
+            attendance.status if attendance else None,
+            attendance.check_in if attendance else None,
+        )
+        summary[status] += 1
+        result.append({"student_id": student.id, "status": status})
+
+    return {"summary": summary, "students": result}
+
+
+def measure(fn, session_factory, today, now, repeat, before=None):
+    samples = []
+    for _ in range(repeat):
+        if before:
+            before()
+        db = session_factory()
+        try:
+            started = timer.perf_counter()
+            fn(db, today, now)
+            samples.append((timer.perf_counter() - started) * 1000)
+        finally:
+            db.close()
+    return statistics.median(samples)
+
+
+def run(sizes, repeat, skip_legacy_over):
+    today = date.today()
+    now = datetime.now().time()
+
+    print(
+        f"{'students':>9} | {'queries':>7} | {'cold ms':>8} | "
+        f"{'queries':>7} | {'cached ms':>9} | {'legacy ms':>10}"
+    )
+    print("-" * 66)
+
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            Base.metadata.create_all(bind=engine)
+            Session = sessionmaker(bind=engine, autoflush=False)
+
+            db = Session()
+            seed(db, n, today)
+            db.close()
+
+            queries = []
+            event.listen(engine, "before_cursor_execute", lambda *a, **k: queries.append(1))
+
+            queries.clear()
+            cold_ms = measure(build_today_board, Session, today, now, repeat, before=roster_cache.invalidate)
+            cold_queries = len(queries) // repeat
+
+            queries.clear()
+            cached_ms = measure(build_today_board, Session, today, now, repeat)
+            cached_queries = len(queries) // repeat
+
+            if n <= skip_legacy_over:
+                legacy_ms = f"{measure(legacy_board, Session, today, now, repeat):10.1f}"
+            else:
+                legacy_ms = f"{'skipped':>10}"
+
+            print(
+                f"{n:>9} | {cold_queries:>7} | {cold_ms:>8.1f} | "
+                f"{cached_queries:>7} | {cached_ms:>9.1f} | {legacy_ms}"
+            )
+            roster_cache.invalidate()
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="출석 현황 계산 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 2000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-legacy-over", type=int, default=5000,
+                        help="이 학생 수보다 크면 기존 방식 측정은 생략 (너무 느림)")
+    args = parser.parse_args()
+
+    run(args.sizes, args.repeat, args.skip_legacy_over)
@@ -0,0 +1,106 @@
+"""
+월간 출석 집계(attendance_monthly) 벤치마크
+
+몇 년 치 출석 기록에서
+- 통계를 attendance 원본으로 바로 계산할 때와 집계 테이블에서 읽을 때 (학년별 12개월, 한 달 학생별)
+- 출석 저장 때 추가되는 집계 갱신 비용 (학생 1명 / 한 요일 수업 학생 전체)
+- 전체 다시 만들기 시간
+을 비교합니다.
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.attendance_rollup
+    python -m benchmarks.attendance_rollup --students 2000 --years 5
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time as timer
+from datetime import date, timedelta
+
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import create_db_engine
+from backend.migrations import upgrade
+from backend.models import Attendance, AttendanceMonthly, Student, StudentSchedule
+from backend.utils.attendance_rollup import _rollup_source, month_start, next_month, rebuild_rollups, refresh_rollups
+from benchmarks.seed import seed_database
+
+
+def measure(fn, repeat: int):
+    times = []
+    for _ in range(repeat):
+        started = timer.perf_counter()
+        fn()
+        times.append((timer.perf_counter() - started) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="월간 출석 집계 벤치마크")
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    engine = create_db_engine(f"sqlite:///{os.path.join(tmp.name, 'rollup.db')}")
+    upgrade(engine)
+    counts = seed_database(engine, students=args.students, years=args.years)
+    db = sessionmaker(bind=engine)()
+    print(f"출석 {counts['attendance']:,}건 → 월간 집계 {counts['attendance_monthly']:,}행\n")
+
+    this_month = month_start(date.today())
+    year_ago = date(this_month.year - 1, this_month.month, 1)
+
+    # 학년별 최근 12개월
+    def grades_raw():
+        source = _rollup_source(Attendance.date >= year_ago).subquery()
+        db.query(Student.grade, source.c[1], func.sum(source.c[2])).join(
+            source, source.c.student_id == Student.id
+        ).group_by(Student.grade, source.c[1]).all()
+
+    def grades_rollup():
+        db.query(Student.grade, AttendanceMonthly.month, func.sum(AttendanceMonthly.present)).join(
+            Student, Student.id == AttendanceMonthly.student_id
+        ).filter(AttendanceMonthly.month >= year_ago).group_by(Student.grade, AttendanceMonthly.month).all()
+
+    # 한 달 학생별
+    def month_raw():
+        db.execute(_rollup_source(Attendance.date >= this_month, Attendance.date < next_month(this_month))).all()
+
+    def month_rollup():
+        db.query(AttendanceMonthly).filter(AttendanceMonthly.month == this_month).all()
+
+    # 요일 전체 처리는 이번 주 월요일 기준 (주말에 돌려도 수업 학생이 있도록)
+    monday = date.today() - timedelta(days=date.today().weekday())
+    weekday_students = [
+        row.student_id for row in
+        db.query(StudentSchedule.student_id).filter(StudentSchedule.weekday == monday.weekday())
+    ]
+
+    def refresh_one():
+        refresh_rollups(db, [(1, monday)])
+        db.rollback()
+
+    def refresh_weekday():
+        refresh_rollups(db, [(student_id, monday) for student_id in weekday_students])
+        db.rollback()
+
+    def rebuild():
+        rebuild_rollups(db)
+        db.commit()
+
+    print(f"{'':34}{'중앙값 ms':>10}")
+    print(f"{'학년별 12개월 (attendance 원본)':34}{measure(grades_raw, args.repeat):10.2f}")
+    print(f"{'학년별 12개월 (월간 집계)':34}{measure(grades_rollup, args.repeat):10.2f}")
+    print(f"{'한 달 학생별 (attendance 원본)':34}{measure(month_raw, args.repeat):10.2f}")
+    print(f"{'한 달 학생별 (월간 집계)':34}{measure(month_rollup, args.repeat):10.2f}")
+    print(f"{'저장 시 갱신: 학생 1명':34}{measure(refresh_one, args.repeat * 10):10.2f}")
+    print(f"{f'저장 시 갱신: 요일 전체 {len(weekday_students)}명':34}{measure(refresh_weekday, args.repeat):10.2f}")
+    print(f"{'전체 다시 만들기':34}{measure(rebuild, 3):10.2f}")
+
+
+if __name__ == "__main__":
+    main()
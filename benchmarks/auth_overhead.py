@@ -0,0 +1,113 @@
+"""
+인증 의존성(require_auth) 비용 측정
+
+1) require_auth 자체 호출 시간 (캐시 적중 / 잘못된 토큰 / 캐시 미스 → DB 조회)
+2) 같은 API를 인증 없이 / 인증 붙여서 호출했을 때 요청당 차이 (FastAPI 의존성 처리 포함)
+
+캐시 적중 시 수 마이크로초 안쪽이어야 모든 API에 붙여도 부담이 없습니다.
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.auth_overhead
+    python -m benchmarks.auth_overhead --iterations 200000
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time as timer
+
+# 앱을 import 하기 전에 임시 DB로 바꿔둠
+_tmp = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'auth.db')}"
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI, HTTPException  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+
+from backend.database import engine  # noqa: E402
+from backend.migrations import upgrade  # noqa: E402
+from backend.utils.auth import require_auth  # noqa: E402
+from backend.utils.session_store import session_store  # noqa: E402
+
+
+def _request(token: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/api/students/",
+        "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+    })
+
+
+async def _time_calls(make_request, iterations: int, before=None):
+    """require_auth 1회 평균 시간 (us)"""
+    total = 0.0
+    for _ in range(iterations):
+        request = make_request()
+        if before:
+            before()
+        started = timer.perf_counter()
+        try:
+            await require_auth(request)
+        except HTTPException:
+            pass
+        total += timer.perf_counter() - started
+    return total / iterations * 1_000_000
+
+
+async def _time_requests(app: FastAPI, headers, iterations: int):
+    """ASGI로 요청 1회 평균 시간 (us)"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+        for _ in range(200):
+            await client.get("/ping")
+        started = timer.perf_counter()
+        for _ in range(iterations):
+            await client.get("/ping")
+        return (timer.perf_counter() - started) / iterations * 1_000_000
+
+
+def _ping_app(dependencies):
+    app = FastAPI()
+
+    @app.get("/ping", dependencies=dependencies)
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def run(iterations: int):
+    upgrade(engine)
+    token = session_store.create(1, "선생님", "bigmama")
+
+    await require_auth(_request(token))
+    hit = await _time_calls(lambda: _request(token), iterations)
+    invalid = await _time_calls(lambda: _request("invalid-token"), iterations)
+    miss = await _time_calls(lambda: _request(token), max(iterations // 100, 100), before=session_store._cache.clear)
+
+    print(f"require_auth 1회 ({iterations:,}번 평균)")
+    print(f"  캐시 적중            {hit:8.2f} us")
+    print(f"  잘못된 토큰 (캐시)   {invalid:8.2f} us")
+    print(f"  캐시 미스 (DB 조회)  {miss:8.2f} us")
+
+    request_iterations = max(iterations // 20, 1000)
+    headers = {"Authorization": f"Bearer {token}"}
+    plain = await _time_requests(_ping_app([]), headers, request_iterations)
+    authed = await _time_requests(_ping_app([Depends(require_auth)]), headers, request_iterations)
+    print(f"\nGET /ping 요청 1회 ({request_iterations:,}번 평균)")
+    print(f"  인증 없음            {plain:8.1f} us")
+    print(f"  require_auth         {authed:8.1f} us  (차이 {authed - plain:+.1f} us)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인증 의존성 비용 측정")
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
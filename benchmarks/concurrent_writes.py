@@ -0,0 +1,110 @@
+"""
+동시 출석 저장 벤치마크 (등원 시간대처럼 여러 요청이 한꺼번에 쓰는 상황)
+
+여러 스레드가 동시에 POST /attendance/ 와 같은 방식(조회 → 수정/추가 → 커밋)으로
+출석을 저장하고, 중간중간 출석 현황을 조회합니다.
+기본 SQLite 설정(rollback journal, synchronous=FULL)과
+backend.database의 PRAGMA 설정(WAL 등)을 비교합니다.
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.concurrent_writes
+    python -m benchmarks.concurrent_writes --threads 16 --writes 200
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time as timer
+from datetime import date, time
+
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import SQLITE_PRAGMAS, Base, create_db_engine
+from backend.models import Attendance, Student
+from backend.utils.attendance_board import build_today_board
+
+DEFAULT_PRAGMAS = {}
+
+
+def upsert_attendance(db, student_id: int, today: date):
+    record = db.query(Attendance).filter(
+        Attendance.student_id == student_id,
+        Attendance.date == today
+    ).first()
+    if record:
+        record.status = "present"
+        record.check_in = time(16, 0)
+    else:
+        db.add(Attendance(student_id=student_id, date=today, status="present", check_in=time(16, 0)))
+    db.commit()
+
+
+def run_case(name, pragmas, n_threads, n_writes, n_students):
+    today = date.today()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}", pragmas=pragmas)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        db = Session()
+        db.bulk_insert_mappings(Student, [
+            {"id": i, "name": f"학생{i}", "grade": "중1"} for i in range(1, n_students + 1)
+        ])
+        db.commit()
+        db.close()
+
+        latencies = []
+        errors = []
+        lock = threading.Lock()
+
+        def worker(offset):
+            for i in range(n_writes):
+                db = Session()
+                started = timer.perf_counter()
+                try:
+                    if i % 5 == 4:
+                        build_today_board(db, today, time(17, 0))
+                    else:
+                        upsert_attendance(db, (i * n_threads + offset) % n_students + 1, today)
+                    elapsed = (timer.perf_counter() - started) * 1000
+                    with lock:
+                        latencies.append(elapsed)
+                except (OperationalError, IntegrityError) as e:
+                    # database is locked / 같은 학생 동시 추가
+                    db.rollback()
+                    with lock:
+                        errors.append(str(e.orig))
+                finally:
+                    db.close()
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(n_threads)]
+        started = timer.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        total = timer.perf_counter() - started
+        engine.dispose()
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0
+    print(
+        f"{name:>9} | {len(latencies) / total:>8.0f} | {statistics.median(latencies) if latencies else 0:>8.1f} | "
+        f"{p95:>8.1f} | {len(errors):>7}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="동시 출석 저장 벤치마크")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--writes", type=int, default=100, help="스레드당 요청 수")
+    parser.add_argument("--students", type=int, default=300)
+    args = parser.parse_args()
+
+    print(f"{'settings':>9} | {'req/s':>8} | {'p50 ms':>8} | {'p95 ms':>8} | {'errors':>7}")
+    print("-" * 52)
+    run_case("default", DEFAULT_PRAGMAS, args.threads, args.writes, args.students)
+    run_case("tuned", SQLITE_PRAGMAS, args.threads, args.writes, args.students)
@@ -0,0 +1,116 @@
+"""
+상담 일정 충돌 확인 / 빈 시간 찾기 벤치마크 (몇 년 치 상담 이력)
+
+seed.py로 상담 이력을 만들고, 앞으로 --busy-days일은 상담 가능 시간을 거의 다 채워서
+빈 시간 찾기가 여러 날을 건너뛰어야 하도록 만든 뒤 비교합니다.
+- 기존 방식: 상담 전체를 읽어서 같은 날 겹치는 상담을 찾음 (화면에서 전체 목록을 보고 고르던 것과 같은 양)
+- 충돌 확인: schedule_index.conflicts() (그 날짜만 DB에서 새로 읽음)
+- 빈 시간 찾기: schedule_index.free_slots() 1년 범위에서 10개, 캐시 없음(cold) / 있음(warm)
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.consultation_schedule
+    python -m benchmarks.consultation_schedule --years 10 --per-week 80 --busy-days 60
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time as timer
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import create_db_engine
+from backend.migrations import upgrade
+from backend.models import Consultation
+from backend.utils.consultation_schedule import (
+    CONSULTATION_CLOSE, CONSULTATION_OPEN, ScheduleIndex, from_minutes, to_minutes
+)
+from benchmarks.seed import seed_database
+
+
+def fill_busy_days(db, start: date, days: int, rng: random.Random):
+    """start부터 days일 동안 상담 가능 시간을 30~60분 상담으로 빈틈 없이 채움 (하루에 한두 자리만 20분 남김)"""
+    rows = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        minute = to_minutes(CONSULTATION_OPEN)
+        while minute < to_minutes(CONSULTATION_CLOSE):
+            length = rng.choice((30, 45, 60))
+            rows.append({
+                "student_name": "예약", "student_grade": "중1", "date": day, "time": from_minutes(minute),
+                "duration_minutes": length, "status": "scheduled",
+            })
+            minute += length + (20 if rng.random() < 0.05 else 0)
+    db.bulk_insert_mappings(Consultation, rows)
+    db.commit()
+    return len(rows)
+
+
+def legacy_conflicts(db, target: date, start: time, length: int):
+    """기존 방식: 전체 상담을 읽어서 겹치는 예정 상담 찾기"""
+    begin = to_minutes(start)
+    return [
+        c.id for c in db.query(Consultation).all()
+        if c.status == "scheduled" and c.date == target
+        and to_minutes(c.time) < begin + length and to_minutes(c.time) + c.duration_minutes > begin
+    ]
+
+
+def measure(fn, repeat: int):
+    times = []
+    for _ in range(repeat):
+        started = timer.perf_counter()
+        result = fn()
+        times.append((timer.perf_counter() - started) * 1000)
+    return statistics.median(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상담 일정 충돌 확인 / 빈 시간 찾기 벤치마크")
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--per-week", type=int, default=40, help="주당 상담 수")
+    parser.add_argument("--busy-days", type=int, default=30, help="앞으로 꽉 찬 날 수")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    engine = create_db_engine(f"sqlite:///{os.path.join(tmp.name, 'schedule.db')}")
+    upgrade(engine)
+    counts = seed_database(engine, students=500, years=args.years, consultations_per_week=args.per_week)
+    db = sessionmaker(bind=engine)()
+    rng = random.Random(1)
+    today = date.today()
+    busy = fill_busy_days(db, today + timedelta(days=1), args.busy_days, rng)
+    total = counts["consultations"] + busy
+    print(f"상담 {total:,}건 ({args.years}년 이력 {counts['consultations']:,} + 앞으로 {args.busy_days}일 꽉 찬 예약 {busy:,})\n")
+
+    index = ScheduleIndex()
+    target = today + timedelta(days=rng.randint(1, args.busy_days))
+    check = (target, time(15, 0), 30)
+
+    legacy_ms, legacy = measure(lambda: legacy_conflicts(db, *check), max(args.repeat // 5, 3))
+    check_ms, conflicts = measure(lambda: index.conflicts(db, *check), args.repeat)
+    assert sorted(legacy) == sorted(i for _, _, i in conflicts)
+
+    not_before = datetime.combine(today, time(23, 59))
+    end = today + timedelta(days=365)
+
+    def cold():
+        index._cache.clear()
+        return index.free_slots(db, today, end, 30, 10, not_before=not_before)
+
+    cold_ms, slots = measure(cold, args.repeat)
+    warm_ms, _ = measure(lambda: index.free_slots(db, today, end, 30, 10, not_before=not_before), args.repeat)
+
+    print(f"{'':28}{'중앙값 ms':>10}")
+    print(f"{'충돌 확인 (전체 읽기)':28}{legacy_ms:10.2f}")
+    print(f"{'충돌 확인 (날짜 인덱스)':28}{check_ms:10.2f}   겹침 {len(conflicts)}건")
+    print(f"{'빈 시간 10개 (cold)':28}{cold_ms:10.2f}")
+    print(f"{'빈 시간 10개 (warm)':28}{warm_ms:10.2f}")
+    print(f"\n첫 빈 시간: {slots[0][0]} {from_minutes(slots[0][1])}" if slots else "\n빈 시간 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+기간별 내보내기(/api/exports/...) 벤치마크
+
+몇 년 치 데이터를 전체 기간으로 내보낼 때
+- 기존 방식: 목록 API처럼 ORM 객체를 전부 읽어서 JSON 한 덩어리로 만듦
+- 스트리밍 CSV / XLSX: 엔드포인트가 돌려주는 StreamingResponse의 조각을 끝까지 읽음
+의 시간, 파일 크기, Python 메모리 최대 사용량(tracemalloc)을 비교합니다.
+스트리밍 쪽 메모리는 행 수와 상관없이 거의 일정해야 합니다.
+(tracemalloc은 느려서 시간은 따로 한 번 더 실행해서 잼)
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.export
+    python -m benchmarks.export --students 2000 --years 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time as timer
+import tracemalloc
+from datetime import date, timedelta
+
+# 앱을 import 하기 전에 임시 DB로 바꿔둠 (엔드포인트가 여는 세션도 이 DB를 씀)
+_tmp = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'export.db')}"
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from sqlalchemy.orm import selectinload  # noqa: E402
+
+from backend.database import SessionLocal, engine  # noqa: E402
+from backend.migrations import upgrade  # noqa: E402
+from backend.models import Attendance, Consultation, DailyLog  # noqa: E402
+from backend.routers.exports import export_attendance, export_consultations, export_daily_logs  # noqa: E402
+from benchmarks.seed import seed_database  # noqa: E402
+
+
+def legacy_json(model, start: date, end: date):
+    """기존 방식: 기간 전체를 ORM 객체로 읽어서 JSON으로"""
+    db = SessionLocal()
+    try:
+        query = db.query(model).filter(model.date >= start, model.date <= end)
+        if model is DailyLog:
+            query = query.options(selectinload(DailyLog.tasks))
+        rows = query.all()
+        if model is DailyLog:
+            data = [
+                {"id": log.id, "date": str(log.date), "note": log.teacher_note,
+                 "tasks": [{"content": task.content, "done": task.is_done} for task in log.tasks]}
+                for log in rows
+            ]
+        else:
+            data = [{c.name: str(getattr(row, c.name)) for c in model.__table__.columns} for row in rows]
+        return len(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+    finally:
+        db.close()
+
+
+def streamed(endpoint, start: date, end: date, fmt: str):
+    response = endpoint(start_date=start, end_date=end, fmt=fmt)
+
+    async def consume():
+        size = 0
+        async for chunk in response.body_iterator:
+            size += len(chunk)
+        return size
+
+    return asyncio.run(consume())
+
+
+def measure(fn):
+    started = timer.perf_counter()
+    size = fn()
+    elapsed = (timer.perf_counter() - started) * 1000
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기간별 내보내기 벤치마크")
+    parser.add_argument("--students", type=int, default=300)
+    parser.add_argument("--years", type=int, default=2)
+    args = parser.parse_args()
+
+    upgrade(engine)
+    counts = seed_database(engine, students=args.students, years=args.years)
+    end = date.today()
+    start = end - timedelta(days=365 * args.years)
+    print(f"출석 {counts['attendance']:,} / 일지 {counts['daily_logs']:,} (할 일 {counts['daily_tasks']:,}) / "
+          f"상담 {counts['consultations']:,}건, 전체 기간 내보내기\n")
+
+    cases = [
+        ("출석", Attendance, export_attendance),
+        ("일지+할 일", DailyLog, export_daily_logs),
+        ("상담", Consultation, export_consultations),
+    ]
+    print(f"{'':22}{'ms':>10}{'크기 MB':>10}{'메모리 MB':>11}")
+    for label, model, endpoint in cases:
+        for name, fn in (
+            ("JSON 전체", lambda: legacy_json(model, start, end)),
+            ("CSV", lambda: streamed(endpoint, start, end, "csv")),
+            ("XLSX", lambda: streamed(endpoint, start, end, "xlsx")),
+        ):
+            elapsed, size, peak = measure(fn)
+            print(f"{label + ' ' + name:22}{elapsed:10.0f}{size / 1e6:10.1f}{peak / 1e6:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+라우터 쿼리 실행 계획(EXPLAIN QUERY PLAN) 검사
+
+임시 DB에 샘플 데이터를 넣고 주요 API를 실제로 호출하면서 실행된 SELECT 문을 모두 수집한 뒤,
+각 쿼리의 실행 계획에 인덱스 없이 테이블 전체를 읽는 단계(SCAN <table>)가 있는지 확인합니다.
+학생 목록(students)처럼 원래 전체를 읽어야 하는 테이블은 예외입니다.
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.query_plans
+
+문제가 있는 쿼리가 있으면 종료 코드 1로 끝납니다.
+"""
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+# 앱을 import 하기 전에 임시 DB로 바꿔둠
+_tmp = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'plans.db')}"
+os.environ["REPORT_OUTPUT_DIR"] = os.path.join(_tmp.name, "reports")
+os.environ.setdefault("REPORT_RENDER_BACKEND", "pillow")
+os.environ.setdefault("SMS_PROVIDER", "fake")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, text  # noqa: E402
+
+from backend.database import engine  # noqa: E402
+from backend.main import app  # noqa: E402
+
+# 전체를 읽는 것이 정상인 테이블 (학생 목록 화면 / 출석 현황은 전교생 대상)
+FULL_SCAN_ALLOWED = {"students"}
+
+
+def seed(client: TestClient, today: date):
+    for i in range(20):
+        student = client.post("/api/students/", json={"name": f"학생{i}", "grade": "중1", "parent_phone": f"010-0000-{i:04d}"}).json()
+        client.post(f"/api/students/{student['id']}/schedules/", json={
+            "weekday": today.weekday(), "expected_time": "15:00"
+        })
+        client.post("/api/attendance/", json={
+            "student_id": student["id"], "date": str(today), "status": "present", "check_in": "15:05"
+        })
+        client.post("/api/daily-logs/", json={
+            "student_id": student["id"], "date": str(today), "tasks": [{"content": "숙제"}]
+        })
+        client.post("/api/consultations/", json={
+            "student_id": student["id"], "student_name": f"학생{i}", "student_grade": "중1",
+            "date": str(today + timedelta(days=i)), "time": "17:00"
+        })
+
+
+def exercise(client: TestClient, today: date):
+    """검사할 API 호출 (읽기 + 쓰기 경로)"""
+    client.get("/api/attendance/today")
+    client.get("/api/attendance/absent/today")
+    client.get("/api/attendance/student/1")
+    client.post("/api/attendance/", json={
+        "student_id": 1, "date": str(today), "status": "present", "check_in": "15:10"
+    })
+    client.post("/api/attendance/bulk", json={"records": [
+        {"student_id": 2, "date": str(today), "status": "present", "check_in": "15:00"},
+        {"student_id": 3, "date": str(today), "status": "absent"},
+    ]})
+    client.post("/api/attendance/mark-scheduled", json={"date": str(today), "status": "absent"})
+    client.get("/api/daily-logs/student/1")
+    client.post("/api/daily-logs/", json={"student_id": 1, "date": str(today), "tasks": [{"content": "추가"}]})
+    client.post("/api/daily-logs/images/batch", json={"date": str(today + timedelta(days=365))})
+    client.get("/api/students/1/schedules/")
+    client.get(f"/api/attendance/stats/monthly?month={today:%Y-%m}")
+    client.get("/api/attendance/stats/student/1")
+    client.get("/api/attendance/stats/grades")
+    client.get(f"/api/consultations/?start_date={today}&end_date={today + timedelta(days=7)}")
+    client.get(f"/api/consultations/date/{today}")
+    page = client.get("/api/consultations/page?status=scheduled&limit=5").json()
+    client.get(f"/api/consultations/page?status=scheduled&limit=5&cursor={page['next_cursor']}")
+    client.get("/api/consultations/page?student_id=1&order=desc")
+    client.get(f"/api/consultations/calendar?month={today:%Y-%m}")
+    client.get("/api/consultations/free-slots?limit=5")
+    client.put("/api/consultations/1", json={"time": "18:00"})
+    client.get(f"/api/exports/attendance?start_date={today - timedelta(days=30)}&end_date={today}&grade=중1")
+    client.get(f"/api/exports/daily-logs?start_date={today - timedelta(days=30)}&end_date={today}&format=xlsx")
+    client.get(f"/api/exports/consultations?start_date={today}&end_date={today + timedelta(days=30)}&student_id=1")
+    client.post("/api/students/import", json={"replace_schedules": True, "students": [
+        {"id": 1, "name": "학생0", "grade": "중2", "schedules": [{"weekday": today.weekday(), "expected_time": "16:00"}]},
+        {"name": "새학생", "grade": "중1", "schedules": [{"weekday": 0, "expected_time": "15:00"}]},
+    ]})
+    client.post("/api/report-jobs/", json={"daily_log_id": 1})
+    client.post("/api/sms/absent", json={"student_ids": [1, 2, 3]})
+    client.get(f"/api/sms/messages?send_date={today}")
+
+
+def main():
+    today = date.today()
+    statements = []
+
+    with TestClient(app) as client:
+        login = client.post("/api/auth/login", json={"username": "bigmama", "password": "1234"})
+        client.headers["Authorization"] = f"Bearer {login.json()['token']}"
+        seed(client, today)
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT") and not executemany:
+                statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", capture)
+        exercise(client, today)
+        event.remove(engine, "before_cursor_execute", capture)
+
+    failures = 0
+    seen = set()
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            if statement in seen:
+                continue
+            seen.add(statement)
+
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            details = [row[-1] for row in plan]
+            bad = [
+                d for d in details
+                if d.startswith("SCAN ") and " USING " not in d
+                and d.split()[1] not in FULL_SCAN_ALLOWED
+            ]
+
+            status = "FAIL" if bad else "ok"
+            failures += bool(bad)
+            print(f"[{status}] {' '.join(statement.split())[:110]}")
+            for d in details:
+                print(f"       {d}")
+
+    print(f"\n쿼리 {len(seen)}개 검사, 전체 스캔 {failures}개")
+    engine.dispose()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""
+벤치마크용 가짜 데이터 생성
+
+학생 / 요일별 스케줄 / 출석 / 일지(+할 일) / 상담을 실제 학원처럼 생성합니다.
+- 학생마다 주 2~3일 수업 (월~토), 예정 시간 14:00~19:30
+- 수업이 있는 날마다 출석 기록 (약 90% 출석, 10% 결석) 과 일지 (log_ratio 비율, 할 일 1~4개)
+- 상담은 주당 consultations_per_week 건, 약 70%는 등록된 학생
+- 월간 출석 집계(attendance_monthly)는 마지막에 출석 기록으로 한 번에 생성
+같은 seed 값이면 항상 같은 데이터가 만들어집니다.
+
+다른 벤치마크에서 seed_database(engine, ...) 로 쓰거나, DB 파일을 직접 만들 수 있습니다
+(프로젝트 루트에서):
+    python -m benchmarks.seed /tmp/bench.db --students 2000 --years 5
+"""
+import argparse
+import os
+import random
+import time as timer
+from datetime import date, datetime, time, timedelta
+
+from backend.models import Attendance, Consultation, DailyLog, DailyTask, Student, StudentSchedule
+from backend.utils.attendance_rollup import rebuild_rollups
+
+GRADES = ["초5", "초6", "중1", "중2", "중3", "고1", "고2", "고3"]
+LAST_NAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+FIRST_NAMES = ["민준", "서연", "도윤", "하은", "시우", "지우", "예준", "서윤", "주원", "지민", "하준", "수아", "지호", "채원"]
+TASKS = ["교재 p.{} 풀기", "오답노트 정리", "단원평가 {}회", "숙제 검사", "개념 복습 {}단원", "모의고사 {}회 풀이"]
+CONSULTATION_STATUSES = ["scheduled", "completed", "completed", "completed", "cancelled"]
+
+# 한 번에 INSERT 할 행 수
+CHUNK_SIZE = 5000
+
+PROFILES = {
+    # 빠르게 돌려보는 기본 크기
+    "small": {"students": 200, "years": 1, "log_ratio": 1.0, "consultations_per_week": 20},
+    # 5년 운영한 학생 2,000명 학원
+    "large": {"students": 2000, "years": 5, "log_ratio": 1.0, "consultations_per_week": 40},
+}
+
+
+def _insert(conn, table, rows):
+    for i in range(0, len(rows), CHUNK_SIZE):
+        conn.execute(table.insert(), rows[i:i + CHUNK_SIZE])
+
+
+def seed_database(
+    engine,
+    students: int = 200,
+    years: int = 1,
+    log_ratio: float = 1.0,
+    consultations_per_week: int = 20,
+    seed: int = 42,
+    end: date = None
+):
+    """빈 DB(스키마만 있는 상태)에 데이터 생성, 테이블별 행 수 반환"""
+    rng = random.Random(seed)
+    end = end or date.today()
+    start = end - timedelta(days=365 * years)
+    counts = {}
+
+    with engine.begin() as conn:
+        # 학생 + 스케줄
+        student_rows, schedule_rows = [], []
+        schedule_by_weekday = {weekday: [] for weekday in range(7)}
+        for student_id in range(1, students + 1):
+            student_rows.append({
+                "id": student_id,
+                "name": rng.choice(LAST_NAMES) + rng.choice(FIRST_NAMES),
+                "grade": rng.choice(GRADES),
+                "parent_phone": f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+            })
+            for weekday in sorted(rng.sample(range(6), rng.choice((2, 2, 3)))):
+                expected = time(14 + rng.randint(0, 5), rng.choice((0, 30)))
+                schedule_rows.append({"student_id": student_id, "weekday": weekday, "expected_time": expected})
+                schedule_by_weekday[weekday].append((student_id, expected))
+
+        _insert(conn, Student.__table__, student_rows)
+        _insert(conn, StudentSchedule.__table__, schedule_rows)
+        counts["students"] = len(student_rows)
+        counts["student_schedules"] = len(schedule_rows)
+
+        # 날짜별 출석 / 일지 / 할 일 (메모리를 아끼려고 한 달 단위로 끊어서 INSERT)
+        counts.update(attendance=0, daily_logs=0, daily_tasks=0)
+        log_id = task_id = 0
+        day = start
+        while day <= end:
+            attendance_rows, log_rows, task_rows = [], [], []
+            month_end = min(end, (day.replace(day=1) + timedelta(days=32)).replace(day=1) - timedelta(days=1))
+
+            while day <= month_end:
+                for student_id, expected in schedule_by_weekday[day.weekday()]:
+                    present = rng.random() < 0.9
+                    check_in = None
+                    if present:
+                        minutes = expected.hour * 60 + expected.minute + rng.randint(-10, 20)
+                        check_in = time(minutes // 60, minutes % 60)
+                    attendance_rows.append({
+                        "student_id": student_id,
+                        "date": day,
+                        "status": "present" if present else "absent",
+                        "check_in": check_in,
+                        "check_out": None,
+                    })
+
+                    if rng.random() >= log_ratio:
+                        continue
+                    log_id += 1
+                    log_rows.append({
+                        "id": log_id,
+                        "student_id": student_id,
+                        "date": day,
+                        "teacher_note": "집중해서 잘 했습니다" if rng.random() < 0.5 else None,
+                        "attendance_status": "출석" if present else "결석",
+                        "absence_reason": None if present else "개인 사정",
+                        "follow_up_action": None,
+                        "makeup_class_note": None,
+                        "exam_result": f"{rng.randint(60, 100)}점" if rng.random() < 0.2 else None,
+                    })
+                    for _ in range(rng.randint(1, 4)):
+                        task_id += 1
+                        done = day < end - timedelta(days=7) or rng.random() < 0.5
+                        task_rows.append({
+                            "id": task_id,
+                            "daily_log_id": log_id,
+                            "content": rng.choice(TASKS).format(rng.randint(1, 200)),
+                            "grading_done": done,
+                            "review_done": done,
+                        })
+                day += timedelta(days=1)
+
+            _insert(conn, Attendance.__table__, attendance_rows)
+            _insert(conn, DailyLog.__table__, log_rows)
+            _insert(conn, DailyTask.__table__, task_rows)
+            counts["attendance"] += len(attendance_rows)
+            counts["daily_logs"] += len(log_rows)
+            counts["daily_tasks"] += len(task_rows)
+
+        # 상담 (과거 + 앞으로 4주)
+        consultation_rows = []
+        weeks = (end - start).days // 7 + 4
+        for week in range(weeks):
+            for _ in range(consultations_per_week):
+                day = start + timedelta(days=week * 7 + rng.randint(0, 5))
+                student_id = rng.randint(1, students) if students and rng.random() < 0.7 else None
+                student = student_rows[student_id - 1] if student_id else None
+                consultation_rows.append({
+                    "student_id": student_id,
+                    "student_name": student["name"] if student else rng.choice(LAST_NAMES) + rng.choice(FIRST_NAMES),
+                    "student_grade": student["grade"] if student else rng.choice(GRADES),
+                    "date": day,
+                    "time": time(rng.randint(10, 20), rng.choice((0, 30))),
+                    "parent_name": rng.choice(LAST_NAMES) + "OO 어머님",
+                    "content": "학습 상담",
+                    "notes": None,
+                    "status": "scheduled" if day >= end else rng.choice(CONSULTATION_STATUSES),
+                    "created_at": datetime.combine(day, time(9, 0)) - timedelta(days=7),
+                })
+        _insert(conn, Consultation.__table__, consultation_rows)
+        counts["consultations"] = len(consultation_rows)
+
+        # 출석을 API가 아니라 직접 넣었으므로 월간 집계를 한 번에 만듦
+        counts["attendance_monthly"] = rebuild_rollups(conn)
+
+    # 대량 INSERT 후 통계 갱신 (쿼리 플래너가 인덱스를 제대로 고르도록)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+
+    return counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="벤치마크용 가짜 데이터 생성")
+    parser.add_argument("path", help="만들 SQLite 파일 경로 (이미 있으면 오류)")
+    parser.add_argument("--profile", choices=PROFILES, default="small")
+    parser.add_argument("--students", type=int)
+    parser.add_argument("--years", type=int)
+    parser.add_argument("--log-ratio", type=float, help="수업일 중 일지를 쓰는 비율 (0~1)")
+    parser.add_argument("--consultations-per-week", type=int)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    from backend.database import create_db_engine
+    from backend.migrations import upgrade
+
+    if os.path.exists(args.path):
+        parser.error(f"{args.path} 파일이 이미 있습니다")
+
+    options = dict(PROFILES[args.profile])
+    for key in options:
+        if getattr(args, key) is not None:
+            options[key] = getattr(args, key)
+
+    engine = create_db_engine(f"sqlite:///{args.path}")
+    upgrade(engine)
+    started = timer.perf_counter()
+    counts = seed_database(engine, seed=args.seed, **options)
+    engine.dispose()
+
+    print(f"{args.path} 생성 완료 ({timer.perf_counter() - started:.1f}초)")
+    for table, count in counts.items():
+        print(f"  {table:<18} {count:>10,}")
@@ -0,0 +1,170 @@
+"""
+서버 시작 시간 측정
+
+1) import 시간 분석: python -X importtime 으로 `import backend.main` 을 실행하고
+   패키지별(각 모듈의 자기 자신 import 시간 합) / backend 모듈별로 정리
+2) 콜드 스타트: 임시 DB로 `uvicorn backend.main:app` 프로세스를 새로 띄워서
+   첫 응답이 올 때까지 걸린 시간, 이어서 로그인 후 GET /api/_system/providers 로 백그라운드 warm-up이
+   끝날 때까지의 시간을 측정 (--runs 번 반복, 중앙값 기준)
+
+무거운 라이브러리(Playwright, Jinja, Pillow, 문자 업체 클라이언트)는 backend.utils.providers 로
+지연 로딩되므로 import 목록에 나오면 안 됩니다 (나오면 경고).
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 5 --target-ms 1500   # 중앙값이 목표보다 느리면 종료 코드 1
+"""
+import argparse
+import json
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time as timer
+import urllib.error
+import urllib.request
+from collections import defaultdict
+
+# 서버가 첫 요청에 응답할 때까지의 목표 시간 (ms, 콜드 스타트 중앙값)
+COLD_START_TARGET_MS = 2000
+# 시작할 때 import 되면 안 되는 모듈 (처음 쓸 때 로딩)
+LAZY_MODULES = ("playwright", "jinja2", "PIL", "aiohttp", "twilio")
+
+_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_profile():
+    """[(모듈, 자기 시간 us, 누적 시간 us, 깊이)]"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import backend.main"],
+        capture_output=True, text=True, env=_server_env(tempfile.mkdtemp()), check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+def print_import_profile(rows, top: int):
+    total_us = sum(row[1] for row in rows)
+    by_package = defaultdict(int)
+    for name, self_us, _, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+
+    print(f"import backend.main: {total_us / 1000:.0f}ms (모듈 {len(rows)}개)\n")
+    print(f"{'패키지':<28}{'ms':>8}{'비율':>8}")
+    for package, us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        print(f"{package:<28}{us / 1000:>8.1f}{us / total_us:>8.0%}")
+
+    print(f"\n{'backend 모듈 (누적)':<40}{'ms':>8}")
+    # backend.main 과 backend.main 이 직접 import 하는 모듈
+    backend_rows = [row for row in rows if row[0].startswith("backend") and row[3] <= 1]
+    for name, _, cumulative_us, _ in sorted(backend_rows, key=lambda row: -row[2])[:top]:
+        print(f"{name:<40}{cumulative_us / 1000:>8.1f}")
+
+    loaded_lazy = sorted({row[0].split(".")[0] for row in rows} & set(LAZY_MODULES))
+    if loaded_lazy:
+        print(f"\n[경고] 시작할 때 import 됨: {', '.join(loaded_lazy)}")
+
+
+def _server_env(tmp_dir: str):
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'bigmama.db')}"
+    env["REPORT_OUTPUT_DIR"] = os.path.join(tmp_dir, "reports")
+    env.setdefault("LOG_LEVEL", "WARNING")
+    return env
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _request_json(url: str, data=None, headers=None):
+    body = json.dumps(data).encode("utf-8") if data is not None else None
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json", **(headers or {})})
+    with urllib.request.urlopen(request, timeout=1) as response:
+        return json.loads(response.read())
+
+
+def _wait_ready(base_url: str, started: float, timeout: float):
+    """서버가 첫 응답을 할 때까지 대기, 걸린 시간(ms) 반환"""
+    while timer.perf_counter() - started < timeout:
+        try:
+            _request_json(f"{base_url}/api/auth/me")
+        except urllib.error.HTTPError:
+            # 401이어도 응답을 했으면 요청을 받을 수 있는 상태
+            return (timer.perf_counter() - started) * 1000
+        except OSError:
+            timer.sleep(0.01)
+    raise RuntimeError("서버가 응답하지 않습니다")
+
+
+def cold_start(timeout: float = 30):
+    """(첫 응답까지 ms, warm-up 완료까지 ms, provider 상태)"""
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        started = timer.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "backend.main:app", "--port", str(port), "--log-level", "warning"],
+            env=_server_env(tmp_dir), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            ready_ms = _wait_ready(base_url, started, timeout)
+
+            login = _request_json(f"{base_url}/api/auth/login", {"username": "bigmama", "password": "1234"})
+            headers = {"Authorization": f"Bearer {login['token']}"}
+            warm_ms = None
+            state = {}
+            while timer.perf_counter() - started < timeout:
+                state = _request_json(f"{base_url}/api/_system/providers", headers=headers)
+                if state["warm_up_ms"] is not None:
+                    warm_ms = (timer.perf_counter() - started) * 1000
+                    break
+                timer.sleep(0.02)
+            return ready_ms, warm_ms, state
+        finally:
+            process.terminate()
+            process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 시작 시간 측정")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=12, help="import 분석에서 보여줄 항목 수")
+    parser.add_argument("--target-ms", type=float, default=COLD_START_TARGET_MS)
+    args = parser.parse_args()
+
+    print_import_profile(import_profile(), args.top)
+
+    print(f"\n콜드 스타트 ({args.runs}회)")
+    ready, warm = [], []
+    for run in range(args.runs):
+        ready_ms, warm_ms, state = cold_start()
+        ready.append(ready_ms)
+        if warm_ms is not None:
+            warm.append(warm_ms)
+        print(f"  {run + 1}: 첫 응답 {ready_ms:.0f}ms, warm-up 완료 {warm_ms:.0f}ms" if warm_ms else
+              f"  {run + 1}: 첫 응답 {ready_ms:.0f}ms, warm-up 미완료")
+
+    for name, p in state["providers"].items():
+        status = f"{p['load_ms']}ms" if p["loaded"] else (p["error"] or "처음 쓸 때 로딩")
+        print(f"    {name:<12} {status}")
+
+    median = statistics.median(ready)
+    print(f"\n첫 응답 중앙값 {median:.0f}ms (목표 {args.target_ms:.0f}ms)")
+    if median > args.target_ms:
+        print("목표 시간 초과")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
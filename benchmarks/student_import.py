@@ -0,0 +1,113 @@
+"""
+학생 일괄 등록 벤치마크
+
+학생 N명(주 2~3일 스케줄)을 등록할 때
+- 기존 방식: POST /api/students/ 한 번 + 요일마다 POST /api/students/{id}/schedules/ (요청마다 커밋)
+- 일괄 등록: POST /api/students/import/csv 한 번
+의 시간과 실행된 SQL 문 수를 비교하고, 같은 파일을 다시 올렸을 때(전부 수정)도 잽니다.
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.student_import
+    python -m benchmarks.student_import --students 3000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time as timer
+
+# 앱을 import 하기 전에 임시 DB로 바꿔둠
+_tmp = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'import.db')}"
+os.environ["REPORT_OUTPUT_DIR"] = os.path.join(_tmp.name, "reports")
+os.environ.setdefault("REPORT_RENDER_BACKEND", "pillow")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from backend.database import engine  # noqa: E402
+from backend.main import app  # noqa: E402
+from benchmarks.seed import FIRST_NAMES, GRADES, LAST_NAMES  # noqa: E402
+
+WEEKDAYS = "월화수목금토일"
+
+
+def make_students(count: int, rng: random.Random, prefix: str):
+    students = []
+    for i in range(count):
+        schedule = {
+            weekday: f"{rng.choice(range(14, 20))}:{rng.choice(['00', '30'])}"
+            for weekday in rng.sample(range(6), rng.choice([2, 3]))
+        }
+        students.append({
+            "name": f"{prefix}{rng.choice(LAST_NAMES)}{rng.choice(FIRST_NAMES)}{i}",
+            "grade": rng.choice(GRADES),
+            "parent_phone": f"010-{rng.randint(1000, 9999)}-{i:04d}",
+            "schedule": schedule,
+        })
+    return students
+
+
+def to_csv(students):
+    lines = ["이름,학년,학부모 연락처," + ",".join(WEEKDAYS)]
+    for s in students:
+        times = [s["schedule"].get(weekday, "") for weekday in range(7)]
+        lines.append(",".join([s["name"], s["grade"], s["parent_phone"], *times]))
+    return "\n".join(lines) + "\n"
+
+
+def one_by_one(client: TestClient, students):
+    for s in students:
+        student = client.post("/api/students/", json={
+            "name": s["name"], "grade": s["grade"], "parent_phone": s["parent_phone"]
+        }).json()
+        for weekday, expected in s["schedule"].items():
+            client.post(f"/api/students/{student['id']}/schedules/", json={"weekday": weekday, "expected_time": expected})
+
+
+def bulk(client: TestClient, students):
+    response = client.post("/api/students/import/csv", content=to_csv(students).encode("utf-8"),
+                           headers={"Content-Type": "text/csv"})
+    result = response.json()
+    assert result["failed"] == 0, result["items"][:3]
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="학생 일괄 등록 벤치마크")
+    parser.add_argument("--students", type=int, default=1000)
+    args = parser.parse_args()
+
+    statements = {"count": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements["count"] += 1
+
+    rng = random.Random(7)
+    with TestClient(app) as client:
+        token = client.post("/api/auth/login", json={"username": "bigmama", "password": "1234"}).json()["token"]
+        client.headers["Authorization"] = f"Bearer {token}"
+
+        def run(label, fn, students):
+            statements["count"] = 0
+            started = timer.perf_counter()
+            result = fn(client, students)
+            elapsed = timer.perf_counter() - started
+            print(f"{label:28}{elapsed:10.2f}{statements['count']:10,}")
+            return result
+
+        print(f"학생 {args.students:,}명 (주 2~3일 스케줄)\n")
+        print(f"{'':28}{'초':>10}{'SQL 문':>10}")
+        run("기존 방식 (학생/요일마다 요청)", one_by_one, make_students(args.students, rng, "기존"))
+        students = make_students(args.students, rng, "일괄")
+        created = run("일괄 등록 (새 학생)", bulk, students)
+        for s in students:
+            s["grade"] = rng.choice(GRADES)
+        updated = run("일괄 등록 (같은 파일 다시, 수정)", bulk, students)
+        print(f"\n새로 등록 {created['created']:,}명, 다시 올렸을 때 수정 {updated['updated']:,}명")
+
+
+if __name__ == "__main__":
+    main()